@@ -0,0 +1,173 @@
+import argparse
+import gc
+import json
+import os
+import platform
+import random
+import statistics
+import sys
+import tempfile
+import time
+from typing import Callable
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "src"))
+
+from check_factory import CheckFactory
+from compiled_analysis_config import CompiledAnalysisConfig
+from compiled_config_cache import CompiledConfigCache
+from config_parser import ConfigParser
+from diff_parser import DiffParser
+from file_analyzer import FileAnalyzer
+from models.changed_file import ChangedFile
+from models.line_ranges import LineRanges
+from models.loaded_file import LoadedFile
+from path_matcher import PathMatcher
+from version import VERSION
+
+from synthetic_inputs import CONFIG_PATH, create_diff, create_lines, create_paths
+
+# the settings of every built-in check, like in the shipped analysis config
+CHECK_SETTINGS: dict[str, object] = {
+    "tabs": None,
+    "todo": None,
+    "replacement_characters": None,
+    "line_length": {"max_line_length": 120},
+    "trailing_whitespace": {"max_trailing_whitespaces": 20},
+    "region_newline": None,
+    "regex": {"patterns": [
+        {"name": "debug_print", "pattern": r"\bprint\(", "message": "Debug print found."},
+        {"name": "fixme", "pattern": "fixme", "message": "FIXME found.", "ignore_case": True},
+    ]},
+}
+
+
+def create_loaded_file(lines: list[str], added_line_ranges: LineRanges) -> LoadedFile:
+    changed_lines = FileAnalyzer.filter_changed_lines(lines, added_line_ranges)
+    return LoadedFile(ChangedFile("file.py", None, False), "utf-8", lines, changed_lines)
+
+
+def create_benchmarks(arguments: argparse.Namespace, cache_directory: str) -> dict[str, Callable[[], object]]:
+    random_generator = random.Random(arguments.seed)
+    lines = create_lines(arguments.lines, random_generator)
+    diff = create_diff(lines, random_generator)
+    added_line_ranges = DiffParser.parse_added_line_ranges(diff)
+    loaded_file = create_loaded_file(lines, added_line_ranges)
+    paths = create_paths(arguments.paths, random_generator)
+    with open(CONFIG_PATH, "rb") as file:
+        config_content = file.read()
+    config_parser = ConfigParser()
+    analysis_config = config_parser.load_analysis_config_from_text(config_content.decode("utf-8"))
+    compiled_config = CompiledAnalysisConfig(analysis_config)
+    config_cache = CompiledConfigCache(cache_directory)
+    config_cache.store(config_content, compiled_config)
+
+    def match_paths():
+        # a new path matcher starts without the memoized directories
+        path_matcher = PathMatcher(analysis_config)
+        return [path_matcher.match(path) for path in paths]
+
+    def load_cached_config():
+        # a new process starts without the configs which were loaded before
+        CompiledConfigCache.clear()
+        return config_cache.load(config_content)
+
+    benchmarks = {
+        "diff_parsing": lambda: DiffParser.parse_added_line_ranges(diff),
+        "changed_line_filtering": lambda: FileAnalyzer.filter_changed_lines(lines, added_line_ranges),
+        "path_matching": match_paths,
+        "config_loading": lambda: CompiledAnalysisConfig(
+            config_parser.load_analysis_config_from_text(config_content.decode("utf-8"))),
+        "config_loading_cached": load_cached_config,
+    }
+    check_factory = CheckFactory(analysis_config)
+    for check_name, check_settings in CHECK_SETTINGS.items():
+        check = check_factory.generate_checks({check_name: check_settings})[0]
+        benchmarks[f"check_{check_name}"] = lambda check=check: check.execute_on_changed_file(loaded_file)
+    return benchmarks
+
+
+def measure(benchmarks: dict[str, Callable[[], object]], repetitions: int) -> dict[str, dict[str, float | int]]:
+    # Every round runs each benchmark once, so that a slow phase of the machine affects all of them alike. The first 
+    # call fills caches and is not measured. Like in timeit, the garbage collector is disabled, so that its runs do not 
+    # depend on the objects left behind by the other benchmarks.
+    durations: dict[str, list[float]] = {name: [] for name in benchmarks}
+    for function in benchmarks.values():
+        function()
+    gc.disable()
+    try:
+        for _ in range(repetitions):
+            for name, function in benchmarks.items():
+                start = time.perf_counter()
+                function()
+                durations[name].append((time.perf_counter() - start) * 1000)
+    finally:
+        gc.enable()
+    return {
+        name: {
+            "median_milliseconds": statistics.median(benchmark_durations),
+            "min_milliseconds": min(benchmark_durations),
+            "repetitions": repetitions,
+        }
+        for name, benchmark_durations in durations.items()
+    }
+
+
+def compare_with_baseline(results: dict[str, dict], baseline_path: str, tolerance: float) -> bool:
+    # Returns whether the median of a benchmark is slower than the baseline by more than the tolerance.
+    with open(baseline_path, "r", encoding="utf-8") as file:
+        baseline_results = json.load(file)["benchmarks"]
+    print(f"\n{'benchmark':<32}{'baseline ms':>12}{'median ms':>12}{'ratio':>9}")
+    has_regression = False
+    for name, result in results.items():
+        if name not in baseline_results:
+            print(f"{name:<32}{'-':>12}{result['median_milliseconds']:>12.3f}{'new':>9}")
+            continue
+        baseline_median = baseline_results[name]["median_milliseconds"]
+        ratio = result["median_milliseconds"] / baseline_median
+        is_regression = ratio > 1 + tolerance
+        print(f"{name:<32}{baseline_median:>12.3f}{result['median_milliseconds']:>12.3f}{ratio:>9.2f}"
+              f"{'  SLOWER' if is_regression else ''}")
+        has_regression = has_regression or is_regression
+    return has_regression
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Measures the hot paths of the analysis on seeded synthetic inputs, "
+                                                 "writes the results as json and compares them with a baseline.")
+    parser.add_argument("--lines", type=int, default=20000, help="Number of lines of the synthetic file.")
+    parser.add_argument("--paths", type=int, default=5000, help="Number of synthetic paths to match.")
+    parser.add_argument("--seed", type=int, default=42, help="Seed for generating the synthetic inputs.")
+    parser.add_argument("--repetitions", type=int, default=20, help="Number of measured runs per benchmark.")
+    parser.add_argument("--filter", type=str, default="", help="Only run the benchmarks whose name contains this.")
+    parser.add_argument("--output", type=str, default=None, help="Write the results as json to this file.")
+    parser.add_argument("--baseline", type=str, default=None,
+                        help="Compare the results with this json file written by --output before.")
+    parser.add_argument("--tolerance", type=float, default=0.25,
+                        help="Fail if a median is slower than the baseline by more than this fraction.")
+    arguments = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as cache_directory:
+        benchmarks = {name: function for name, function in create_benchmarks(arguments, cache_directory).items()
+                      if arguments.filter in name}
+        results = measure(benchmarks, arguments.repetitions)
+    print(f"{'benchmark':<32}{'median ms':>12}{'min ms':>12}")
+    for name, result in results.items():
+        print(f"{name:<32}{result['median_milliseconds']:>12.3f}{result['min_milliseconds']:>12.3f}")
+    if arguments.output is not None:
+        with open(arguments.output, "w", encoding="utf-8") as file:
+            json.dump({
+                "version": VERSION,
+                "python": platform.python_version(),
+                "machine": platform.machine(),
+                "seed": arguments.seed,
+                "lines": arguments.lines,
+                "paths": arguments.paths,
+                "benchmarks": results,
+            }, file, indent=2)
+    if arguments.baseline is not None and compare_with_baseline(results, arguments.baseline, arguments.tolerance):
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
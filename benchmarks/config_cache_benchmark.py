@@ -0,0 +1,55 @@
+import argparse
+import os
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "src"))
+
+from compiled_analysis_config import CompiledAnalysisConfig
+from compiled_config_cache import CompiledConfigCache
+from config_parser import ConfigParser
+
+from synthetic_inputs import CONFIG_PATH
+
+
+def compile_config(config_content: bytes) -> CompiledAnalysisConfig:
+    return CompiledAnalysisConfig(ConfigParser().load_analysis_config_from_text(config_content.decode("utf-8")))
+
+
+def load_cached_config(cache_directory: str, config_content: bytes) -> CompiledAnalysisConfig:
+    # a new process starts without the configs which were loaded before
+    CompiledConfigCache.clear()
+    return CompiledConfigCache(cache_directory).load(config_content)
+
+
+def measure(function, repetitions: int) -> float:
+    start = time.perf_counter()
+    for _ in range(repetitions):
+        function()
+    return (time.perf_counter() - start) / repetitions
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Compares compiling the analysis config with loading it from the "
+                                                 "compiled config cache.")
+    parser.add_argument("--config", type=str, default=CONFIG_PATH,
+                        help="The analysis config to benchmark.")
+    parser.add_argument("--repetitions", type=int, default=50, help="Number of loads to average.")
+    arguments = parser.parse_args()
+
+    with open(arguments.config, "rb") as file:
+        config_content = file.read()
+    with tempfile.TemporaryDirectory() as cache_directory:
+        CompiledConfigCache(cache_directory).store(config_content, compile_config(config_content))
+        if load_cached_config(cache_directory, config_content) is None:
+            raise AssertionError("The compiled config could not be loaded from the cache.")
+        compile_duration = measure(lambda: compile_config(config_content), arguments.repetitions)
+        cache_duration = measure(lambda: load_cached_config(cache_directory, config_content), arguments.repetitions)
+    print(f"{'mode':<12}{'milliseconds':>14}{'speedup':>10}")
+    print(f"{'compile':<12}{compile_duration * 1000:>14.2f}{1.0:>10.2f}")
+    print(f"{'cache':<12}{cache_duration * 1000:>14.2f}{compile_duration / cache_duration:>10.2f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,71 @@
+import argparse
+import os
+import subprocess
+import sys
+import tempfile
+
+SOURCE_DIRECTORY = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "src")
+
+# Every scenario starts the application like a user would and lists the modules it must never import. The headless
+# path and the daemon client run on CI machines and in git hooks, where Qt is usually not installed.
+SCENARIOS = {
+    "headless": (["main.py", "--headless"], ["PyQt5", "gui"]),
+    "help": (["main.py", "--help"], ["PyQt5", "gui", "git"]),
+    "client": (["analysis_client.py", "--socket", os.path.join(tempfile.gettempdir(), "no-daemon.sock")],
+               ["PyQt5", "gui", "git"]),
+}
+
+
+def measure_imports(arguments: list[str]) -> list[tuple[str, int, int]]:
+    # Returns the name, the nesting level and the cumulative import time in microseconds of every imported module.
+    process = subprocess.run([sys.executable, "-X", "importtime"] + arguments, cwd=SOURCE_DIRECTORY,
+                             stdout=subprocess.DEVNULL, stderr=subprocess.PIPE, text=True)
+    imports = []
+    for line in process.stderr.splitlines():
+        if not line.startswith("import time:"):
+            continue
+        _, cumulative_time, name = line[len("import time:"):].split("|")
+        if not cumulative_time.strip().isdigit():
+            # the header of the table
+            continue
+        level = (len(name) - len(name.lstrip()) - 1) // 2
+        imports.append((name.strip(), level, int(cumulative_time)))
+    return imports
+
+
+def find_forbidden_imports(imports: list[tuple[str, int, int]], forbidden_modules: list[str]) -> list[str]:
+    return [module for module in forbidden_modules
+            if any(name == module or name.startswith(module + ".") for name, _, _ in imports)]
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Measures the import time of the headless startup paths and fails if "
+                                                 "they import Qt, the GUI or GitPython where they must not.")
+    parser.add_argument("--repetitions", type=int, default=5, help="Number of runs per scenario, the fastest counts.")
+    parser.add_argument("--top", type=int, default=8, help="Number of the slowest top level imports to show.")
+    parser.add_argument("--max-milliseconds", type=float, default=None,
+                        help="Fail if the imports of the headless scenario take longer than this.")
+    arguments = parser.parse_args()
+
+    failed = False
+    for scenario_name, (scenario_arguments, forbidden_modules) in SCENARIOS.items():
+        runs = [measure_imports(scenario_arguments) for _ in range(arguments.repetitions)]
+        fastest_run = min(runs, key=lambda imports: sum(time for _, level, time in imports if level == 0))
+        top_level_imports = [(name, time) for name, level, time in fastest_run if level == 0]
+        total_milliseconds = sum(time for _, time in top_level_imports) / 1000
+        print(f"{scenario_name}: {total_milliseconds:.1f} ms for {len(fastest_run)} modules")
+        for name, time in sorted(top_level_imports, key=lambda entry: entry[1], reverse=True)[:arguments.top]:
+            print(f"  {time / 1000:8.1f} ms  {name}")
+        forbidden_imports = find_forbidden_imports(fastest_run, forbidden_modules)
+        if len(forbidden_imports) > 0:
+            print(f"  FAILED: imports {', '.join(forbidden_imports)}")
+            failed = True
+        if scenario_name == "headless" and arguments.max_milliseconds is not None \
+                and total_milliseconds > arguments.max_milliseconds:
+            print(f"  FAILED: exceeds the budget of {arguments.max_milliseconds:.1f} ms")
+            failed = True
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
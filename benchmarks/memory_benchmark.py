@@ -0,0 +1,66 @@
+import argparse
+import os
+import sys
+import tempfile
+import tracemalloc
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "src"))
+
+from analysis import Analysis
+from config_parser import ConfigParser
+from git_assistant import GitAssistant
+from logger import Logger
+from models.analysis_arguments import AnalysisArguments
+
+from synthetic_inputs import CONFIG_PATH, create_repository
+
+
+def analyze_full_tree(repository_directory: str, read_only: bool, streaming: bool) -> tuple[int, int]:
+    # Returns the number of analyzed files and the peak of the traced memory in bytes.
+    with tempfile.TemporaryDirectory() as cache_directory:
+        analysis_arguments = AnalysisArguments(repository_directory, "master", "master", False, read_only=read_only,
+                                               fetch=False, config_path=CONFIG_PATH, cache_directory=cache_directory)
+        analysis = Analysis(Logger(False), ConfigParser(), GitAssistant(repository_directory))
+        tracemalloc.start()
+        if streaming:
+            # every result is dropped right away, like the jsonl output does
+            file_count = sum(1 for _ in analysis.execute_streaming(analysis_arguments))
+        else:
+            file_count = len(analysis.execute(analysis_arguments))
+        _, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+    return file_count, peak
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Measures the peak memory of a full tree analysis with tracemalloc "
+                                                 "and fails if the streaming analysis exceeds the ceiling.")
+    parser.add_argument("--files", type=int, default=4000, help="Number of files of the large repository.")
+    parser.add_argument("--lines", type=int, default=200, help="Number of lines per file.")
+    parser.add_argument("--seed", type=int, default=42, help="Seed for generating the file contents.")
+    parser.add_argument("--read-only", action="store_true", help="Read the files from the git object database.")
+    parser.add_argument("--max-peak-mb", type=float, default=4.0,
+                        help="Fail if the streaming analysis of the large repository exceeds this peak.")
+    arguments = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as small_repository, tempfile.TemporaryDirectory() as large_repository:
+        create_repository(small_repository, max(arguments.files // 10, 1), arguments.lines, arguments.seed)
+        create_repository(large_repository, arguments.files, arguments.lines, arguments.seed)
+        # the first analysis pays for imports and caches, which would distort the peak
+        analyze_full_tree(small_repository, arguments.read_only, True)
+
+        failed = False
+        for streaming in (True, False):
+            api_name = "execute_streaming" if streaming else "execute"
+            small_file_count, small_peak = analyze_full_tree(small_repository, arguments.read_only, streaming)
+            large_file_count, large_peak = analyze_full_tree(large_repository, arguments.read_only, streaming)
+            print(f"{api_name}: peak {small_peak / 2 ** 20:.2f} MiB for {small_file_count} files, "
+                  f"{large_peak / 2 ** 20:.2f} MiB for {large_file_count} files")
+            if streaming and large_peak > arguments.max_peak_mb * 2 ** 20:
+                print(f"  FAILED: exceeds the ceiling of {arguments.max_peak_mb:.1f} MiB")
+                failed = True
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,65 @@
+import argparse
+import os
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "src"))
+
+from compiled_analysis_config import CompiledAnalysisConfig
+from config_parser import ConfigParser
+from file_analyzer import FileAnalyzer
+from models.changed_file import ChangedFile
+from parallel_file_analyzer import ParallelFileAnalyzer
+
+from synthetic_inputs import CONFIG_PATH, create_files
+
+
+def run_sequentially(compiled_config, directory: str, changed_files: list[ChangedFile]) -> list:
+    file_analyzer = FileAnalyzer(compiled_config, directory)
+    return [file_analyzer.try_analyze_changed_file(changed_file) for changed_file in changed_files]
+
+
+def run_in_parallel(compiled_config, directory: str, changed_files: list[ChangedFile], jobs: int) -> list:
+    parallel_file_analyzer = ParallelFileAnalyzer(compiled_config, directory, jobs)
+    return list(parallel_file_analyzer.analyze_changed_files(changed_files))
+
+
+def summarize(results: list) -> list[tuple]:
+    return [(result.file_path, [(issue.line_number, issue.issue_description) for issue in result.issues])
+            for result in results]
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Compares the parallel file analysis with the sequential one.")
+    parser.add_argument("--files", type=int, default=2000, help="Number of synthetic files to analyze.")
+    parser.add_argument("--lines", type=int, default=400, help="Number of lines per synthetic file.")
+    parser.add_argument("--seed", type=int, default=42, help="Seed for generating the synthetic files.")
+    parser.add_argument("--jobs", type=int, nargs="+", default=[2, 4, os.cpu_count() or 1],
+                        help="The numbers of worker processes to benchmark.")
+    arguments = parser.parse_args()
+
+    analysis_config = ConfigParser().load_analysis_config(CONFIG_PATH)
+    compiled_config = CompiledAnalysisConfig(analysis_config)
+    with tempfile.TemporaryDirectory() as directory:
+        changed_files = [ChangedFile(file_path, None, True) 
+                         for file_path in create_files(directory, arguments.files, arguments.lines, arguments.seed)]
+
+        start = time.perf_counter()
+        sequential_results = run_sequentially(compiled_config, directory, changed_files)
+        sequential_duration = time.perf_counter() - start
+        print(f"{'mode':<12}{'jobs':>6}{'seconds':>10}{'speedup':>10}")
+        print(f"{'sequential':<12}{1:>6}{sequential_duration:>10.2f}{1.0:>10.2f}")
+
+        for jobs in sorted(set(arguments.jobs)):
+            start = time.perf_counter()
+            parallel_results = run_in_parallel(compiled_config, directory, changed_files, jobs)
+            parallel_duration = time.perf_counter() - start
+            if summarize(parallel_results) != summarize(sequential_results):
+                raise AssertionError(f"The parallel analysis with {jobs} jobs returned different results.")
+            speedup = sequential_duration / parallel_duration
+            print(f"{'parallel':<12}{jobs:>6}{parallel_duration:>10.2f}{speedup:>10.2f}")
+
+
+if __name__ == "__main__":
+    main()
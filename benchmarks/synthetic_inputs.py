@@ -0,0 +1,75 @@
+import os
+import random
+import subprocess
+
+REPOSITORY_ROOT = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..")
+CONFIG_PATH = os.path.join(REPOSITORY_ROOT, "analysis_config.json5")
+# every line is one of these templates, so that each built-in check finds some issues
+LINE_TEMPLATES = [
+    "    value = compute(value, {index})\n",
+    "\tindented_with_tab = {index}\n",
+    "    # todo: clean this up {index}\n",
+    "    text = '{long_text}'\n",
+    "    trailing = {index}                         \n",
+    "    print(value)\n",
+    "#region generated\n",
+    "\n",
+]
+DIRECTORY_NAMES = ["src", "lib", "app", "tests", "docs", "node_modules", "build", "assets", "core", "util"]
+# the paths to match include files which the shipped config excludes, the generated files are all analyzed
+PATH_EXTENSIONS = [".py", ".java", ".cs", ".sql", ".js", ".txt", ".md", ".png", ".docx", ".json5", ".gitignore"]
+FILE_EXTENSIONS = [".py", ".java", ".js", ".txt", ".md"]
+
+
+def create_lines(line_count: int, random_generator: random.Random) -> list[str]:
+    return [random_generator.choice(LINE_TEMPLATES).format(index=index, 
+                                                           long_text="x" * random_generator.randint(10, 200))
+            for index in range(line_count)]
+
+
+def create_diff(lines: list[str], random_generator: random.Random) -> bytes:
+    # A unified diff of the lines with one hunk every 40 lines, in which some lines are added, removed or kept.
+    diff_lines = ["diff --git a/file.py b/file.py\n", "--- a/file.py\n", "+++ b/file.py\n"]
+    for hunk_start in range(1, len(lines) + 1, 40):
+        hunk_lines = lines[hunk_start - 1:hunk_start + 39]
+        diff_lines.append(f"@@ -{hunk_start},{len(hunk_lines)} +{hunk_start},{len(hunk_lines)} @@\n")
+        for line in hunk_lines:
+            kind = random_generator.random()
+            if kind < 0.3:
+                diff_lines.append("+" + line)
+            elif kind < 0.4:
+                diff_lines += ["-" + line, "+" + line]
+            else:
+                diff_lines.append(" " + line)
+    return "".join(diff_lines).encode("utf-8")
+
+
+def create_paths(path_count: int, random_generator: random.Random) -> list[str]:
+    paths = []
+    for index in range(path_count):
+        directories = random_generator.choices(DIRECTORY_NAMES, k=random_generator.randint(0, 4))
+        file_name = f"file_{index}{random_generator.choice(PATH_EXTENSIONS)}"
+        paths.append("/".join(directories + [file_name]))
+    return paths
+
+
+def create_files(directory: str, file_count: int, lines_per_file: int, seed: int) -> list[str]:
+    # Returns the paths of the written files. A few files share a directory, like in a real source tree.
+    random_generator = random.Random(seed)
+    file_paths = []
+    for file_index in range(file_count):
+        file_name = f"file_{file_index}{random_generator.choice(FILE_EXTENSIONS)}"
+        file_path = os.path.join(directory, f"module_{file_index // 50}", file_name)
+        os.makedirs(os.path.dirname(file_path), exist_ok=True)
+        with open(file_path, "w", encoding="utf-8") as file:
+            file.writelines(create_lines(lines_per_file, random_generator))
+        file_paths.append(file_path)
+    return file_paths
+
+
+def create_repository(directory: str, file_count: int, lines_per_file: int, seed: int):
+    create_files(directory, file_count, lines_per_file, seed)
+    git = ["git", "-C", directory, "-c", "user.name=benchmark", "-c", "user.email=benchmark@localhost"]
+    subprocess.run(git + ["init", "-q", "-b", "master"], check=True)
+    subprocess.run(git + ["add", "-A"], check=True)
+    subprocess.run(git + ["commit", "-q", "-m", "files"], check=True)
@@ -1,8 +1,10 @@
-import glob
-import os.path
+import os
+from typing import Callable, Iterable, Iterator
 
-from analysis_config import AnalysisConfig
-from analysis_exception import AnalysisException
+from blob_reader import BlobReader
+from compiled_analysis_config import CompiledAnalysisConfig
+from compiled_config_cache import CompiledConfigCache
+from config_locator import ConfigLocator
 from config_parser import ConfigParser
 from file_analyzer import FileAnalyzer
 from git_assistant import GitAssistant
@@ -10,22 +12,66 @@ from logger import Logger
 from models.analysis_arguments import AnalysisArguments
 from models.changed_file import ChangedFile
 from models.file_analysis_result import FileAnalysisResult
-from models.line_analysis_issue import LineAnalysisIssue
+from null_tracer import NullTracer
+from parallel_file_analyzer import ParallelFileAnalyzer
+from path_matcher import PathMatcher
+from result_cache import ResultCache
+from tracer import Tracer
+from util.cache_directory import CacheDirectory
 
 
 class Analysis:
-    def __init__(self, logger: Logger, config_parser: ConfigParser, git_assistant: GitAssistant):
+    def __init__(self, 
+                 logger: Logger, 
+                 config_parser: ConfigParser, 
+                 git_assistant: GitAssistant, 
+                 tracer: Tracer | None = None):
         self.__logger = logger
         self.__config_parser = config_parser
         self.__git_assistant = git_assistant
-        self.__analysis_config_name = "analysis_config.json5"
+        self.__config_locator = ConfigLocator(git_assistant)
+        self.__tracer: Tracer = tracer if tracer is not None else NullTracer()
         
-    def execute(self, analysis_arguments: AnalysisArguments) -> list[FileAnalysisResult]:
+    def execute(self, 
+                analysis_arguments: AnalysisArguments, 
+                changed_file_filter: Callable[[ChangedFile], bool] | None = None) -> list[FileAnalysisResult]:
+        return list(self.execute_streaming(analysis_arguments, changed_file_filter))
+    
+    def execute_streaming(self, 
+                          analysis_arguments: AnalysisArguments, 
+                          changed_file_filter: Callable[[ChangedFile], bool] | None = None) \
+            -> Iterator[FileAnalysisResult]:
+        # Yields the result of every file as soon as it is analyzed. The results of the parallel analysis keep the 
+        # order of the changed files.
         self.__logger.info("The static code analysis has been started.")
         self.__verify_arguments(analysis_arguments)
-        analysis_config = self.__get_analysis_config(analysis_arguments)
-        changed_files = self.__load_changed_files(analysis_arguments)
-        return self.__analyze_all_files(analysis_config, changed_files)
+        with self.__tracer.span("load analysis config", "stage"):
+            compiled_config = self.__get_compiled_config(analysis_arguments)
+        with self.__tracer.span("load changed files", "stage"):
+            changed_files = self.__load_changed_files(analysis_arguments, compiled_config)
+        if self.__tracer.enabled:
+            changed_files = self.__trace_changed_files(changed_files)
+        if changed_file_filter is not None:
+            # only the changed files accepted by the filter are analyzed
+            changed_files = filter(changed_file_filter, changed_files)
+        yield from self.__analyze_all_files(compiled_config, changed_files, 
+                                            self.__get_number_of_jobs(analysis_arguments), 
+                                            self.__get_cache_directory(analysis_arguments))
+    
+    def __trace_changed_files(self, changed_files: Iterable[ChangedFile]) -> Iterator[ChangedFile]:
+        # The changed files are read while the files before them are analyzed, e.g. from the output of git diff. The 
+        # time it takes to hand over every file is traced on its own.
+        changed_file_iterator = iter(changed_files)
+        while True:
+            with self.__tracer.span("read changed file", "git") as span:
+                changed_file = next(changed_file_iterator, None)
+                if changed_file is not None:
+                    span.set_attribute("path", 
+                                       changed_file.get_relative_path(self.__git_assistant.get_repository_directory()))
+                    span.set_attribute("diff_bytes", len(changed_file.diff) if changed_file.diff is not None else 0)
+            if changed_file is None:
+                return
+            yield changed_file
     
     def __verify_arguments(self, analysis_arguments: AnalysisArguments):
         if analysis_arguments.repository_directory is None or len(analysis_arguments.repository_directory) == 0:
@@ -34,62 +80,147 @@ class Analysis:
             raise ValueError("The source branch is cannot be empty.")
         if analysis_arguments.destination_branch is None or len(analysis_arguments.destination_branch) == 0:
             raise ValueError("The destination branch is cannot be empty.")
+        if analysis_arguments.jobs < 0:
+            raise ValueError("The number of jobs cannot be negative.")
+    
+    def __get_number_of_jobs(self, analysis_arguments: AnalysisArguments) -> int:
+        if analysis_arguments.jobs == 0:
+            return os.cpu_count() or 1
+        return analysis_arguments.jobs
     
-    def __load_changed_files(self, analysis_arguments: AnalysisArguments) -> list[ChangedFile]:
+    def __load_changed_files(self, analysis_arguments: AnalysisArguments, compiled_config: CompiledAnalysisConfig) \
+            -> Iterable[ChangedFile]:
         self.__logger.info("Loading changed files...")
         if analysis_arguments.source_branch == analysis_arguments.destination_branch:
-            return self.__load_all_files_in_directory(analysis_arguments.repository_directory)
+            # ignored directories are skipped as a whole instead of filtering every single file below them
+            path_matcher = compiled_config.path_matcher
+            if analysis_arguments.read_only:
+                return self.__load_all_files_of_branch(analysis_arguments, path_matcher)
+            return self.__load_all_files_in_directory(analysis_arguments.repository_directory, path_matcher)
         else:
             return self.__load_changed_files_from_diff(analysis_arguments)
         
-    def __load_all_files_in_directory(self, path: str) -> list[ChangedFile]:
-        return [ChangedFile(os.path.join(dp, f), None, True) 
-                for dp, dn, filenames in os.walk(path) for f in filenames 
-                if not dp.__contains__(".git")]
+    def __load_all_files_in_directory(self, path: str, path_matcher: PathMatcher) -> Iterable[ChangedFile]:
+        if self.__git_assistant.try_reset_repository_directory(path):
+            return self.__git_assistant.get_tracked_files(path_matcher.is_directory_ignored)
+        return self.__walk_directory(path, path_matcher)
+    
+    def __walk_directory(self, path: str, path_matcher: PathMatcher) -> Iterator[ChangedFile]:
+        for directory_path, directory_names, file_names in os.walk(path):
+            directory_names[:] = [directory_name for directory_name in directory_names if directory_name != ".git" 
+                                  and not path_matcher.is_directory_ignored(os.path.join(directory_path, 
+                                                                                         directory_name))]
+            for file_name in file_names:
+                yield ChangedFile(os.path.join(directory_path, file_name), None, True)
+    
+    def __load_all_files_of_branch(self, analysis_arguments: AnalysisArguments, path_matcher: PathMatcher) \
+            -> Iterable[ChangedFile]:
+        self.__git_assistant.reset_repository_directory(analysis_arguments.repository_directory)
+        return self.__git_assistant.get_all_files_of_branch(self.__get_source_branch_to_read(analysis_arguments), 
+                                                            path_matcher.is_directory_ignored)
     
-    def __load_changed_files_from_diff(self, analysis_arguments: AnalysisArguments) -> list[ChangedFile]:
+    def __load_changed_files_from_diff(self, analysis_arguments: AnalysisArguments) -> Iterable[ChangedFile]:
         self.__git_assistant.reset_repository_directory(analysis_arguments.repository_directory)
         return self.__git_assistant.get_changes_of_pull_request(
             analysis_arguments.source_branch,
             analysis_arguments.destination_branch,
-            analysis_arguments.changed_lines_only
+            analysis_arguments.changed_lines_only,
+            analysis_arguments.read_only,
+            analysis_arguments.fetch,
+            analysis_arguments.remote_refs,
+            self.__tracer
         )
     
-    def __get_analysis_config(self, analysis_arguments: AnalysisArguments) -> AnalysisConfig:
+    def __get_compiled_config(self, analysis_arguments: AnalysisArguments) -> CompiledAnalysisConfig:
         self.__logger.info("Loading analysis config...")
-        file_path = self.__find_analysis_config(analysis_arguments.repository_directory)
-        return self.__config_parser.load_analysis_config(file_path)
-    
-    def __find_analysis_config(self, search_directory: str) -> str:
-        matching_file_paths = glob.glob(f"{search_directory}/**/{self.__analysis_config_name}", recursive=True)
-        if len(matching_file_paths) > 1:
-            raise Exception(f"Multiple analysis configs found in '{search_directory}'. Please make sure that there is "
-                            f"only one '{self.__analysis_config_name}' present.")
-        elif len(matching_file_paths) == 1:
-            return matching_file_paths[0]
-        elif os.path.isfile(self.__analysis_config_name):
-            return self.__analysis_config_name
+        config_content = self.__read_analysis_config(analysis_arguments)
+        cache_directory = self.__get_cache_directory(analysis_arguments)
+        if cache_directory is None:
+            return self.__compile_analysis_config(config_content)
+        compiled_config_cache = CompiledConfigCache(cache_directory)
+        compiled_config = compiled_config_cache.load(config_content)
+        self.__tracer.set_attribute("cached", compiled_config is not None)
+        if compiled_config is None:
+            compiled_config = self.__compile_analysis_config(config_content)
+            compiled_config_cache.store(config_content, compiled_config)
+        return compiled_config
+    
+    def __compile_analysis_config(self, config_content: bytes) -> CompiledAnalysisConfig:
+        analysis_config = self.__config_parser.load_analysis_config_from_text(config_content.decode("utf-8"))
+        # compiling the checks reports invalid check settings before any file gets analyzed
+        return CompiledAnalysisConfig(analysis_config)
+    
+    def __get_cache_directory(self, analysis_arguments: AnalysisArguments) -> str | None:
+        if not analysis_arguments.use_cache:
+            return None
+        if analysis_arguments.cache_directory is None:
+            return CacheDirectory.get_default_path()
+        return analysis_arguments.cache_directory
+    
+    def __read_analysis_config(self, analysis_arguments: AnalysisArguments) -> bytes:
+        if analysis_arguments.config_path is not None:
+            return self.__read_file(analysis_arguments.config_path)
+        elif analysis_arguments.read_only:
+            return self.__read_analysis_config_from_branch(analysis_arguments)
         else:
-            raise FileNotFoundError(f"File not found: '{self.__analysis_config_name}'. Please put that file in the "
-                                    f"repository to be analyzed or next to the executable of the static code analysis "
-                                    f"tool.")
-    
-    def __analyze_all_files(self, analysis_config: AnalysisConfig, changed_files: list[ChangedFile]) \
-            -> list[FileAnalysisResult]:
-        self.__logger.info(f"Analyzing {len(changed_files)} changed files...")
-        file_analyzer = FileAnalyzer(analysis_config, self.__git_assistant.get_repository_directory())
-        results = []
+            return self.__read_file(self.__config_locator.find_config_file(analysis_arguments.repository_directory))
+    
+    def __read_analysis_config_from_branch(self, analysis_arguments: AnalysisArguments) -> bytes:
+        # without a checkout the config is read from the source branch, which also works for bare repositories
+        self.__git_assistant.reset_repository_directory(analysis_arguments.repository_directory)
+        blob_sha = self.__config_locator.find_config_blob(self.__get_source_branch_to_read(analysis_arguments))
+        if blob_sha is None:
+            return self.__read_file(self.__config_locator.find_fallback_config_file())
+        return self.__git_assistant.read_blob(blob_sha)
+    
+    def __read_file(self, file_path: str) -> bytes:
+        with open(file_path, "rb") as file:
+            return file.read()
+    
+    def __get_source_branch_to_read(self, analysis_arguments: AnalysisArguments) -> str:
+        if analysis_arguments.remote_refs:
+            return self.__git_assistant.get_remote_branch_name(analysis_arguments.source_branch)
+        return analysis_arguments.source_branch
+    
+    def __analyze_all_files(self, 
+                            compiled_config: CompiledAnalysisConfig, 
+                            changed_files: Iterable[ChangedFile], 
+                            jobs: int,
+                            cache_directory: str | None) -> Iterator[FileAnalysisResult]:
+        result_cache = ResultCache(cache_directory) if cache_directory is not None else None
+        if jobs > 1:
+            self.__logger.info(f"Analyzing changed files with {jobs} worker processes...")
+            yield from self.__analyze_all_files_in_parallel(compiled_config, changed_files, jobs, cache_directory)
+        else:
+            self.__logger.info("Analyzing changed files...")
+            yield from self.__analyze_all_files_sequentially(compiled_config, changed_files, result_cache)
+        if result_cache is not None:
+            with self.__tracer.span("evict result cache", "stage"):
+                result_cache.evict_least_recently_used()
+        self.__logger.info("Static code analysis completed.")
+    
+    def __analyze_all_files_sequentially(self, 
+                                         compiled_config: CompiledAnalysisConfig, 
+                                         changed_files: Iterable[ChangedFile],
+                                         result_cache: ResultCache | None) -> Iterator[FileAnalysisResult]:
+        repository_directory = self.__git_assistant.get_repository_directory()
+        # the blobs are read by the 'git cat-file' process of the repository, which stays open between analyses
+        file_analyzer = FileAnalyzer(compiled_config, repository_directory, result_cache, self.__tracer, 
+                                     BlobReader(repository_directory, self.__git_assistant.repo))
         for changed_file in changed_files:
             self.__logger.info(f"Analyzing changed file: {changed_file.file_path}")
-            results.append(self.__perform_analysis_on_file(file_analyzer, changed_file))
-        self.__logger.info("Static code analysis completed.")
-        return results
-    
-    def __perform_analysis_on_file(self, file_analyzer: FileAnalyzer, changed_file: ChangedFile) -> FileAnalysisResult:
-        try:
-            return file_analyzer.analyze_changed_file(changed_file)
-        except AnalysisException as analysis_exception:
-            result = FileAnalysisResult(changed_file.get_relative_path(self.__git_assistant.get_repository_directory()))
-            result.issues.append(LineAnalysisIssue(0, str(analysis_exception)))
-            return result
-        
\ No newline at end of file
+            yield file_analyzer.try_analyze_changed_file(changed_file)
+    
+    def __analyze_all_files_in_parallel(self, 
+                                        compiled_config: CompiledAnalysisConfig, 
+                                        changed_files: Iterable[ChangedFile], 
+                                        jobs: int,
+                                        cache_directory: str | None) -> Iterator[FileAnalysisResult]:
+        parallel_file_analyzer = ParallelFileAnalyzer(compiled_config, 
+                                                      self.__git_assistant.get_repository_directory(), 
+                                                      jobs,
+                                                      cache_directory, 
+                                                      tracer=self.__tracer)
+        for result in parallel_file_analyzer.analyze_changed_files(changed_files):
+            self.__logger.info(f"Analyzed changed file: {result.file_path}")
+            yield result
\ No newline at end of file
@@ -0,0 +1,50 @@
+import json
+import os
+import socket
+import sys
+
+from cli_argument_parser import CliArgumentParser
+from util.daemon_socket import DaemonSocket
+
+
+class AnalysisClient:
+    # A thin client for git hooks, which lets the analysis daemon do the work. It only uses the standard library, so 
+    # it starts much faster than the application itself.
+    def __init__(self, socket_path: str | None = None):
+        self.socket_path = socket_path if socket_path is not None else DaemonSocket.get_default_path()
+    
+    def run(self, arguments: list[str]) -> int:
+        if not hasattr(socket, "AF_UNIX"):
+            print("The analysis daemon requires unix sockets, which are not supported on this system.", file=sys.stderr)
+            return 3
+        with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as connection:
+            try:
+                connection.connect(self.socket_path)
+            except OSError as e:
+                print(f"Could not connect to the analysis daemon at {self.socket_path}: {e}. Start it with "
+                      f"'main.py --daemon'.", file=sys.stderr)
+                return 3
+            request = {"arguments": arguments, "working_directory": os.getcwd()}
+            connection.sendall(json.dumps(request).encode("utf-8") + b"\n")
+            with connection.makefile("rb") as reader:
+                return self.__print_response(reader)
+    
+    def __print_response(self, reader) -> int:
+        for line in reader:
+            message = json.loads(line)
+            if "exit_code" in message:
+                return message["exit_code"]
+            if "stdout" in message:
+                sys.stdout.write(message["stdout"])
+                sys.stdout.flush()
+            if "stderr" in message:
+                sys.stderr.write(message["stderr"])
+                sys.stderr.flush()
+        print("The analysis daemon closed the connection before the analysis was completed.", file=sys.stderr)
+        return 3
+
+
+if __name__ == "__main__":
+    # The client only needs the socket, the arguments are validated and processed by the daemon.
+    client_arguments, _ = CliArgumentParser().parser.parse_known_args()
+    sys.exit(AnalysisClient(client_arguments.socket).run(sys.argv[1:]))
\ No newline at end of file
@@ -4,10 +4,13 @@ class AnalysisConfig:
                  ignored_files: list[str],
                  file_encodings: dict[str, str], 
                  standard_checks: dict[str, object], 
-                 specific_checks: dict[str, dict[str, object]]):
+                 specific_checks: dict[str, dict[str, object]], 
+                 binary_files: str = "report"):
         self.forbidden_files: list[str] = forbidden_files
         self.ignored_files: list[str] = ignored_files
         self.file_encodings: dict[str, str] = file_encodings
         self.standard_checks: dict[str, object] = standard_checks
         self.specific_checks: dict[str, dict[str, object]] = specific_checks
+        # 'report' adds one issue to every binary file which is neither ignored nor forbidden, 'ignore' skips them
+        self.binary_files: str = binary_files
         
\ No newline at end of file
@@ -0,0 +1,156 @@
+import io
+import json
+import os
+import signal
+import socket
+import sys
+from contextlib import redirect_stderr, redirect_stdout
+
+from cli_argument_parser import CliArgumentParser
+from config_parser import ConfigParser
+from git_assistant import GitAssistant
+from headless_analyzer import HeadlessAnalyzer
+from logger import Logger
+from util.daemon_socket import DaemonSocket
+
+
+class DaemonOutputStream(io.TextIOBase):
+    # Sends everything written to it as complete lines to the client, which writes them to the given stream.
+    def __init__(self, connection: socket.socket, stream_name: str):
+        super().__init__()
+        self.connection = connection
+        self.stream_name = stream_name
+        self.buffer = ""
+        self.is_connected = True
+        
+    def write(self, text: str) -> int:
+        self.buffer += text
+        if "\n" in self.buffer:
+            self.flush()
+        return len(text)
+    
+    def flush(self):
+        if len(self.buffer) == 0:
+            return
+        self.send_message({self.stream_name: self.buffer})
+        self.buffer = ""
+    
+    def send_message(self, message: dict[str, object]):
+        if not self.is_connected:
+            return
+        try:
+            self.connection.sendall(json.dumps(message).encode("utf-8") + b"\n")
+        except OSError:
+            # the client is gone, but the analysis is finished anyway to keep the caches complete
+            self.is_connected = False
+
+
+class AnalysisDaemon:
+    # Analyzes the requests of analysis_client.py one after another. The repositories, the compiled analysis configs 
+    # and the caches stay loaded between the requests, so a request only pays for the analysis itself.
+    def __init__(self, logger: Logger, config_parser: ConfigParser, socket_path: str | None = None):
+        self.__logger = logger
+        self.__config_parser = config_parser
+        self.socket_path = socket_path if socket_path is not None else DaemonSocket.get_default_path()
+        self.__git_assistants: dict[str, GitAssistant] = {}
+        self.request_timeout_in_seconds = 10.0
+    
+    def serve(self) -> int:
+        if not hasattr(socket, "AF_UNIX"):
+            self.__logger.error("The analysis daemon requires unix sockets, which are not supported on this system.")
+            return 2
+        if not self.__try_remove_stale_socket():
+            self.__logger.error(f"Another analysis daemon is already listening on {self.socket_path}")
+            return 2
+        os.makedirs(os.path.dirname(self.socket_path), exist_ok=True)
+        # service managers stop the daemon with SIGTERM, which has to remove the socket as well
+        signal.signal(signal.SIGTERM, lambda signal_number, frame: sys.exit(0))
+        server = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        try:
+            # only the current user may send requests, so the socket is created without permissions for anyone else
+            previous_umask = os.umask(0o177)
+            try:
+                server.bind(self.socket_path)
+            finally:
+                os.umask(previous_umask)
+            server.listen()
+            self.__logger.info(f"The analysis daemon is listening on {self.socket_path}")
+            while True:
+                connection, _ = server.accept()
+                with connection:
+                    self.__handle_connection(connection)
+        except KeyboardInterrupt:
+            self.__logger.info("The analysis daemon has been stopped.")
+            return 0
+        finally:
+            server.close()
+            if os.path.exists(self.socket_path):
+                os.remove(self.socket_path)
+    
+    def __try_remove_stale_socket(self) -> bool:
+        if not os.path.exists(self.socket_path):
+            return True
+        with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as probe:
+            try:
+                probe.connect(self.socket_path)
+                return False
+            except OSError:
+                # the socket was left behind by a daemon which was killed
+                os.remove(self.socket_path)
+                return True
+    
+    def __handle_connection(self, connection: socket.socket):
+        request_line = self.__try_read_request_line(connection)
+        if len(request_line) == 0:
+            # e.g. another daemon checking whether this one is still running
+            return
+        stdout = DaemonOutputStream(connection, "stdout")
+        stderr = DaemonOutputStream(connection, "stderr")
+        try:
+            request = json.loads(request_line)
+            with redirect_stdout(stdout), redirect_stderr(stderr):
+                exit_code = self.__handle_request(request["arguments"], request["working_directory"])
+        except Exception as e:
+            self.__logger.error(f"Failed to handle the request of a client: {e}")
+            exit_code = 3
+        stdout.flush()
+        stderr.flush()
+        stdout.send_message({"exit_code": exit_code})
+    
+    def __try_read_request_line(self, connection: socket.socket) -> bytes:
+        # a client which never sends its request must not block the daemon
+        connection.settimeout(self.request_timeout_in_seconds)
+        try:
+            with connection.makefile("rb") as reader:
+                return reader.readline()
+        except OSError:
+            return b""
+        finally:
+            connection.settimeout(None)
+    
+    def __handle_request(self, arguments: list[str], working_directory: str) -> int:
+        # Relative paths and the fallback config are resolved against the directory of the client. The requests are 
+        # handled one after another, so changing the directory of the whole process is safe.
+        daemon_directory = os.getcwd()
+        os.chdir(working_directory)
+        try:
+            cli_arguments = CliArgumentParser().get_parsed_arguments(arguments)
+            logger = Logger(cli_arguments.quiet, sys.stderr if cli_arguments.output_format == "jsonl" else None)
+            headless_analyzer = HeadlessAnalyzer(logger, self.__config_parser)
+            if not headless_analyzer.is_configuration_valid(cli_arguments):
+                return 2
+            if cli_arguments.watch:
+                logger.error("The analysis daemon does not support watching branches.")
+                return 2
+            return headless_analyzer.perform_analysis(cli_arguments, self.__get_git_assistant(cli_arguments.repository))
+        except SystemExit as e:
+            # invalid arguments, argparse already printed the usage
+            return e.code if isinstance(e.code, int) else 2
+        finally:
+            os.chdir(daemon_directory)
+    
+    def __get_git_assistant(self, repository_directory: str) -> GitAssistant:
+        repository_directory = os.path.realpath(repository_directory)
+        if repository_directory not in self.__git_assistants:
+            self.__git_assistants[repository_directory] = GitAssistant(repository_directory)
+        return self.__git_assistants[repository_directory]
\ No newline at end of file
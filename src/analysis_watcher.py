@@ -0,0 +1,140 @@
+import copy
+import hashlib
+import os
+from threading import Event
+from typing import Callable
+
+from analysis import Analysis
+from config_locator import ConfigLocator
+from config_parser import ConfigParser
+from git_assistant import GitAssistant
+from logger import Logger
+from models.analysis_arguments import AnalysisArguments
+from models.changed_file import ChangedFile
+from models.file_analysis_result import FileAnalysisResult
+
+
+class AnalysisWatcher:
+    # Polls the heads of the source and the target branch and analyzes the pull request again whenever one of them 
+    # moves. The files are read from the git object database, so the working tree is never touched. Only files whose 
+    # blob or diff changed since the previous run are analyzed again, the results of all other files are kept. A 
+    # config file outside of the branch, given with --config or used as the fallback, is polled as well.
+    def __init__(self, 
+                 logger: Logger, 
+                 config_parser: ConfigParser, 
+                 git_assistant: GitAssistant, 
+                 poll_interval_in_seconds: float = 1.0):
+        self.__logger = logger
+        self.__config_parser = config_parser
+        self.__git_assistant = git_assistant
+        self.poll_interval_in_seconds = poll_interval_in_seconds
+        self.results: list[FileAnalysisResult] = []
+        # the state of every file of the previous run, keyed by its relative path
+        self.__analyzed_files: dict[str, tuple[str | None, bytes | None, bool]] = {}
+        self.__config_version: str | None = None
+    
+    def watch(self, 
+              analysis_arguments: AnalysisArguments, 
+              on_results_updated: Callable[[list[FileAnalysisResult] | None], None], 
+              stop_event: Event):
+        watched_arguments = copy.copy(analysis_arguments)
+        watched_arguments.read_only = True
+        watched_arguments.fetch = False
+        watched_state = None
+        is_first_run = True
+        while not stop_event.is_set():
+            current_watched_state = (self.__try_get_branch_heads(watched_arguments), 
+                                     self.__get_config_file_state(watched_arguments))
+            if is_first_run or current_watched_state != watched_state:
+                watched_state = current_watched_state
+                if self.__try_analyze_changes(watched_arguments) and not stop_event.is_set():
+                    on_results_updated(self.results)
+                elif is_first_run:
+                    # there are no results to show, if the first analysis failed
+                    on_results_updated(None)
+                is_first_run = False
+            stop_event.wait(self.poll_interval_in_seconds)
+    
+    def __try_analyze_changes(self, analysis_arguments: AnalysisArguments) -> bool:
+        try:
+            self.analyze_changes(analysis_arguments)
+            return True
+        except Exception as e:
+            # the analysis is tried again when one of the branches moves
+            self.__logger.error(e)
+            return False
+    
+    def analyze_changes(self, analysis_arguments: AnalysisArguments) -> list[FileAnalysisResult]:
+        self.__git_assistant.reset_repository_directory(analysis_arguments.repository_directory)
+        config_version = self.__get_config_version(analysis_arguments)
+        if config_version != self.__config_version:
+            # a changed config affects every file
+            self.__analyzed_files.clear()
+            self.__config_version = config_version
+        current_files: dict[str, tuple[str | None, bytes | None, bool]] = {}
+        
+        def has_changed(changed_file: ChangedFile) -> bool:
+            relative_path = changed_file.get_relative_path(self.__git_assistant.get_repository_directory())
+            current_files[relative_path] = self.__get_file_state(changed_file)
+            return self.__analyzed_files.get(relative_path) != current_files[relative_path]
+        
+        analysis = Analysis(self.__logger, self.__config_parser, self.__git_assistant)
+        new_results = analysis.execute(analysis_arguments, has_changed)
+        self.__logger.info(f"Analyzed {len(new_results)} of {len(current_files)} files again.")
+        self.__update_results(current_files, new_results)
+        self.__analyzed_files = current_files
+        return self.results
+    
+    def __try_get_branch_heads(self, analysis_arguments: AnalysisArguments) -> tuple[str, str] | None:
+        try:
+            self.__git_assistant.reset_repository_directory(analysis_arguments.repository_directory)
+            source_branch = self.__get_branch_to_read(analysis_arguments.source_branch, analysis_arguments)
+            target_branch = self.__get_branch_to_read(analysis_arguments.destination_branch, analysis_arguments)
+            return (self.__git_assistant.get_commit_sha(source_branch), 
+                    self.__git_assistant.get_commit_sha(target_branch))
+        except Exception:
+            # e.g. a branch which is deleted or being updated, the analysis reports the actual error
+            return None
+    
+    def __get_branch_to_read(self, branch_name: str, analysis_arguments: AnalysisArguments) -> str:
+        if analysis_arguments.remote_refs:
+            return self.__git_assistant.get_remote_branch_name(branch_name)
+        return branch_name
+    
+    def __get_config_version(self, analysis_arguments: AnalysisArguments) -> str:
+        # the blob of the config in the source branch, otherwise the hash of the config file which is used instead
+        config_locator = ConfigLocator(self.__git_assistant)
+        if analysis_arguments.config_path is None:
+            source_branch = self.__get_branch_to_read(analysis_arguments.source_branch, analysis_arguments)
+            config_blob_sha = config_locator.find_config_blob(source_branch)
+            if config_blob_sha is not None:
+                return config_blob_sha
+            config_file_path = config_locator.find_fallback_config_file()
+        else:
+            config_file_path = analysis_arguments.config_path
+        with open(config_file_path, "rb") as file:
+            return hashlib.sha1(file.read()).hexdigest()
+    
+    def __get_config_file_state(self, analysis_arguments: AnalysisArguments) -> tuple[int, int] | None:
+        # The file is only compared by its modification time and size on every poll. The fallback config is polled, 
+        # even if the branch contains a config, but then a change of it does not discard any results.
+        config_file_path = analysis_arguments.config_path or ConfigLocator.CONFIG_FILE_NAME
+        try:
+            config_file_stat = os.stat(config_file_path)
+            return config_file_stat.st_mtime_ns, config_file_stat.st_size
+        except OSError:
+            return None
+    
+    def __get_file_state(self, changed_file: ChangedFile) -> tuple[str | None, bytes | None, bool]:
+        diff_digest = hashlib.sha1(changed_file.diff).digest() if changed_file.diff is not None else None
+        return changed_file.blob_sha, diff_digest, changed_file.check_entire_file
+    
+    def __update_results(self, 
+                         current_files: dict[str, tuple[str | None, bytes | None, bool]], 
+                         new_results: list[FileAnalysisResult]):
+        # The list is updated in place, so everyone holding it sees the new results. Files which are not part of the 
+        # pull request anymore are removed.
+        results_by_path = {result.file_path: result for result in self.results}
+        results_by_path.update((result.file_path, result) for result in new_results)
+        self.results[:] = [results_by_path[relative_path] for relative_path in current_files 
+                           if relative_path in results_by_path]
\ No newline at end of file
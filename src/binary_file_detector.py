@@ -0,0 +1,36 @@
+import codecs
+import mmap
+
+
+class BinaryFileDetector:
+    # Like git, a file is treated as binary if one of its first 8000 bytes is a NUL byte or if git reports its diff as 
+    # binary, e.g. because of the 'binary' attribute. Files starting with a byte order mark and files whose encoding 
+    # stores ascii characters with NUL bytes (UTF-16 and UTF-32) are text files. Only the first bytes are read, so 
+    # binary files are classified without decoding them.
+    SNIFF_SIZE = 8000
+    __byte_order_marks = (codecs.BOM_UTF8, codecs.BOM_UTF16_LE, codecs.BOM_UTF16_BE)
+    __wide_encoding_prefixes = ("utf-16", "utf-32")
+    
+    @staticmethod
+    def is_binary_diff(diff: bytes | None) -> bool:
+        # git prints this instead of a patch for files with NUL bytes or with the 'binary' attribute, which is the 
+        # same classification as a '-' in the output of 'git diff --numstat'
+        return diff is not None and diff.startswith(b"Binary files") and diff.endswith(b"differ\n")
+    
+    @staticmethod
+    def is_binary_content(content: bytes | mmap.mmap, file_encoding: str, has_binary_diff: bool = False) -> bool:
+        # the BOMs of UTF-32 start with the BOMs of UTF-16
+        first_bytes = content[:BinaryFileDetector.SNIFF_SIZE]
+        if first_bytes.startswith(BinaryFileDetector.__byte_order_marks) \
+                or BinaryFileDetector.__is_wide_encoding(file_encoding):
+            return False
+        return has_binary_diff or b"\0" in first_bytes
+    
+    @staticmethod
+    def __is_wide_encoding(file_encoding: str) -> bool:
+        try:
+            encoding_name = codecs.lookup(file_encoding).name
+        except LookupError:
+            # the decoder reports unknown encodings
+            return False
+        return encoding_name.startswith(BinaryFileDetector.__wide_encoding_prefixes)
\ No newline at end of file
@@ -0,0 +1,14 @@
+from git import Repo
+
+
+class BlobReader:
+    def __init__(self, repository_directory: str, repo: Repo | None = None):
+        self.repository_directory = repository_directory
+        # the repository of the analyzing process can be shared, the worker processes open their own
+        self.repo: Repo | None = repo
+        
+    def read_blob(self, blob_sha: str) -> bytes:
+        if self.repo is None:
+            # the repository is opened on first use, so that every worker process uses its own 'git cat-file' process
+            self.repo = Repo(self.repository_directory)
+        return self.repo.odb.stream(bytes.fromhex(blob_sha)).read()
\ No newline at end of file
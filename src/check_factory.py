@@ -1,6 +1,7 @@
 from analysis_config import AnalysisConfig
 from checks.check import Check
 from checks.line_length import LineLength
+from checks.regex_check import RegexCheck
 from checks.region_newline import RegionNewline
 from checks.replacement_characters import ReplacementCharacters
 from checks.tabs import Tabs
@@ -18,8 +19,25 @@ class CheckFactory:
             "todo": TODO,
             "trailing_whitespace": TrailingWhitespace,
             "region_newline": RegionNewline,
+            "regex": RegexCheck,
         }
         
+    def generate_standard_checks(self) -> list[Check]:
+        return self.__generate_checks_of_section(self.analysis_config.standard_checks, "standard_checks")
+    
+    def generate_specific_checks(self) -> dict[str, list[Check]]:
+        return {
+            wildcard: self.__generate_checks_of_section(check_definitions, f"specific_checks -> {wildcard}")
+            for wildcard, check_definitions in self.analysis_config.specific_checks.items()
+        }
+    
+    def __generate_checks_of_section(self, configured_checks: dict[str, object], section_name: str) -> list[Check]:
+        try:
+            return self.generate_checks(configured_checks)
+        except (KeyError, TypeError, ValueError, NotImplementedError) as exception:
+            raise ValueError(f"The checks configured in '{section_name}' are invalid: "
+                             f"{type(exception).__name__}: {exception}")
+        
     def generate_checks(self, configured_checks: dict[str, object]) -> list[Check]:
         checks = []
         for check_name, check_settings in configured_checks.items():
@@ -34,5 +52,6 @@ class CheckFactory:
                 if not isinstance(check_instance, Check):
                     raise TypeError(f"The type defined for '{wanted_check_name}' is not an instance of the abstract "
                                     f"class 'Check'. Please use 'Check' as the base class when writing new checks!")
+                check_instance.name = check_name
                 return check_instance
         raise NotImplementedError(f"Check '{wanted_check_name}' is not implemented.")
\ No newline at end of file
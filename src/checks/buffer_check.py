@@ -0,0 +1,25 @@
+from abc import abstractmethod
+
+from checks.check import Check
+from models.changed_lines_buffer import ChangedLinesBuffer
+from models.line_analysis_issue import LineAnalysisIssue
+from models.loaded_file import LoadedFile
+
+
+class BufferCheck(Check):
+    # Checks which search the changed lines of a file as one text instead of line by line. The analysis joins the 
+    # changed lines once per file and passes the same buffer to every buffer check. A check whose issues all contain 
+    # the prefilter text is skipped for files without it, before it searches the buffer.
+    prefilter: str | None = None
+    
+    @abstractmethod
+    def check_buffer(self, buffer: ChangedLinesBuffer) -> list[LineAnalysisIssue]:
+        pass
+    
+    def execute_on_buffer(self, buffer: ChangedLinesBuffer) -> list[LineAnalysisIssue]:
+        if self.prefilter is not None and self.prefilter not in buffer.text:
+            return []
+        return self.check_buffer(buffer)
+    
+    def execute_on_changed_file(self, changed_file: LoadedFile) -> list[LineAnalysisIssue]:
+        return self.execute_on_buffer(ChangedLinesBuffer(changed_file.changed_lines))
\ No newline at end of file
@@ -5,6 +5,9 @@ from models.loaded_file import LoadedFile
 
 
 class Check(ABC):
+    # the name of the check in the analysis config, which is set by the check factory
+    name: str = ""
+    
     @abstractmethod
     def parse_config(self, config_object: dict[str, object] | None):
         pass
@@ -0,0 +1,25 @@
+from abc import abstractmethod
+
+from checks.check import Check
+from models.line_analysis_issue import LineAnalysisIssue
+from models.loaded_file import LoadedFile
+from models.scanned_line import ScannedLine
+
+
+class LineCheck(Check):
+    # Checks which only look at one changed line at a time. All line checks of a file are executed together in a 
+    # single pass over the changed lines by the FusedLineScanner.
+    
+    @abstractmethod
+    def check_line(self, line: ScannedLine) -> LineAnalysisIssue | None:
+        pass
+    
+    def execute_on_changed_file(self, changed_file: LoadedFile) -> list[LineAnalysisIssue]:
+        issues = []
+        scanned_line = ScannedLine()
+        for changed_line in changed_file.changed_lines:
+            scanned_line.update(changed_line)
+            issue = self.check_line(scanned_line)
+            if issue is not None:
+                issues.append(issue)
+        return issues
\ No newline at end of file
@@ -1,21 +1,16 @@
-from checks.check import Check
+from checks.line_check import LineCheck
 from models.line_analysis_issue import LineAnalysisIssue
-from models.loaded_file import LoadedFile
+from models.scanned_line import ScannedLine
 
 
-class LineLength(Check):
-    def __int__(self):
+class LineLength(LineCheck):
+    def __init__(self):
         self.max_line_length = None
 
     def parse_config(self, config_object: dict[str, object] | None):
         self.max_line_length = config_object["max_line_length"]
 
-    def execute_on_changed_file(self, changed_file: LoadedFile) -> list[LineAnalysisIssue]:
-        issues = []
-        faulty_lines = [line for line in changed_file.changed_lines if len(line.content) > self.max_line_length]
-        for faulty_line in faulty_lines:
-            issues.append(LineAnalysisIssue(
-                faulty_line.number,
-                f"Line is longer than {self.max_line_length} characters."
-            ))
-        return issues
+    def check_line(self, line: ScannedLine) -> LineAnalysisIssue | None:
+        if line.length > self.max_line_length:
+            return LineAnalysisIssue(line.number, f"Line is longer than {self.max_line_length} characters.")
+        return None
\ No newline at end of file
@@ -0,0 +1,113 @@
+import re
+
+from checks.buffer_check import BufferCheck
+from models.changed_lines_buffer import ChangedLinesBuffer
+from models.line_analysis_issue import LineAnalysisIssue
+from models.regex_pattern import RegexPattern
+from util.regex_pattern_inspector import RegexPatternInspector
+
+
+class RegexCheck(BufferCheck):
+    # Reports every changed line in which a match of one of the configured patterns starts. All patterns are combined 
+    # into a single alternation, which is searched in one pass over the buffer. The alternation only reports the first 
+    # pattern which matches at a position, so the later patterns are tried at the same position as well. The buffer 
+    # joins lines which are not adjacent in the file, so a match which runs past the end of its line is matched again 
+    # within the line.
+    def __init__(self):
+        self.patterns: list[RegexPattern] = []
+        self.combined_regex: re.Pattern[str] | None = None
+        self.__pattern_index_by_group: dict[int, int] = {}
+
+    def parse_config(self, config_object: dict[str, object] | None):
+        pattern_definitions = config_object["patterns"]
+        if not isinstance(pattern_definitions, list) or len(pattern_definitions) == 0:
+            raise ValueError("'patterns' must be a non-empty list.")
+        patterns = [self.__parse_pattern(pattern_definition) for pattern_definition in pattern_definitions]
+        if len({pattern.name for pattern in patterns}) != len(patterns):
+            raise ValueError("The names of the patterns must be unique.")
+        self.__set_patterns(patterns)
+    
+    @staticmethod
+    def combine(regex_checks: list["RegexCheck"]) -> "RegexCheck":
+        # the regex checks of the standard and the specific checks of a file are searched in a single pass
+        combined_check = RegexCheck()
+        combined_check.name = regex_checks[0].name
+        combined_check.__set_patterns([pattern for regex_check in regex_checks for pattern in regex_check.patterns])
+        return combined_check
+    
+    def check_buffer(self, buffer: ChangedLinesBuffer) -> list[LineAnalysisIssue]:
+        return [issue for issues in self.find_issues_per_pattern(buffer) for issue in issues]
+    
+    def find_issues_per_pattern(self, buffer: ChangedLinesBuffer) -> list[list[LineAnalysisIssue]]:
+        # the issues of every pattern in the order of the patterns
+        issues_per_pattern = [[] for _ in self.patterns]
+        all_patterns_found = (1 << len(self.patterns)) - 1
+        # a bit for every pattern which already matched in the current line
+        found_patterns = 0
+        line_end = 0
+        text = buffer.text
+        search = self.combined_regex.search
+        match = search(text)
+        while match is not None:
+            match_start = match.start()
+            if match_start >= line_end:
+                line_index = buffer.get_line_index(match_start)
+                line_end = buffer.line_starts[line_index + 1]
+                line_number = buffer.changed_lines[line_index].number
+                found_patterns = 0
+            matched_pattern_index = self.__pattern_index_by_group[match.lastindex]
+            for pattern_index in range(matched_pattern_index, len(self.patterns)):
+                pattern_bit = 1 << pattern_index
+                if found_patterns & pattern_bit != 0:
+                    continue
+                pattern = self.patterns[pattern_index]
+                if pattern_index == matched_pattern_index and match.end() <= line_end \
+                        or pattern.regex.match(text, match_start, line_end) is not None:
+                    found_patterns |= pattern_bit
+                    issues_per_pattern[pattern_index].append(LineAnalysisIssue(line_number, pattern.message))
+            # the rest of the line is skipped, once every pattern matched in it
+            match = search(text, line_end if found_patterns == all_patterns_found else match_start + 1)
+        return issues_per_pattern
+    
+    def __parse_pattern(self, pattern_definition: object) -> RegexPattern:
+        if not isinstance(pattern_definition, dict):
+            raise ValueError("Every entry in 'patterns' must be an object.")
+        name = pattern_definition["name"]
+        pattern = pattern_definition["pattern"]
+        message = pattern_definition["message"]
+        ignore_case = pattern_definition.get("ignore_case", False)
+        if not isinstance(name, str) or not isinstance(pattern, str) or not isinstance(message, str):
+            raise ValueError("The 'name', 'pattern' and 'message' of a pattern must be strings.")
+        if not isinstance(ignore_case, bool):
+            raise ValueError("'ignore_case' must be a boolean.")
+        flags = re.MULTILINE | (re.IGNORECASE if ignore_case else 0)
+        RegexPatternInspector.validate(pattern, flags)
+        return RegexPattern(name, message, re.compile(pattern, flags))
+    
+    def __set_patterns(self, patterns: list[RegexPattern]):
+        self.patterns = patterns
+        # The flags of every pattern are scoped to its own group. The group names identify the matching pattern, the 
+        # patterns themselves cannot contain named groups.
+        alternation = "|".join(f"(?P<p{index}>(?{self.__get_inline_flags(pattern.regex)}:{pattern.regex.pattern}))" 
+                               for index, pattern in enumerate(patterns))
+        self.combined_regex = re.compile(f"{self.__get_first_characters_lookahead(patterns)}(?:{alternation})")
+        # the outermost group of a pattern is the last one which closes, so it is the last index of its matches
+        self.__pattern_index_by_group = {self.combined_regex.groupindex[f"p{index}"]: index 
+                                         for index in range(len(patterns))}
+    
+    def __get_first_characters_lookahead(self, patterns: list[RegexPattern]) -> str:
+        # The regex engine tries every pattern at every position of the buffer. A lookahead for the characters the 
+        # patterns can start with rejects most positions with a single check.
+        class_items = []
+        ignore_case = False
+        for pattern in patterns:
+            first_characters = RegexPatternInspector.get_first_characters(pattern.regex.pattern, pattern.regex.flags)
+            if first_characters is None:
+                return ""
+            class_items += first_characters[0]
+            ignore_case = ignore_case or first_characters[1]
+        character_class = "[" + "".join(dict.fromkeys(class_items)) + "]"
+        return f"(?=(?i:{character_class}))" if ignore_case else f"(?={character_class})"
+    
+    def __get_inline_flags(self, regex: re.Pattern[str]) -> str:
+        return "m" + ("i" if regex.flags & re.IGNORECASE else "")
\ No newline at end of file
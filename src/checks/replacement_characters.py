@@ -1,18 +1,14 @@
-from checks.check import Check
+from checks.buffer_check import BufferCheck
+from models.changed_lines_buffer import ChangedLinesBuffer
 from models.line_analysis_issue import LineAnalysisIssue
-from models.loaded_file import LoadedFile
 
 
-class ReplacementCharacters(Check):
+class ReplacementCharacters(BufferCheck):
+    prefilter = "�"
+    
     def parse_config(self, config_object: dict[str, object] | None):
         pass
 
-    def execute_on_changed_file(self, changed_file: LoadedFile) -> list[LineAnalysisIssue]:
-        issues = []
-        lines_with_replacement = [line for line in changed_file.changed_lines if line.content.__contains__("�")]
-        for line_with_replacement in lines_with_replacement:
-            issues.append(LineAnalysisIssue(
-                line_with_replacement.number,
-                f"Replacement character (�) found."
-            ))
-        return issues
\ No newline at end of file
+    def check_buffer(self, buffer: ChangedLinesBuffer) -> list[LineAnalysisIssue]:
+        return [LineAnalysisIssue(line.number, f"Replacement character (�) found.") 
+                for line in buffer.find_lines_containing("�")]
\ No newline at end of file
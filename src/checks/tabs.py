@@ -1,18 +1,14 @@
-from checks.check import Check
+from checks.buffer_check import BufferCheck
+from models.changed_lines_buffer import ChangedLinesBuffer
 from models.line_analysis_issue import LineAnalysisIssue
-from models.loaded_file import LoadedFile
 
 
-class Tabs(Check):
+class Tabs(BufferCheck):
+    prefilter = "\t"
+    
     def parse_config(self, config_object: dict[str, object] | None):
         pass
 
-    def execute_on_changed_file(self, changed_file: LoadedFile) -> list[LineAnalysisIssue]:
-        issues = []
-        faulty_lines = [line for line in changed_file.changed_lines if line.content.__contains__("\t")]
-        for faulty_line in faulty_lines:
-            issues.append(LineAnalysisIssue(
-                faulty_line.number,
-                f"Found tab character. Please use space character instead!"
-            ))
-        return issues
\ No newline at end of file
+    def check_buffer(self, buffer: ChangedLinesBuffer) -> list[LineAnalysisIssue]:
+        return [LineAnalysisIssue(line.number, f"Found tab character. Please use space character instead!") 
+                for line in buffer.find_lines_containing("\t")]
\ No newline at end of file
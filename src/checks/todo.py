@@ -1,28 +1,19 @@
 import re
 
-from checks.check import Check
+from checks.buffer_check import BufferCheck
+from models.changed_lines_buffer import ChangedLinesBuffer
 from models.line_analysis_issue import LineAnalysisIssue
-from models.loaded_file import LoadedFile
 
 
-class TODO(Check):
+class TODO(BufferCheck):
     def __init__(self):
         super()
-        self.regex = r"todo([^u]|\s)"
+        # the character after 'todo' may be the line break, but never a character of the next line
+        self.regex = re.compile(r"todo([^u]|\s)", re.IGNORECASE)
 
     def parse_config(self, config_object: dict[str, object] | None):
         pass
 
-    def execute_on_changed_file(self, changed_file: LoadedFile) -> list[LineAnalysisIssue]:
-        issues = []
-        faulty_lines = [
-            line for line in changed_file.changed_lines 
-            if len(re.findall(self.regex, line.content, re.IGNORECASE)) > 0
-        ]
-        for faulty_line in faulty_lines:
-            issues.append(LineAnalysisIssue(
-                faulty_line.number,
-                "Found unresolved TODO. Please use user stories instead!"
-            ))
-        return issues
-        
\ No newline at end of file
+    def check_buffer(self, buffer: ChangedLinesBuffer) -> list[LineAnalysisIssue]:
+        return [LineAnalysisIssue(line.number, "Found unresolved TODO. Please use user stories instead!") 
+                for line in buffer.find_lines_matching(self.regex)]
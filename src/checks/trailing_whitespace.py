@@ -1,24 +1,19 @@
-from checks.check import Check
+from checks.line_check import LineCheck
 from models.line_analysis_issue import LineAnalysisIssue
-from models.loaded_file import LoadedFile
+from models.scanned_line import ScannedLine
 
 
-class TrailingWhitespace(Check):
+class TrailingWhitespace(LineCheck):
     def __init__(self):
         self.max_trailing_whitespaces = None
 
     def parse_config(self, config_object: dict[str, object]):
         self.max_trailing_whitespaces = config_object["max_trailing_whitespaces"]
 
-    def execute_on_changed_file(self, changed_file: LoadedFile) -> list[LineAnalysisIssue]:
-        issues = []
-        faulty_lines = [
-            line for line in changed_file.changed_lines
-            if (len(line.content) - len(line.content.rstrip())) > self.max_trailing_whitespaces
-        ]
-        for faulty_line in faulty_lines:
-            issues.append(LineAnalysisIssue(
-                faulty_line.number,
-                f"Line {faulty_line.number} includes more than {self.max_trailing_whitespaces} trailing whitespaces."
-            ))
-        return issues
\ No newline at end of file
+    def check_line(self, line: ScannedLine) -> LineAnalysisIssue | None:
+        if (line.length - line.stripped_length) > self.max_trailing_whitespaces:
+            return LineAnalysisIssue(
+                line.number,
+                f"Line {line.number} includes more than {self.max_trailing_whitespaces} trailing whitespaces."
+            )
+        return None
\ No newline at end of file
@@ -47,6 +47,86 @@ class CliArgumentParser:
                                  default=True,
                                  help="Set this to false if you dont want the application to exit with an error if "
                                       "issues were found.")
+        self.parser.add_argument("-j", 
+                                 "--jobs",
+                                 type=int,
+                                 default=1,
+                                 help="The number of worker processes used for analyzing the changed files. Use 0 "
+                                      "to use one worker process per CPU core.")
+        self.parser.add_argument("-ro", 
+                                 "--read-only",
+                                 action='store_true',
+                                 help="Specify this option to read the changed files directly from the git object "
+                                      "database. No branch gets checked out or pulled, so the working tree stays "
+                                      "untouched. This also works for bare repositories.")
+        self.parser.add_argument("-c", 
+                                 "--config",
+                                 type=str,
+                                 default=None,
+                                 help="The path to the analysis config. If this is not specified, the config is "
+                                      "searched in the root of the repository, then in the files tracked by git and "
+                                      "finally next to the executable.")
+        self.parser.add_argument("-cd", 
+                                 "--cache-dir",
+                                 type=str,
+                                 default=None,
+                                 help="The directory in which compiled analysis configs and the results of analyzed "
+                                      "files are cached. Defaults to the cache directory of the current user. Keep "
+                                      "this directory between CI jobs to skip analyzing unchanged files.")
+        self.parser.add_argument("-nc", 
+                                 "--no-cache",
+                                 action='store_true',
+                                 help="Specify this option to neither read from nor write to the cache directory.")
+        self.parser.add_argument("-nf", 
+                                 "--no-fetch",
+                                 action='store_true',
+                                 help="Specify this option to skip fetching the branches from the remote. Only the "
+                                      "commits which are already present locally are analyzed. This is useful if the "
+                                      "branches were already fetched, e.g. by a CI runner.")
+        self.parser.add_argument("-rr", 
+                                 "--remote-refs",
+                                 action='store_true',
+                                 help="Specify this option to compare the 'origin/<branch>' refs directly instead of "
+                                      "creating or updating local tracking branches. The source branch is checked out "
+                                      "as a detached head.")
+        self.parser.add_argument("-w", 
+                                 "--watch",
+                                 action='store_true',
+                                 help="Specify this option to keep running and analyze the pull request again "
+                                      "whenever the source or the target branch moves. Only files which changed since "
+                                      "the previous run are analyzed again. The files are read from the git object "
+                                      "database like with --read-only and the branches are never fetched. Press "
+                                      "Ctrl+C to stop watching.")
+        self.parser.add_argument("-f", 
+                                 "--format",
+                                 type=str,
+                                 choices=["markdown", "jsonl"],
+                                 default="markdown",
+                                 help="The format of the results in headless mode. 'markdown' prints a report once "
+                                      "every file is analyzed. 'jsonl' prints one json record per file as soon as it "
+                                      "is analyzed and a summary record at the end. Log messages are written to "
+                                      "stderr, so that stdout only contains the records.")
+        self.parser.add_argument("-d", 
+                                 "--daemon",
+                                 action='store_true',
+                                 help="Specify this option to run as a long-lived daemon, which keeps repositories, "
+                                      "compiled configs and caches loaded. It analyzes the requests of "
+                                      "analysis_client.py, which takes the same options as --headless. This makes "
+                                      "the analysis fast enough for git hooks.")
+        self.parser.add_argument("-so", 
+                                 "--socket",
+                                 type=str,
+                                 default=None,
+                                 help="The path of the unix socket on which the daemon listens. Defaults to a socket "
+                                      "in the runtime directory of the current user.")
+        self.parser.add_argument("-to", 
+                                 "--trace-out",
+                                 type=str,
+                                 default=None,
+                                 help="Write the duration of every stage, file and check of a headless analysis to "
+                                      "this file in the Chrome trace event format, which can be opened in "
+                                      "chrome://tracing or https://ui.perfetto.dev. The slowest files and checks are "
+                                      "logged as well.")
         
-    def get_parsed_arguments(self) -> CliArguments:
-        return CliArguments(self.parser.parse_args())
\ No newline at end of file
+    def get_parsed_arguments(self, arguments: list[str] | None = None) -> CliArguments:
+        return CliArguments(self.parser.parse_args(arguments))
\ No newline at end of file
@@ -0,0 +1,17 @@
+from analysis_config import AnalysisConfig
+from check_factory import CheckFactory
+from checks.check import Check
+from path_matcher import PathMatcher
+
+
+class CompiledAnalysisConfig:
+    # Holds the validated analysis config together with the structures compiled from it. Creating the checks validates 
+    # the config, so a compiled config is always valid.
+    def __init__(self, analysis_config: AnalysisConfig):
+        check_factory = CheckFactory(analysis_config)
+        self.analysis_config: AnalysisConfig = analysis_config
+        self.path_matcher: PathMatcher = PathMatcher(analysis_config)
+        self.standard_checks: tuple[Check, ...] = tuple(check_factory.generate_standard_checks())
+        self.specific_checks: dict[str, tuple[Check, ...]] = {
+            wildcard: tuple(checks) for wildcard, checks in check_factory.generate_specific_checks().items()
+        }
\ No newline at end of file
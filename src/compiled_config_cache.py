@@ -0,0 +1,66 @@
+import hashlib
+import json
+import os
+
+from compiled_analysis_config import CompiledAnalysisConfig
+from config_parser import ConfigParser
+from version import get_cache_version
+
+
+class CompiledConfigCache:
+    # Parsed configs are stored as json files named after the hash of the config content and the tool version. Loading 
+    # such a file skips parsing the json5 config, which takes most of the time, and compiles the patterns and checks 
+    # again. The files only contain plain data, so a manipulated cache directory cannot run code.
+    __loaded_configs: dict[str, CompiledAnalysisConfig] = {}
+    
+    def __init__(self, cache_directory: str):
+        self.cache_directory = os.path.join(cache_directory, "compiled_configs")
+        
+    def load(self, config_content: bytes) -> CompiledAnalysisConfig | None:
+        cache_key = self.__get_cache_key(config_content)
+        compiled_config = CompiledConfigCache.__loaded_configs.get(cache_key)
+        if compiled_config is None:
+            compiled_config = self.__try_load_from_file(self.__get_file_path(cache_key))
+            if compiled_config is not None:
+                CompiledConfigCache.__loaded_configs[cache_key] = compiled_config
+        return compiled_config
+    
+    def store(self, config_content: bytes, compiled_config: CompiledAnalysisConfig):
+        cache_key = self.__get_cache_key(config_content)
+        CompiledConfigCache.__loaded_configs[cache_key] = compiled_config
+        try:
+            self.__write_to_file(self.__get_file_path(cache_key), compiled_config)
+        except (OSError, TypeError, ValueError):
+            # the cache is only an optimization, the analysis works without it
+            pass
+    
+    @staticmethod
+    def clear():
+        # forgets the configs loaded by this process, like a new process, the stored files are kept
+        CompiledConfigCache.__loaded_configs.clear()
+    
+    def __get_cache_key(self, config_content: bytes) -> str:
+        return hashlib.sha256(get_cache_version().encode("utf-8") + b"\0" + config_content).hexdigest()
+    
+    def __get_file_path(self, cache_key: str) -> str:
+        return os.path.join(self.cache_directory, cache_key + ".json")
+    
+    def __try_load_from_file(self, file_path: str) -> CompiledAnalysisConfig | None:
+        try:
+            with open(file_path, "r", encoding="utf-8") as file:
+                config_json = file.read()
+            # the stored config is validated like a config read from the repository
+            return CompiledAnalysisConfig(ConfigParser().load_analysis_config_from_json(config_json))
+        except Exception:
+            # missing, broken or outdated cache files are replaced by a newly compiled config
+            return None
+    
+    def __write_to_file(self, file_path: str, compiled_config: CompiledAnalysisConfig):
+        # the attributes of the analysis config are named like the properties of the config file
+        serialized_config = json.dumps(vars(compiled_config.analysis_config))
+        os.makedirs(self.cache_directory, exist_ok=True)
+        # written to a temporary file first, so that concurrent runs never read a partially written file
+        temporary_file_path = f"{file_path}.{os.getpid()}.tmp"
+        with open(temporary_file_path, "w", encoding="utf-8") as file:
+            file.write(serialized_config)
+        os.replace(temporary_file_path, file_path)
\ No newline at end of file
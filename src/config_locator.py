@@ -0,0 +1,70 @@
+import glob
+import os.path
+
+from git_assistant import GitAssistant
+
+
+class ConfigLocator:
+    CONFIG_FILE_NAME = "analysis_config.json5"
+    # The located configs are shared by all instances, so repeated analyses of the same commit skip the search.
+    __located_config_files: dict[tuple[str, str], str] = {}
+    __located_config_blobs: dict[tuple[str, str], str | None] = {}
+    
+    def __init__(self, git_assistant: GitAssistant):
+        self.__git_assistant = git_assistant
+        self.__analysis_config_name = ConfigLocator.CONFIG_FILE_NAME
+    
+    def find_config_file(self, repository_directory: str) -> str:
+        if not self.__git_assistant.try_reset_repository_directory(repository_directory):
+            return self.__search_config_file_in_directory(repository_directory)
+        head_commit_sha = self.__git_assistant.get_head_commit_sha()
+        cache_key = (repository_directory, head_commit_sha)
+        file_path = ConfigLocator.__located_config_files.get(cache_key)
+        if file_path is None or not os.path.isfile(file_path):
+            file_path = self.__search_config_file_in_repository(repository_directory)
+            if head_commit_sha is not None:
+                ConfigLocator.__located_config_files[cache_key] = file_path
+        return file_path
+    
+    def find_config_blob(self, branch_name: str) -> str | None:
+        commit_sha = self.__git_assistant.get_commit_sha(branch_name)
+        cache_key = (self.__git_assistant.get_repository_directory(), commit_sha)
+        if cache_key not in ConfigLocator.__located_config_blobs:
+            ConfigLocator.__located_config_blobs[cache_key] = self.__search_config_blob(branch_name, commit_sha)
+        return ConfigLocator.__located_config_blobs[cache_key]
+    
+    def find_fallback_config_file(self) -> str:
+        if os.path.isfile(self.__analysis_config_name):
+            return self.__analysis_config_name
+        raise FileNotFoundError(f"File not found: '{self.__analysis_config_name}'. Please put that file in the "
+                                f"repository to be analyzed or next to the executable of the static code analysis "
+                                f"tool.")
+    
+    def __search_config_file_in_repository(self, repository_directory: str) -> str:
+        # The root of the repository is checked first. Otherwise, the index is searched, which contains only the 
+        # tracked files, so build outputs and the '.git' directory are never visited.
+        root_file_path = os.path.join(repository_directory, self.__analysis_config_name)
+        if os.path.isfile(root_file_path):
+            return root_file_path
+        matching_file_paths = self.__git_assistant.find_tracked_files(self.__analysis_config_name)
+        return self.__select_single_match(matching_file_paths, repository_directory) or \
+            self.find_fallback_config_file()
+    
+    def __search_config_file_in_directory(self, search_directory: str) -> str:
+        matching_file_paths = glob.glob(f"{search_directory}/**/{self.__analysis_config_name}", recursive=True)
+        return self.__select_single_match(matching_file_paths, search_directory) or self.find_fallback_config_file()
+    
+    def __search_config_blob(self, branch_name: str, commit_sha: str) -> str | None:
+        root_blob_sha = self.__git_assistant.get_blob_sha_of_file(commit_sha, self.__analysis_config_name)
+        if root_blob_sha is not None:
+            return root_blob_sha
+        matching_blob_shas = self.__git_assistant.find_files_in_branch(commit_sha, self.__analysis_config_name)
+        return self.__select_single_match(matching_blob_shas, branch_name)
+    
+    def __select_single_match(self, matches: list[str], search_location: str) -> str | None:
+        if len(matches) > 1:
+            raise Exception(f"Multiple analysis configs found in '{search_location}'. Please make sure that there is "
+                            f"only one '{self.__analysis_config_name}' present.")
+        elif len(matches) == 1:
+            return matches[0]
+        return None
\ No newline at end of file
@@ -18,6 +18,13 @@ class ConfigParser:
         with open(file_path, 'r', encoding='utf-8') as file:
             json_root = json5.load(file)
             return self.__parse_analysis_config(json_root)
+        
+    def load_analysis_config_from_text(self, config_text: str) -> AnalysisConfig:
+        return self.__parse_analysis_config(json5.loads(config_text))
+    
+    def load_analysis_config_from_json(self, config_json: str) -> AnalysisConfig:
+        # plain json is parsed much faster than json5, e.g. the configs stored by the compiled config cache
+        return self.__parse_analysis_config(json.loads(config_json))
 
     def __parse_analysis_config(self, json_root: dict[str, object]) -> AnalysisConfig:
         forbidden_files = self.__parse_file_wildcard_list(json_root, 'forbidden_files')
@@ -25,7 +32,9 @@ class ConfigParser:
         file_encodings = self.__parse_file_encodings(json_root)
         standard_checks = self.__parse_standard_checks(json_root)
         specific_checks = self.__parse_specific_checks(json_root)
-        return AnalysisConfig(forbidden_files, ignored_files, file_encodings, standard_checks, specific_checks)
+        binary_files = self.__parse_binary_files(json_root)
+        return AnalysisConfig(forbidden_files, ignored_files, file_encodings, standard_checks, specific_checks, 
+                              binary_files)
     
     def __parse_file_wildcard_list(self, json_root: dict[str, object], property_name: str) -> list[str]:
         file_wildcards = json_root.get(property_name, [])
@@ -59,6 +68,12 @@ class ConfigParser:
             if not isinstance(value, dict):
                 raise ValueError("Every value in 'specific_checks' must be an object.")
         return specific_checks
+    
+    def __parse_binary_files(self, json_root: dict[str, object]) -> str:
+        binary_files = json_root.get('binary_files', 'report')
+        if binary_files not in ('report', 'ignore'):
+            raise ValueError("The property 'binary_files' must be either 'report' or 'ignore'.")
+        return binary_files
        
     #endregion analysis_config
     
@@ -95,11 +110,40 @@ class ConfigParser:
                 "changed_lines_only",
                 bool
             )
-            return AnalysisArguments(repository_directory, source_branch, destination_branch, changed_lines_only)
+            jobs = self.__load_optional_property_from_json_object(
+                json_root,
+                "jobs",
+                int,
+                1
+            )
+            read_only = self.__load_optional_property_from_json_object(
+                json_root,
+                "read_only",
+                bool,
+                False
+            )
+            watch = self.__load_optional_property_from_json_object(
+                json_root,
+                "watch",
+                bool,
+                False
+            )
+            return AnalysisArguments(repository_directory, source_branch, destination_branch, changed_lines_only, jobs, 
+                                     read_only, watch=watch)
     
     def store_analysis_arguments(self, analysis_arguments: AnalysisArguments):
+        # only the arguments which are loaded again are stored, the others are given on the command line
+        json_root = {
+            "repository_directory": analysis_arguments.repository_directory,
+            "source_branch": analysis_arguments.source_branch,
+            "destination_branch": analysis_arguments.destination_branch,
+            "changed_lines_only": analysis_arguments.changed_lines_only,
+            "jobs": analysis_arguments.jobs,
+            "read_only": analysis_arguments.read_only,
+            "watch": analysis_arguments.watch
+        }
         with open(self.analysis_arguments_file_path, 'w', encoding='utf-8') as file:
-            file.write(json.dumps(analysis_arguments.__dict__))
+            file.write(json.dumps(json_root))
     
     #endregion analysis_arguments
     
@@ -112,4 +156,13 @@ class ConfigParser:
         property_value = json_object.get(property_name, None)
         if not isinstance(property_value, property_type):
             raise ValueError(f"The property '{property_name}' must be a string.")
-        return property_value
\ No newline at end of file
+        return property_value
+    
+    def __load_optional_property_from_json_object(self, 
+                                                  json_object: dict[str, object], 
+                                                  property_name: str, 
+                                                  property_type: type,
+                                                  default_value: object) -> object:
+        if property_name not in json_object:
+            return default_value
+        return self.__load_property_from_json_object(json_object, property_name, property_type)
\ No newline at end of file
@@ -0,0 +1,48 @@
+import re
+
+from models.line_ranges import LineRanges
+
+
+class DiffParser:
+    # Every relevant line of a diff is identified by its first character: '@' for hunk headers, '+' for added lines and 
+    # ' ' for context lines. Consecutive added or context lines are matched as one block, so the regex engine walks 
+    # the diff without creating a string per line. Removed lines and lines starting with '+++' do not change the line 
+    # number of the new file and are skipped.
+    __hunk_pattern = r'@@ -\d+(?:,\d+)? \+(?P<hunk_start>\d+)(?:,\d+)? @@'
+    __added_lines_pattern = r'(?P<added_lines>(?:\+(?!\+\+)[^\n]*(?:\n|\Z))+)'
+    __context_lines_pattern = r'(?P<context_lines>(?: [^\n]*(?:\n|\Z))+)'
+    __text_pattern = re.compile(f"^(?:{__hunk_pattern}|{__added_lines_pattern}|{__context_lines_pattern})", re.M)
+    __binary_pattern = re.compile(__text_pattern.pattern.encode("ascii"), re.M)
+    
+    @staticmethod
+    def parse_added_line_ranges(diff: str | bytes | memoryview) -> LineRanges:
+        if isinstance(diff, str):
+            pattern = DiffParser.__text_pattern
+            new_line = "\n"
+        else:
+            pattern = DiffParser.__binary_pattern
+            new_line = b"\n"
+        added_line_ranges = LineRanges()
+        current_line_number = None
+        for match in pattern.finditer(diff):
+            hunk_start = match.group("hunk_start")
+            if hunk_start is not None:
+                # reset line number when new hunk was found
+                current_line_number = int(hunk_start)
+            elif current_line_number is not None:
+                number_of_lines = DiffParser.__count_lines(diff, match, new_line)
+                if match.start("added_lines") != -1:
+                    added_line_ranges.add_range(current_line_number, current_line_number + number_of_lines)
+                current_line_number += number_of_lines
+        return added_line_ranges
+    
+    @staticmethod
+    def __count_lines(diff: str | bytes | memoryview, match: re.Match, new_line: str | bytes) -> int:
+        if isinstance(diff, memoryview):
+            line_breaks = match.group(0).count(new_line)
+        else:
+            line_breaks = diff.count(new_line, match.start(), match.end())
+        if diff[match.end() - 1:match.end()] == new_line:
+            return line_breaks
+        # the last line of the diff is not terminated by a line break
+        return line_breaks + 1
\ No newline at end of file
@@ -0,0 +1,114 @@
+import re
+from typing import Iterable, Iterator
+
+from models.file_patch import FilePatch
+
+
+class DiffStreamReader:
+    # Parses the output of 'git diff-tree -p' line by line. Only the patch of the current file is kept in memory, so a 
+    # file patch is yielded as soon as the header of the next file has been read.
+    __diff_header = b"diff --git "
+    __index_pattern = re.compile(rb"^index [0-9a-f]+\.\.(?P<b_blob_sha>[0-9a-f]+)")
+    __null_sha_pattern = re.compile(r"^0+$")
+    __escape_sequences = {ord("a"): 7, ord("b"): 8, ord("t"): 9, ord("n"): 10, ord("v"): 11, ord("f"): 12, 
+                          ord("r"): 13, ord('"'): 34, ord("\\"): 92}
+    
+    @staticmethod
+    def read_file_patches(lines: Iterable[bytes]) -> Iterator[FilePatch]:
+        header_lines: list[bytes] | None = None
+        body_lines: list[bytes] = []
+        for line in lines:
+            if line.startswith(DiffStreamReader.__diff_header):
+                if header_lines is not None:
+                    yield DiffStreamReader.__create_file_patch(header_lines, body_lines)
+                header_lines = [line]
+                body_lines = []
+            elif header_lines is None:
+                continue
+            elif body_lines or line.startswith(b"@@") or line.startswith(b"Binary files "):
+                body_lines.append(line)
+            else:
+                header_lines.append(line)
+        if header_lines is not None:
+            yield DiffStreamReader.__create_file_patch(header_lines, body_lines)
+    
+    @staticmethod
+    def __create_file_patch(header_lines: list[bytes], body_lines: list[bytes]) -> FilePatch:
+        a_path = None
+        b_path = None
+        new_file = False
+        deleted_file = False
+        renamed_file = False
+        b_blob_sha = None
+        for line in header_lines[1:]:
+            line = line.rstrip(b"\n")
+            if line.startswith(b"--- "):
+                a_path = DiffStreamReader.__parse_path(line[4:], b"a/")
+            elif line.startswith(b"+++ "):
+                b_path = DiffStreamReader.__parse_path(line[4:], b"b/")
+            elif line.startswith(b"rename to "):
+                renamed_file = True
+                b_path = DiffStreamReader.__unquote_path(line[10:])
+            elif line.startswith(b"rename from "):
+                renamed_file = True
+                a_path = DiffStreamReader.__unquote_path(line[12:])
+            elif line.startswith(b"new file mode "):
+                new_file = True
+            elif line.startswith(b"deleted file mode "):
+                deleted_file = True
+            else:
+                index_match = DiffStreamReader.__index_pattern.match(line)
+                if index_match is not None:
+                    b_blob_sha = index_match.group("b_blob_sha").decode("ascii")
+        if deleted_file:
+            b_path = None
+            b_blob_sha = None
+        elif b_path is None:
+            # binary files and mode changes have no '---' and '+++' lines
+            fallback_a_path, b_path = DiffStreamReader.__parse_paths_of_diff_header(header_lines[0])
+            if not new_file and a_path is None:
+                a_path = fallback_a_path
+        if b_blob_sha is not None and DiffStreamReader.__null_sha_pattern.match(b_blob_sha):
+            b_blob_sha = None
+        return FilePatch(a_path, b_path, new_file, deleted_file, renamed_file, b_blob_sha, b"".join(body_lines))
+    
+    @staticmethod
+    def __parse_path(path: bytes, prefix: bytes) -> str | None:
+        # git appends a tab to paths containing spaces
+        path = path.rstrip(b"\t")
+        if path == b"/dev/null":
+            return None
+        return DiffStreamReader.__unquote_path(path)[len(prefix):]
+    
+    @staticmethod
+    def __parse_paths_of_diff_header(header_line: bytes) -> tuple[str, str]:
+        paths = header_line[len(DiffStreamReader.__diff_header):].rstrip(b"\n")
+        if paths.endswith(b'"'):
+            separator = paths.rindex(b' "')
+        else:
+            # without a rename both paths are equal: 'a/<path> b/<path>'
+            separator = len(paths) // 2
+        a_path = DiffStreamReader.__unquote_path(paths[:separator])[2:]
+        b_path = DiffStreamReader.__unquote_path(paths[separator + 1:])[2:]
+        return a_path, b_path
+
+    @staticmethod
+    def __unquote_path(path: bytes) -> str:
+        if not (path.startswith(b'"') and path.endswith(b'"')):
+            return path.decode("utf-8", errors="surrogateescape")
+        # git quotes paths with special characters like a C string and escapes non-ascii bytes as octal numbers
+        quoted_path = path[1:-1]
+        unquoted_path = bytearray()
+        i = 0
+        while i < len(quoted_path):
+            character = quoted_path[i]
+            if character != ord("\\"):
+                unquoted_path.append(character)
+                i += 1
+            elif quoted_path[i + 1:i + 2].isdigit():
+                unquoted_path.append(int(quoted_path[i + 1:i + 4], 8))
+                i += 4
+            else:
+                unquoted_path.append(DiffStreamReader.__escape_sequences.get(quoted_path[i + 1], quoted_path[i + 1]))
+                i += 2
+        return unquoted_path.decode("utf-8", errors="surrogateescape")
\ No newline at end of file
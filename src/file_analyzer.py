@@ -1,137 +1,322 @@
-import re
+import hashlib
+import io
+import json
+import mmap
+import os
+import time
+from contextlib import contextmanager
+from typing import Iterator, Sequence
 
 from analysis_config import AnalysisConfig
 from analysis_exception import AnalysisException
-from check_factory import CheckFactory
+from binary_file_detector import BinaryFileDetector
+from blob_reader import BlobReader
+from compiled_analysis_config import CompiledAnalysisConfig
+from checks.buffer_check import BufferCheck
 from checks.check import Check
+from checks.line_check import LineCheck
+from checks.regex_check import RegexCheck
+from diff_parser import DiffParser
+from fused_line_scanner import FusedLineScanner
 from models.changed_file import ChangedFile
 from models.changed_line import ChangedLine
+from models.changed_lines_buffer import ChangedLinesBuffer
+from models.lazy_lines import LazyLines
 from models.file_analysis_result import FileAnalysisResult
 from models.line_analysis_issue import LineAnalysisIssue
+from models.line_ranges import LineRanges
 from models.loaded_file import LoadedFile
+from models.path_match import PathMatch
+from null_tracer import NullTracer
+from path_matcher import PathMatcher
+from result_cache import ResultCache
+from tracer import Tracer
+from version import get_cache_version
 
 
 class FileAnalyzer:
-    def __init__(self, analysis_config: AnalysisConfig, repository_directory: str) -> None:
-        self.analysis_config = analysis_config
-        self.check_factory: CheckFactory = CheckFactory(analysis_config)
+    def __init__(self, 
+                 compiled_config: CompiledAnalysisConfig, 
+                 repository_directory: str, 
+                 result_cache: ResultCache | None = None, 
+                 tracer: Tracer | None = None, 
+                 blob_reader: BlobReader | None = None) -> None:
+        self.analysis_config: AnalysisConfig = compiled_config.analysis_config
+        self.path_matcher: PathMatcher = compiled_config.path_matcher
         self.repository_directory = repository_directory
-        self.hunk_pattern = r'@@ -(\d+)(?:,(\d+))? \+(\d+)(?:,(\d+))? @@'
+        self.blob_reader: BlobReader = blob_reader if blob_reader is not None else BlobReader(repository_directory)
+        self.standard_checks: tuple[Check, ...] = compiled_config.standard_checks
+        self.specific_checks: dict[str, tuple[Check, ...]] = compiled_config.specific_checks
+        # The check plans are keyed by the matching specific check patterns. Every file of the same kind shares the 
+        # same check instances.
+        self.check_plans: dict[tuple[str, ...], tuple[Check, ...]] = {}
+        self.result_cache: ResultCache | None = result_cache
+        self.check_plan_hashes: dict[tuple[tuple[str, ...], str], str] = {}
+        self.tracer: Tracer = tracer if tracer is not None else NullTracer()
+    
+    def try_analyze_changed_file(self, changed_file: ChangedFile) -> FileAnalysisResult:
+        start_time = time.perf_counter()
+        with self.tracer.span(changed_file.get_relative_path(self.repository_directory), "file") as span:
+            try:
+                result = self.analyze_changed_file(changed_file)
+            except AnalysisException as analysis_exception:
+                result = FileAnalysisResult(changed_file.get_relative_path(self.repository_directory))
+                result.issues.append(LineAnalysisIssue(0, str(analysis_exception)))
+            span.set_attribute("issues", len(result.issues))
+        result.analysis_time_in_seconds = time.perf_counter() - start_time
+        return result
     
     def analyze_changed_file(self, changed_file: ChangedFile) -> FileAnalysisResult:
-        self.__check_file_exclusion(changed_file)
-        if self.__is_file_ignored(changed_file):
+        path_match = self.path_matcher.match(changed_file.file_path)
+        self.__check_file_exclusion(path_match)
+        if path_match.is_ignored:
             return FileAnalysisResult(changed_file.get_relative_path(self.repository_directory))
-        file_encoding = self.__get_encoding_for_file(changed_file)
-        loaded_file = self.__try_load_changed_file(changed_file, file_encoding)
-        return self.__analyze_loaded_file(loaded_file)
+        file_encoding = self.__get_encoding_for_file(path_match)
+        if BinaryFileDetector.is_binary_diff(changed_file.diff):
+            # the content is only read to classify the file, git cannot tell text files in UTF-16 from binary files and 
+            # their diff is reported as an error below
+            with self.__open_content(changed_file) as content:
+                if BinaryFileDetector.is_binary_content(content, file_encoding, has_binary_diff=True):
+                    return self.__get_binary_file_result(changed_file)
+        added_line_ranges = self.__get_added_line_ranges(changed_file)
+        if self.result_cache is None:
+            return self.__load_and_analyze_changed_file(changed_file, path_match, file_encoding, added_line_ranges)
+        return self.__analyze_changed_file_with_cache(changed_file, path_match, file_encoding, added_line_ranges)
+    
+    def __analyze_changed_file_with_cache(self, 
+                                          changed_file: ChangedFile, 
+                                          path_match: PathMatch, 
+                                          file_encoding: str, 
+                                          added_line_ranges: LineRanges | None) -> FileAnalysisResult:
+        # The blob hash of files read from the git object database is already known. Other files are hashed like git 
+        # does, which is much faster than checking them.
+        blob_sha = changed_file.blob_sha
+        if blob_sha is None:
+            with self.__open_content(changed_file) as content:
+                blob_sha = self.__get_blob_sha(content)
+        cache_key = self.__get_cache_key(blob_sha, added_line_ranges, path_match, file_encoding)
+        cached_result = self.result_cache.get(cache_key)
+        self.tracer.set_attribute("cached", cached_result is not None)
+        if cached_result is not None:
+            result = FileAnalysisResult(changed_file.get_relative_path(self.repository_directory))
+            result.issues, result.pattern_hits = cached_result
+            return result
+        result = self.__load_and_analyze_changed_file(changed_file, path_match, file_encoding, added_line_ranges)
+        self.result_cache.put(cache_key, result.issues, result.pattern_hits)
+        return result
+    
+    def __load_and_analyze_changed_file(self, 
+                                        changed_file: ChangedFile, 
+                                        path_match: PathMatch, 
+                                        file_encoding: str, 
+                                        added_line_ranges: LineRanges | None) -> FileAnalysisResult:
+        with self.__open_content(changed_file) as content:
+            self.tracer.set_attribute("bytes", len(content))
+            if BinaryFileDetector.is_binary_content(content, file_encoding):
+                return self.__get_binary_file_result(changed_file)
+            if added_line_ranges is not None and LazyLines.can_index(content, file_encoding):
+                # only the changed lines and the lines requested by the checks are decoded, while the file is mapped
+                with self.tracer.span("decode", "decode"):
+                    all_lines = LazyLines(content, file_encoding)
+                    loaded_file = LoadedFile(changed_file, file_encoding, all_lines, 
+                                             self.filter_changed_lines(all_lines, added_line_ranges))
+                return self.__analyze_loaded_file(loaded_file, path_match)
+            with self.tracer.span("decode", "decode"):
+                loaded_file = self.__try_load_changed_file(changed_file, content, file_encoding, added_line_ranges)
+        # the decoded lines are all that is needed from here on, so the raw content is released before the checks run
+        return self.__analyze_loaded_file(loaded_file, path_match)
     
-    def __check_file_exclusion(self, changed_file: ChangedFile):
-        if self.__is_file_forbidden_in_diff(changed_file):
+    def __check_file_exclusion(self, path_match: PathMatch):
+        if path_match.is_forbidden:
             raise AnalysisException(f"The file does not belong into a git repository! Please add it to the .gitignore "
                                     f"or upload it to a proper file sharing service instead!")
     
-    def __is_file_forbidden_in_diff(self, changed_file: ChangedFile) -> bool:
-        for file_pattern in self.analysis_config.forbidden_files:
-            if changed_file.matches_git_pattern(file_pattern):
-                return True
-        return False
-    
-    def __is_file_ignored(self, changed_file: ChangedFile) -> bool:
-        for file_pattern in self.analysis_config.ignored_files:
-            if changed_file.matches_git_pattern(file_pattern):
-                return True
-        return False
-    
-    def __get_encoding_for_file(self, changed_file: ChangedFile) -> str:
-        for file_pattern, encoding in self.analysis_config.file_encodings.items():
-            if changed_file.matches_git_pattern(file_pattern):
-                return encoding
-        return "utf-8"
-    
-    def __try_load_changed_file(self, changed_file: ChangedFile, file_encoding: str) -> LoadedFile:
+    def __get_binary_file_result(self, changed_file: ChangedFile) -> FileAnalysisResult:
+        # binary files are never decoded, every line would be reported by the replacement character check otherwise
+        result = FileAnalysisResult(changed_file.get_relative_path(self.repository_directory))
+        if self.analysis_config.binary_files == "report":
+            result.issues.append(LineAnalysisIssue(0, "The file is binary and cannot be analyzed. Please add it to the "
+                                                      "ignored or forbidden files of the analysis config!"))
+        return result
+    
+    def __get_encoding_for_file(self, path_match: PathMatch) -> str:
+        if path_match.file_encoding is None:
+            return "utf-8"
+        return path_match.file_encoding
+    
+    def __get_added_line_ranges(self, changed_file: ChangedFile) -> LineRanges | None:
+        # None means that every line of the file is analyzed
+        if changed_file.check_entire_file and changed_file.diff is None:
+            return None
+        return self.__get_numbers_of_changed_lines(changed_file.diff)
+    
+    @contextmanager
+    def __open_content(self, changed_file: ChangedFile) -> Iterator[bytes | mmap.mmap]:
+        if changed_file.blob_sha is not None:
+            yield self.blob_reader.read_blob(changed_file.blob_sha)
+            return
+        with open(changed_file.file_path, "rb") as fp:
+            if os.fstat(fp.fileno()).st_size == 0:
+                # empty files cannot be mapped
+                yield b""
+                return
+            # the pages of the file are only read, when the lines on them are accessed
+            with mmap.mmap(fp.fileno(), 0, access=mmap.ACCESS_READ) as content:
+                yield content
+    
+    def __try_load_changed_file(self, 
+                                changed_file: ChangedFile, 
+                                content: bytes | mmap.mmap, 
+                                file_encoding: str, 
+                                added_line_ranges: LineRanges | None) -> LoadedFile:
         try:
-            return self.__load_changed_file(changed_file, file_encoding)
+            return self.__load_changed_file(changed_file, content, file_encoding, added_line_ranges)
         except UnicodeDecodeError:
             raise AnalysisException(f"The file is not saved with the correct encoding. The expected encoding is "
                                     f"'{file_encoding}'.")
     
-    def __load_changed_file(self, changed_file: ChangedFile, file_encoding: str) -> LoadedFile:
-        all_lines = self.__read_changed_file(changed_file.file_path, file_encoding)
-        if changed_file.check_entire_file and changed_file.diff is None:
+    def __load_changed_file(self, 
+                            changed_file: ChangedFile, 
+                            content: bytes | mmap.mmap, 
+                            file_encoding: str, 
+                            added_line_ranges: LineRanges | None) -> LoadedFile:
+        # the content is decoded exactly like a file opened in text mode
+        with io.TextIOWrapper(io.BytesIO(content), encoding=file_encoding, errors="replace") as fp:
+            all_lines = fp.readlines()
+        if added_line_ranges is None:
             changed_lines = [ChangedLine(i, line) for i, line in enumerate(all_lines, 1)]
         else:
-            numbers_of_added_lines = self.__get_numbers_of_changed_lines(changed_file.diff)
-            changed_lines = self.__filter_changed_lines(all_lines, numbers_of_added_lines)
+            changed_lines = self.filter_changed_lines(all_lines, added_line_ranges)
         return LoadedFile(changed_file, file_encoding, all_lines, changed_lines)
     
-    def __read_changed_file(self, file_path: str, file_encoding: str) -> list[str]:
-        with open(file_path, "r", encoding=file_encoding, errors="replace") as fp:
-            return fp.readlines()
+    def __get_numbers_of_changed_lines(self, diff: bytes | None) -> LineRanges:
+        if diff is None:
+            return LineRanges()
+        if diff.startswith(b"Binary files") and diff.endswith(b"differ\n"):
+            git_output = diff.decode("utf-8", errors="replace")
+            raise AnalysisException(f"Could not determine diff of binary file. Output from git: '{git_output}'")
+        return DiffParser.parse_added_line_ranges(diff)
         
-    def __get_numbers_of_changed_lines(self, diff_text: str | None) -> list[int]:
-        if diff_text is None:
-            return []
-        if diff_text.startswith("Binary files") and diff_text.endswith("differ\n"):
-            raise AnalysisException(f"Could not determine diff of binary file. Output from git: '{diff_text}'")
-        if not diff_text.startswith("@@") and diff_text.startswith("Binary files") and diff_text.endswith("differ\n"):
-            raise UnicodeDecodeError("utf-8", diff_text.encode("utf-8"), 0, 2, 
-                                     "Could not properly decode output of 'git diff-tree'. The decoded string does "
-                                     "not start with '@@'.")
-        return self.__parse_diff_to_changed_line_numbers(diff_text)
-    
-    def __parse_diff_to_changed_line_numbers(self, diff_text: str) -> list[int]:
-        lines = diff_text.split('\n')
+    @staticmethod
+    def filter_changed_lines(lines: Sequence[str], added_line_ranges: LineRanges) -> list[ChangedLine]:
         changed_lines = []
-        current_line_num = None
-        for line in lines:
-            current_line_num = self.__process_next_line(current_line_num, line, changed_lines)
+        for start, end in added_line_ranges.get_ranges():
+            # only the changed lines are visited, line numbers start at 1
+            start = max(start, 1)
+            changed_lines += [ChangedLine(i, line) for i, line in enumerate(lines[start - 1:end - 1], start)]
         return changed_lines
     
-    def __process_next_line(self, current_line_number: int, next_line: str, changed_lines: list[int]) -> int | None:
-        hunk_match = re.match(self.hunk_pattern, next_line)
-        if hunk_match:
-            # reset line number when new hunk was found
-            return int(hunk_match.group(3))
-        elif current_line_number is not None:
-            if next_line.startswith('+') and not next_line.startswith('+++'):
-                # Added line
-                changed_lines.append(current_line_number)
-                return current_line_number + 1
-            elif next_line.startswith('-') and not next_line.startswith('---'):
-                # Deleted line (don't increment line number)
-                return current_line_number
-            elif next_line.startswith(' '):
-                # Context line (unchanged)
-                return current_line_number + 1
-        return current_line_number
-            
-    def __filter_changed_lines(self, lines: list[str], numbers_of_added_lines: list[int]) -> list[ChangedLine]:
-        return [ChangedLine(i, line) for i, line in enumerate(lines, 1) if i in numbers_of_added_lines]
-    
-    def __analyze_loaded_file(self, loaded_file: LoadedFile) -> FileAnalysisResult:
-        checks = self.__load_checks_for_file(loaded_file)
+    def __analyze_loaded_file(self, loaded_file: LoadedFile, path_match: PathMatch) -> FileAnalysisResult:
+        checks = self.__get_check_plan(path_match)
         return self.__perform_checks_on_loaded_file(loaded_file, checks)
 
-    def __perform_checks_on_loaded_file(self, loaded_file: LoadedFile, checks: list[Check]) -> FileAnalysisResult:
+    def __perform_checks_on_loaded_file(self, loaded_file: LoadedFile, checks: tuple[Check, ...]) \
+            -> FileAnalysisResult:
         result = FileAnalysisResult(loaded_file.get_relative_path(self.repository_directory))
+        self.tracer.set_attribute("lines", len(loaded_file.changed_lines))
+        line_checks = [check for check in checks if isinstance(check, LineCheck)]
+        issues_of_line_checks = iter(self.__scan_line_checks(loaded_file, line_checks))
+        # the changed lines are joined once and searched by every buffer check
+        buffer = None
         for check in checks:
-            issues = check.execute_on_changed_file(loaded_file)
-            result.issues += self.__compress_issues(issues)
+            if isinstance(check, LineCheck):
+                issue_groups = [(check.name, next(issues_of_line_checks))]
+            else:
+                with self.tracer.span(type(check).__name__, "check") as span:
+                    if isinstance(check, BufferCheck):
+                        if buffer is None:
+                            buffer = ChangedLinesBuffer(loaded_file.changed_lines)
+                        if isinstance(check, RegexCheck):
+                            issue_groups = self.__execute_regex_check(check, buffer, result)
+                        else:
+                            issue_groups = [(check.name, check.execute_on_buffer(buffer))]
+                    else:
+                        issue_groups = [(check.name, check.execute_on_changed_file(loaded_file))]
+                    span.set_attribute("issues", sum(len(issues) for _, issues in issue_groups))
+            for check_name, issues in issue_groups:
+                result.issues += self.__compress_issues(issues, check_name)
         return result
     
-    def __compress_issues(self, issues: list[LineAnalysisIssue]) -> list[LineAnalysisIssue]:
+    def __scan_line_checks(self, loaded_file: LoadedFile, line_checks: list[LineCheck]) \
+            -> list[list[LineAnalysisIssue]]:
+        if len(line_checks) == 0:
+            return []
+        # the line checks are executed together in a single pass, so they are traced as a single span
+        with self.tracer.span("+".join(type(check).__name__ for check in line_checks), "check") as span:
+            issues_of_line_checks = FusedLineScanner.scan(loaded_file, line_checks)
+            span.set_attribute("issues", sum(len(issues) for issues in issues_of_line_checks))
+        return issues_of_line_checks
+    
+    def __execute_regex_check(self, 
+                              regex_check: RegexCheck, 
+                              buffer: ChangedLinesBuffer, 
+                              result: FileAnalysisResult) -> list[tuple[str, list[LineAnalysisIssue]]]:
+        # the issues of every pattern are counted and compressed on their own
+        issues_per_pattern = regex_check.find_issues_per_pattern(buffer)
+        for pattern, issues in zip(regex_check.patterns, issues_per_pattern):
+            if len(issues) > 0:
+                result.pattern_hits[pattern.name] = result.pattern_hits.get(pattern.name, 0) + len(issues)
+        return [(f"{regex_check.name}:{pattern.name}", issues) 
+                for pattern, issues in zip(regex_check.patterns, issues_per_pattern)]
+    
+    def __compress_issues(self, issues: list[LineAnalysisIssue], check_name: str) -> list[LineAnalysisIssue]:
         if len(issues) <= 3:
+            # the checks do not know their names, so the few remaining issues are labeled here
+            for issue in issues:
+                issue.check_name = check_name
             return issues
         else:
             return [LineAnalysisIssue(issues[0].line_number, 
                                       f"The following issue was found multiple times between line "
                                       f"{issues[0].line_number} and {issues[-1].line_number}: "
-                                      f"{issues[0].issue_description}")]
+                                      f"{issues[0].issue_description}", 
+                                      check_name)]
             
-    def __load_checks_for_file(self, loaded_file: LoadedFile) -> list[Check]:
-        checks = self.check_factory.generate_checks(self.analysis_config.standard_checks)
-        for wildcard, check_definitions in self.analysis_config.specific_checks.items():
-            if loaded_file.matches_git_pattern(wildcard):
-                checks += self.check_factory.generate_checks(check_definitions)
-        return checks
\ No newline at end of file
+    def __get_check_plan(self, path_match: PathMatch) -> tuple[Check, ...]:
+        check_plan = self.check_plans.get(path_match.specific_check_patterns)
+        if check_plan is None:
+            check_plan = self.standard_checks
+            for wildcard in path_match.specific_check_patterns:
+                check_plan += self.specific_checks[wildcard]
+            check_plan = self.__combine_regex_checks(check_plan)
+            self.check_plans[path_match.specific_check_patterns] = check_plan
+        return check_plan
+    
+    def __combine_regex_checks(self, checks: tuple[Check, ...]) -> tuple[Check, ...]:
+        regex_checks = [check for check in checks if isinstance(check, RegexCheck)]
+        if len(regex_checks) <= 1:
+            return checks
+        other_checks = tuple(check for check in checks if not isinstance(check, RegexCheck))
+        return other_checks + (RegexCheck.combine(regex_checks),)
+    
+    def __get_blob_sha(self, content: bytes | mmap.mmap) -> str:
+        blob_hash = hashlib.sha1(b"blob %d\0" % len(content))
+        blob_hash.update(content)
+        return blob_hash.hexdigest()
+    
+    def __get_cache_key(self, 
+                        blob_sha: str, 
+                        added_line_ranges: LineRanges | None, 
+                        path_match: PathMatch, 
+                        file_encoding: str) -> str:
+        if added_line_ranges is None:
+            analyzed_lines = "all"
+        else:
+            analyzed_lines = ",".join(f"{start}-{end}" for start, end in added_line_ranges.get_ranges())
+        check_plan_hash = self.__get_check_plan_hash(path_match, file_encoding)
+        cache_key = f"{get_cache_version()}|{blob_sha}|{analyzed_lines}|{check_plan_hash}"
+        return hashlib.sha256(cache_key.encode("utf-8")).hexdigest()
+    
+    def __get_check_plan_hash(self, path_match: PathMatch, file_encoding: str) -> str:
+        plan_key = (path_match.specific_check_patterns, file_encoding)
+        check_plan_hash = self.check_plan_hashes.get(plan_key)
+        if check_plan_hash is None:
+            # the check plan is identified by the settings of its checks, which are plain json values
+            check_settings = [self.analysis_config.standard_checks] + [
+                self.analysis_config.specific_checks[wildcard] for wildcard in path_match.specific_check_patterns
+            ]
+            plan_description = json.dumps([file_encoding, self.analysis_config.binary_files, check_settings], 
+                                          sort_keys=True)
+            check_plan_hash = hashlib.sha256(plan_description.encode("utf-8")).hexdigest()
+            self.check_plan_hashes[plan_key] = check_plan_hash
+        return check_plan_hash
\ No newline at end of file
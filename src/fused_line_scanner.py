@@ -0,0 +1,23 @@
+from checks.line_check import LineCheck
+from models.line_analysis_issue import LineAnalysisIssue
+from models.loaded_file import LoadedFile
+from models.scanned_line import ScannedLine
+
+
+class FusedLineScanner:
+    @staticmethod
+    def scan(loaded_file: LoadedFile, line_checks: list[LineCheck]) -> list[list[LineAnalysisIssue]]:
+        issues_per_check = [[] for _ in line_checks]
+        if len(line_checks) == 0:
+            # e.g. files with only buffer checks
+            return issues_per_check
+        checks_with_issues = [(line_check.check_line, issues.append) 
+                              for line_check, issues in zip(line_checks, issues_per_check)]
+        scanned_line = ScannedLine()
+        for changed_line in loaded_file.changed_lines:
+            scanned_line.update(changed_line)
+            for check_line, add_issue in checks_with_issues:
+                issue = check_line(scanned_line)
+                if issue is not None:
+                    add_issue(issue)
+        return issues_per_check
\ No newline at end of file
@@ -1,19 +1,30 @@
 import os
+from typing import Callable, IO, Iterable, Iterator
 
-from git import DiffIndex, Diff, Repo, InvalidGitRepositoryError, Remote
+from git import Head, Repo, InvalidGitRepositoryError
 
+from diff_stream_reader import DiffStreamReader
 from models.changed_file import ChangedFile
+from models.file_patch import FilePatch
+from null_tracer import NullTracer
+from tracer import Tracer
 
 
 class GitAssistant:
     def __init__(self, repo_directory: str):
         self.repo: Repo | None = None
+        # the path the repository was opened with, resolved like every other path which is compared with it
+        self.__repo_path: str | None = None
         if not self.__try_set_git_repository(repo_directory):
             found_repo_directory = self.__find_git_directory()
             self.__try_set_git_repository(found_repo_directory)
         
     def reset_repository_directory(self, repo_directory: str):
-        self.repo = Repo(repo_directory)
+        if not self.__is_opened(repo_directory):
+            self.__open_repository(repo_directory)
+    
+    def try_reset_repository_directory(self, repo_directory: str) -> bool:
+        return self.__try_set_git_repository(repo_directory)
     
     def get_local_branches(self):
         if self.repo is None:
@@ -28,17 +39,107 @@ class GitAssistant:
     def get_repository_directory(self) -> str:
         return self.repo.working_dir
 
-    def get_changes_of_pull_request(self, source_branch: str, target_branch: str, changed_lines_only: bool) \
-            -> list[ChangedFile]:
+    def get_changes_of_pull_request(self, source_branch: str, target_branch: str, changed_lines_only: bool, 
+                                    read_only: bool = False, fetch: bool = True, remote_refs: bool = False, 
+                                    tracer: Tracer | None = None) -> Iterable[ChangedFile]:
         if self.repo is None:
             return []
-        self.__check_for_uncommitted_changes()
-        self.__update_branch(target_branch)
-        self.__update_branch(source_branch)
+        if read_only:
+            return self.__get_changes_from_object_database(source_branch, target_branch, changed_lines_only, 
+                                                           remote_refs)
+        tracer = tracer if tracer is not None else NullTracer()
+        with tracer.span("check for uncommitted changes", "git"):
+            self.__check_for_uncommitted_changes()
+        if fetch:
+            with tracer.span("fetch", "git"):
+                self.__fetch_branches(source_branch, target_branch)
+        if remote_refs:
+            return self.__get_changes_of_remote_branches(source_branch, target_branch, changed_lines_only)
+        with tracer.span("update local branches", "git"):
+            self.__update_local_branch(target_branch)
+            self.__update_local_branch(source_branch)
         local_source_branch = self.__get_local_branch_for_remote_branch(source_branch)
         local_target_branch = self.__get_local_branch_for_remote_branch(target_branch)
-        diff = self.__get_diff_of_pull_request(local_source_branch, local_target_branch)
-        return self.__get_changed_files_from_diff(diff, changed_lines_only)
+        with tracer.span("checkout", "git"):
+            self.repo.git.checkout(local_source_branch)
+        return self.__get_changed_files_of_pull_request(local_source_branch, local_target_branch, changed_lines_only, 
+                                                        False)
+    
+    def get_remote_branch_name(self, branch_name: str) -> str:
+        return "origin/" + self.__get_local_branch_for_remote_branch(branch_name)
+    
+    def get_all_files_of_branch(self, branch_name: str, is_directory_ignored: Callable[[str], bool]) \
+            -> Iterator[ChangedFile]:
+        if self.repo is None:
+            return
+        for relative_path, blob_sha in self.__list_blobs_of_commit(self.get_commit_sha(branch_name)):
+            file_path = self.__get_file_path(relative_path)
+            if not is_directory_ignored(os.path.dirname(file_path)):
+                yield ChangedFile(file_path, None, True, blob_sha)
+    
+    def get_tracked_files(self, is_directory_ignored: Callable[[str], bool]) -> Iterator[ChangedFile]:
+        # Only the files in the index are analyzed, so untracked files and the build output are never visited
+        if self.repo is None:
+            return
+        process = self.repo.git.ls_files("-z", "--stage", as_process=True)
+        previous_relative_path = None
+        for entry in self.__read_null_terminated_entries(process.stdout):
+            metadata, _, relative_path = entry.partition(b"\t")
+            # submodules are skipped and files with merge conflicts are listed once per stage
+            if metadata.startswith(b"160000") or relative_path == previous_relative_path:
+                continue
+            previous_relative_path = relative_path
+            file_path = self.__get_file_path(os.fsdecode(relative_path))
+            if not is_directory_ignored(os.path.dirname(file_path)) and os.path.isfile(file_path):
+                yield ChangedFile(file_path, None, True)
+        process.wait()
+    
+    def find_files_in_branch(self, branch_name: str, file_name: str) -> list[str]:
+        return [blob_sha for relative_path, blob_sha in self.__list_blobs_of_commit(self.get_commit_sha(branch_name)) 
+                if os.path.basename(relative_path) == file_name]
+    
+    def find_tracked_files(self, file_name: str) -> list[str]:
+        # the index is searched by git itself, so the directories of the working tree are never visited
+        output = self.repo.git.ls_files("-z", "--", f":(glob)**/{file_name}")
+        return [self.__get_file_path(relative_path) for relative_path in output.split("\0") if relative_path]
+    
+    def get_blob_sha_of_file(self, branch_name: str, relative_path: str) -> str | None:
+        try:
+            item = self.repo.commit(branch_name).tree / relative_path
+        except KeyError:
+            return None
+        return item.hexsha if item.type == "blob" else None
+    
+    def get_commit_sha(self, branch_name: str) -> str:
+        return self.repo.commit(branch_name).hexsha
+    
+    def get_head_commit_sha(self) -> str | None:
+        try:
+            return self.repo.head.commit.hexsha
+        except ValueError:
+            # the repository does not contain any commits yet
+            return None
+    
+    def read_blob(self, blob_sha: str) -> bytes:
+        return self.repo.odb.stream(bytes.fromhex(blob_sha)).read()
+    
+    def __get_changes_from_object_database(self, source_branch: str, target_branch: str, changed_lines_only: bool,
+                                           remote_refs: bool) -> Iterable[ChangedFile]:
+        # The branches are resolved without checking them out. Remote branches like 'origin/main' are used as they are.
+        if remote_refs:
+            source_branch = self.get_remote_branch_name(source_branch)
+            target_branch = self.get_remote_branch_name(target_branch)
+        return self.__get_changed_files_of_pull_request(source_branch, target_branch, changed_lines_only, True)
+    
+    def __get_changes_of_remote_branches(self, source_branch: str, target_branch: str, changed_lines_only: bool) \
+            -> Iterable[ChangedFile]:
+        # The remote branches are compared directly. The source branch is checked out as a detached head, so no local 
+        # tracking branches are created or updated.
+        remote_source_branch = self.get_remote_branch_name(source_branch)
+        remote_target_branch = self.get_remote_branch_name(target_branch)
+        self.repo.git.checkout("--detach", remote_source_branch)
+        return self.__get_changed_files_of_pull_request(remote_source_branch, remote_target_branch, changed_lines_only,
+                                                        False)
         
     def __check_for_uncommitted_changes(self):
         if self.repo.is_dirty():
@@ -50,67 +151,119 @@ class GitAssistant:
                 raise Exception("Unstaged changes detected. Please commit your changes first!")
             raise Exception("Uncommitted changes detected. Please commit your changes first!")
         
-    def __update_branch(self, branch_name: str):
-        if branch_name.startswith("origin/"):
-            local_branch_name = self.__get_local_branch_for_remote_branch(branch_name)
-            if not self.__local_branch_exists(local_branch_name):
-                self.__checkout_remote_branch(branch_name, local_branch_name)
-            else:
-                self.repo.git.checkout(local_branch_name)
-        else:
-            self.repo.git.checkout(branch_name)
-        self.__pull_current_branch()
+    def __fetch_branches(self, *branch_names: str):
+        # All needed branches are fetched with a single request instead of pulling every branch on its own
+        local_branch_names = dict.fromkeys(self.__get_local_branch_for_remote_branch(branch_name) 
+                                           for branch_name in branch_names)
+        refspecs = [f"+refs/heads/{branch_name}:refs/remotes/origin/{branch_name}" 
+                    for branch_name in local_branch_names]
+        self.repo.git.fetch("origin", *refspecs)
+    
+    def __update_local_branch(self, branch_name: str):
+        local_branch_name = self.__get_local_branch_for_remote_branch(branch_name)
+        remote_branch_name = self.get_remote_branch_name(branch_name)
+        if not self.__remote_branch_exists(remote_branch_name):
+            return
+        if not self.__local_branch_exists(local_branch_name):
+            # Create new local branch tracking the remote branch
+            head = self.repo.create_head(local_branch_name, remote_branch_name)
+            head.set_tracking_branch(self.repo.remotes.origin.refs[local_branch_name])
+            return
+        self.__fast_forward_local_branch(self.repo.heads[local_branch_name], remote_branch_name)
 
     def __get_local_branch_for_remote_branch(self, branch_name: str) -> str:
         return branch_name.replace("origin/", "")
         
     def __local_branch_exists(self, branch_name: str) -> bool:
         return branch_name in [branch.name for branch in self.repo.branches]
+    
+    def __remote_branch_exists(self, branch_name: str) -> bool:
+        return "origin" in self.repo.remotes and branch_name in [ref.name for ref in self.repo.remotes.origin.refs]
 
-    def __checkout_remote_branch(self, remote_branch_name: str, local_branch_name: str):
-        # Create new local branch tracking the remote branch
-        head = self.repo.create_head(local_branch_name, remote_branch_name)
-        head.checkout()
-        
-    def __pull_current_branch(self):
-        origin: Remote = self.repo.remotes.origin
-        current_branch = self.repo.active_branch.name
-        origin.pull(current_branch)
+    def __fast_forward_local_branch(self, head: Head, remote_branch_name: str):
+        remote_commit = self.repo.commit(remote_branch_name)
+        if head.commit == remote_commit or not self.repo.is_ancestor(head.commit, remote_commit):
+            # the local branch is either up to date or contains commits which are not pushed yet
+            return
+        if not self.repo.head.is_detached and self.repo.active_branch == head:
+            self.repo.git.merge("--ff-only", remote_branch_name)
+        else:
+            # branches which are not checked out are moved without touching the working tree
+            head.commit = remote_commit
         
     def __get_commit_of_merge_base(self, source_branch: str, target_branch: str):
         merge_base = self.repo.merge_base(source_branch, target_branch)
         return merge_base[0] if merge_base else None
     
-    def __get_diff_of_pull_request(self, source_branch: str, target_branch: str):
-        commit = self.__get_commit_of_merge_base(source_branch, target_branch)
-        source_branch_head = self.repo.heads[source_branch].commit
-        return commit.diff(source_branch_head, create_patch=True, textconv=True)
-        
-    def __get_changed_files_from_diff(self, diff: DiffIndex[Diff], changed_lines_only: bool) -> list[ChangedFile]:
-        changes = []
-        for changed_file_info in diff:
-            if not changed_file_info.deleted_file:
-                changes.append(self.__parse_diff_to_changed_file(changed_file_info, changed_lines_only))
-        return changes
-
-    def __parse_diff_to_changed_file(self, diff_metadata: Diff, changed_lines_only: bool) -> ChangedFile:
-        file_path = self.repo.working_dir + os.path.sep + diff_metadata.b_path
-        check_entire_file = (not changed_lines_only and not diff_metadata.renamed_file) or diff_metadata.new_file
-        diff = self.__decode_diff(diff_metadata.diff)
-        return ChangedFile(file_path, diff, check_entire_file)
-    
-    def __decode_diff(self, diff: bytes | None) -> str | None:
-        if diff is None:
-            return None
-        else:
-            return diff.decode(encoding="utf-8", errors="strict")
+    def __get_changed_files_of_pull_request(self, source_branch: str, target_branch: str, changed_lines_only: bool,
+                                            read_only: bool) -> Iterator[ChangedFile]:
+        # The commits are resolved right away, so that invalid branches are reported before the analysis starts.
+        merge_base = self.__get_commit_of_merge_base(source_branch, target_branch)
+        source_branch_head = self.repo.commit(source_branch)
+        return self.__stream_changed_files(merge_base.hexsha, source_branch_head.hexsha, changed_lines_only, read_only)
+    
+    def __stream_changed_files(self, merge_base_sha: str, source_sha: str, changed_lines_only: bool, read_only: bool) \
+            -> Iterator[ChangedFile]:
+        # A single git process writes the patches of all files. Each file is handed over as soon as its patch has been 
+        # read, so the analysis starts before git has finished and only one patch is kept in memory at a time.
+        process = self.repo.git.diff_tree(merge_base_sha, source_sha, "-r", "-p", "-M", "--full-index", "--no-color", 
+                                          "--no-ext-diff", "--textconv", "--src-prefix=a/", "--dst-prefix=b/", 
+                                          as_process=True)
+        for file_patch in DiffStreamReader.read_file_patches(process.stdout):
+            if not file_patch.deleted_file:
+                yield self.__parse_file_patch_to_changed_file(file_patch, source_sha, changed_lines_only, read_only)
+        process.wait()
 
+    def __parse_file_patch_to_changed_file(self, file_patch: FilePatch, source_sha: str, changed_lines_only: bool, 
+                                           read_only: bool) -> ChangedFile:
+        file_path = self.__get_file_path(file_patch.b_path)
+        check_entire_file = (not changed_lines_only and not file_patch.renamed_file) or file_patch.new_file
+        blob_sha = None
+        if read_only:
+            blob_sha = file_patch.b_blob_sha
+            if blob_sha is None:
+                # pure renames and mode changes come without an index line
+                blob_sha = self.repo.commit(source_sha).tree[file_patch.b_path].hexsha
+        return ChangedFile(file_path, file_patch.diff, check_entire_file, blob_sha)
+    
+    def __list_blobs_of_commit(self, commit_sha: str) -> Iterator[tuple[str, str]]:
+        process = self.repo.git.ls_tree("-r", "-z", commit_sha, as_process=True)
+        for entry in self.__read_null_terminated_entries(process.stdout):
+            metadata, _, relative_path = entry.partition(b"\t")
+            _, object_type, blob_sha = metadata.split(b" ")
+            if object_type == b"blob":
+                yield os.fsdecode(relative_path), blob_sha.decode("ascii")
+        process.wait()
+    
+    def __read_null_terminated_entries(self, stream: IO[bytes]) -> Iterator[bytes]:
+        remainder = b""
+        while chunk := stream.read(65536):
+            entries = (remainder + chunk).split(b"\0")
+            remainder = entries.pop()
+            yield from entries
+        if remainder:
+            yield remainder
+    
+    def __get_file_path(self, relative_path: str) -> str:
+        return self.repo.working_dir + os.path.sep + relative_path
+    
     def __try_set_git_repository(self, repo_directory: str) -> bool:
+        if self.__is_opened(repo_directory):
+            return True
         try:
-            self.repo = Repo(repo_directory)
+            self.__open_repository(repo_directory)
             return True
         except InvalidGitRepositoryError:
             return False
+    
+    def __is_opened(self, repo_directory: str) -> bool:
+        # The same repository is kept open, so that its 'git cat-file' processes keep running between the analyses, 
+        # e.g. of the analysis daemon.
+        return self.repo is not None and self.__repo_path == os.path.realpath(repo_directory)
+    
+    def __open_repository(self, repo_directory: str):
+        self.repo = Repo(repo_directory)
+        self.__repo_path = os.path.realpath(repo_directory)
 
     def __find_git_directory(self):
         start_path = os.getcwd()
@@ -0,0 +1,13 @@
+from gui.commands.command import Command
+from gui.main_model import MainModel
+from gui.main_view import MainView
+from logger import Logger
+
+
+class SetJobs(Command):
+    def __init__(self, logger: Logger, model: MainModel, view: MainView):
+        super().__init__(logger, model, view)
+        
+    def execute(self):
+        jobs = self.view.get_repository_section().get_jobs_spin_box().value()
+        self.model.set_jobs(jobs)
\ No newline at end of file
@@ -0,0 +1,13 @@
+from gui.commands.command import Command
+from gui.main_model import MainModel
+from gui.main_view import MainView
+from logger import Logger
+
+
+class SetReadOnly(Command):
+    def __init__(self, logger: Logger, model: MainModel, view: MainView):
+        super().__init__(logger, model, view)
+        
+    def execute(self):
+        read_only = self.view.get_repository_section().get_read_only_checkbox().isChecked()
+        self.model.set_read_only(read_only)
\ No newline at end of file
@@ -1,8 +1,11 @@
 from gui.adapter.analysis_complete import AnalysisCompleteAdapter
 from gui.commands.set_changed_lines_only import SetChangedLinesOnly
+from gui.commands.set_jobs import SetJobs
+from gui.commands.set_read_only import SetReadOnly
 from gui.commands.set_repository import SetRepositoryCommand
 from gui.commands.set_source_branch import SetSourceBranch
 from gui.commands.set_target_branch import SetTargetBranch
+from gui.commands.set_watch import SetWatch
 from gui.commands.start_analysis import StartAnalysis
 from gui.main_model import MainModel
 from gui.main_view import MainView
@@ -18,6 +21,9 @@ class MainController:
         self.set_source_branch_command = None
         self.set_target_branch_command = None
         self.set_changed_lines_only_command = None
+        self.set_jobs_command = None
+        self.set_read_only_command = None
+        self.set_watch_command = None
 
     def initialize_application(self):
         try:
@@ -29,6 +35,9 @@ class MainController:
             self.view.get_repository_section().get_changed_lines_only_checkbox().setChecked(
                 self.model.get_changed_lines_only()
             )
+            self.view.get_repository_section().get_read_only_checkbox().setChecked(self.model.get_read_only())
+            self.view.get_repository_section().get_watch_checkbox().setChecked(self.model.get_watch())
+            self.view.get_repository_section().get_jobs_spin_box().setValue(self.model.get_jobs())
         except Exception as e:
             self.logger.error(str(e))
         self.logger.info("Static Code Analysis Tool started")
@@ -58,6 +67,21 @@ class MainController:
             self.set_changed_lines_only_command.execute
         )
         
+        self.set_read_only_command = SetReadOnly(self.logger, self.model, self.view)
+        self.view.get_repository_section().get_read_only_checkbox().stateChanged.connect(
+            self.set_read_only_command.execute
+        )
+        
+        self.set_watch_command = SetWatch(self.logger, self.model, self.view)
+        self.view.get_repository_section().get_watch_checkbox().stateChanged.connect(
+            self.set_watch_command.execute
+        )
+        
+        self.set_jobs_command = SetJobs(self.logger, self.model, self.view)
+        self.view.get_repository_section().get_jobs_spin_box().valueChanged.connect(
+            self.set_jobs_command.execute
+        )
+        
     def register_subscriptions(self):
         analysis_complete_adapter = AnalysisCompleteAdapter(self.logger, self.view)
         self.model.subscribe_analysis_complete(analysis_complete_adapter)
@@ -1,7 +1,9 @@
-from threading import Thread
+import copy
+from threading import Event, Thread, current_thread
 from typing import List
 
 from analysis import Analysis
+from analysis_watcher import AnalysisWatcher
 from config_parser import ConfigParser
 from git_assistant import GitAssistant
 from gui.adapter.analysis_complete import AnalysisCompleteAdapter
@@ -22,6 +24,9 @@ class MainModel:
         self.is_analyzing = False
         self.analysis_complete_adapter: AnalysisCompleteAdapter | None = None
         self.analysis_thread = None
+        self.watch_stop_event: Event | None = None
+        # the arguments of the running watcher, which are not changed by the view
+        self.watched_arguments: AnalysisArguments | None = None
         
     def prepare(self):
         self.analysis_arguments = self.config_parser.load_analysis_arguments()
@@ -38,6 +43,7 @@ class MainModel:
             self.analysis_arguments.repository_directory = repo_path
             self.git_assistant.reset_repository_directory(repo_path)
             self.__update_repository_info(repo_path)
+            self.__restart_watching_if_changed()
         except Exception as e:
             self.analysis_arguments.repository_directory = ""
             self.repository_info = None
@@ -60,16 +66,47 @@ class MainModel:
     
     def set_source_branch(self, source_branch: str):
         self.analysis_arguments.source_branch = source_branch
+        self.__restart_watching_if_changed()
     
     def set_target_branch(self, target_branch: str):
         self.analysis_arguments.destination_branch = target_branch
+        self.__restart_watching_if_changed()
         
     def set_changed_lines_only(self, changed_lines_only: bool):
         self.analysis_arguments.changed_lines_only = changed_lines_only
+        self.__restart_watching_if_changed()
         
     def get_changed_lines_only(self) -> bool:
         return self.analysis_arguments.changed_lines_only
     
+    def set_read_only(self, read_only: bool):
+        self.analysis_arguments.read_only = read_only
+        self.__restart_watching_if_changed()
+        
+    def get_read_only(self) -> bool:
+        return self.analysis_arguments.read_only
+    
+    def set_watch(self, watch: bool):
+        self.analysis_arguments.watch = watch
+        if not watch:
+            self.stop_watching()
+        
+    def get_watch(self) -> bool:
+        return self.analysis_arguments.watch
+    
+    def stop_watching(self):
+        if self.watch_stop_event is not None:
+            self.watch_stop_event.set()
+            self.watch_stop_event = None
+            self.watched_arguments = None
+    
+    def set_jobs(self, jobs: int):
+        self.analysis_arguments.jobs = jobs
+        self.__restart_watching_if_changed()
+        
+    def get_jobs(self) -> int:
+        return self.analysis_arguments.jobs
+    
     def save_analysis_arguments(self):
         self.config_parser.store_analysis_arguments(self.analysis_arguments)
     
@@ -80,9 +117,43 @@ class MainModel:
         
         self.is_analyzing = True
         self.analysis_results = None
+        # a new analysis replaces the branches which were watched before
+        self.stop_watching()
 
-        self.analysis_thread = Thread(target=self.__analyze_async)
+        if self.analysis_arguments.watch:
+            self.__start_watching()
+        else:
+            self.analysis_thread = Thread(target=self.__analyze_async)
+            self.analysis_thread.start()
+    
+    def __start_watching(self):
+        self.watch_stop_event = Event()
+        self.watched_arguments = copy.copy(self.analysis_arguments)
+        self.analysis_thread = Thread(target=self.__watch_async, args=(self.watched_arguments, self.watch_stop_event), 
+                                      daemon=True)
         self.analysis_thread.start()
+    
+    def __restart_watching_if_changed(self):
+        # The watcher analyzes the arguments of the time it was started, so it is replaced once they change.
+        if self.watch_stop_event is not None and vars(self.analysis_arguments) != vars(self.watched_arguments):
+            self.stop_watching()
+            self.is_analyzing = True
+            self.__start_watching()
+    
+    def __watch_async(self, analysis_arguments: AnalysisArguments, stop_event: Event):
+        # The watcher uses its own git assistant, because the repository can be changed while it is running.
+        git_assistant = GitAssistant(analysis_arguments.repository_directory)
+        analysis_watcher = AnalysisWatcher(self.logger, self.config_parser, git_assistant)
+        analysis_watcher.watch(analysis_arguments, self.__on_watched_results_updated, stop_event)
+    
+    def __on_watched_results_updated(self, results: list[FileAnalysisResult] | None):
+        # a watcher which was replaced finishes its current run, but its results are not shown anymore
+        if current_thread() is not self.analysis_thread:
+            return
+        # the watcher keeps updating its results, so the view gets a copy
+        self.analysis_results = list(results) if results is not None else None
+        self.is_analyzing = False
+        self.__notify_analysis_complete(self.analysis_results)
             
     def __analyze_async(self):
         try:
@@ -0,0 +1,159 @@
+from array import array
+from bisect import bisect_right
+from itertools import compress
+from operator import attrgetter
+
+from PyQt5.QtCore import QAbstractTableModel, QModelIndex, Qt, QTimer
+
+from models.file_analysis_result import FileAnalysisResult
+
+
+class IssueTableModel(QAbstractTableModel):
+    # The issues of the analysis results as the rows of a table view, which only asks for the rows it shows. Every 
+    # issue is identified by its position in the results, counted over all files, so sorting and filtering only reorder 
+    # these positions and never copy the issues. The rows are added in batches by a timer, so the window stays 
+    # responsive while a large result is loaded.
+    HEADERS = ["File", "Line", "Check", "Problem"]
+    FILE_COLUMN = 0
+    # the attributes of the issues shown in the other columns
+    ISSUE_ATTRIBUTES = {1: "line_number", 2: "check_name", 3: "issue_description"}
+    ROWS_PER_BATCH = 50000
+    
+    def __init__(self):
+        super().__init__()
+        self.__results: list[FileAnalysisResult] = []
+        # the position of the first issue of every loaded file
+        self.__file_starts = array("q")
+        self.__issue_count = 0
+        # the positions of the loaded issues in the sorted order, and the ones of them which pass the filter
+        self.__sorted_rows = array("q")
+        self.__rows = array("q")
+        # whether the issue at a position passes the filter
+        self.__filter_mask = bytearray()
+        self.__filter_text = ""
+        self.__check_name_matches: dict[str, bool] = {}
+        self.__sort_column = -1
+        self.__sort_order = Qt.AscendingOrder
+        self.__load_timer = QTimer(self)
+        self.__load_timer.setInterval(0)
+        self.__load_timer.timeout.connect(self.__load_next_batch)
+    
+    def set_results(self, results: list[FileAnalysisResult]):
+        self.__load_timer.stop()
+        self.beginResetModel()
+        self.__results = results
+        self.__file_starts = array("q")
+        self.__issue_count = 0
+        self.__sorted_rows = array("q")
+        self.__rows = array("q")
+        self.__filter_mask = bytearray()
+        self.endResetModel()
+        if len(results) > 0:
+            self.__load_timer.start()
+    
+    def clear(self):
+        self.set_results([])
+    
+    def is_loading(self) -> bool:
+        return self.__load_timer.isActive()
+    
+    def set_filter_text(self, filter_text: str):
+        # an issue passes, if its file or its check contains the text, regardless of the case
+        self.__filter_text = filter_text.strip().lower()
+        self.__check_name_matches = {}
+        self.beginResetModel()
+        self.__filter_mask = self.__get_filter_mask(0, len(self.__file_starts))
+        self.__rows = self.__filter_rows(self.__sorted_rows)
+        self.endResetModel()
+    
+    def rowCount(self, parent: QModelIndex = QModelIndex()) -> int:
+        return 0 if parent.isValid() else len(self.__rows)
+    
+    def columnCount(self, parent: QModelIndex = QModelIndex()) -> int:
+        return 0 if parent.isValid() else len(self.HEADERS)
+    
+    def headerData(self, section: int, orientation: Qt.Orientation, role: int = Qt.DisplayRole) -> object:
+        if orientation == Qt.Horizontal and role == Qt.DisplayRole:
+            return self.HEADERS[section]
+        return None
+    
+    def data(self, index: QModelIndex, role: int = Qt.DisplayRole) -> object:
+        if role != Qt.DisplayRole or not index.isValid():
+            return None
+        position = self.__rows[index.row()]
+        file_index = bisect_right(self.__file_starts, position) - 1
+        result = self.__results[file_index]
+        if index.column() == self.FILE_COLUMN:
+            return result.file_path
+        issue = result.issues[position - self.__file_starts[file_index]]
+        return getattr(issue, self.ISSUE_ATTRIBUTES[index.column()])
+    
+    def sort(self, column: int, order: Qt.SortOrder = Qt.AscendingOrder):
+        self.__sort_column = column
+        self.__sort_order = order
+        if self.is_loading():
+            # the rows are sorted once all of them are loaded
+            return
+        self.beginResetModel()
+        self.__sorted_rows = self.__get_sorted_rows(column, order == Qt.DescendingOrder)
+        self.__rows = self.__filter_rows(self.__sorted_rows)
+        self.endResetModel()
+    
+    def __load_next_batch(self):
+        first_position = self.__issue_count
+        first_file_index = len(self.__file_starts)
+        for result in self.__results[first_file_index:]:
+            if self.__issue_count - first_position >= self.ROWS_PER_BATCH:
+                break
+            self.__file_starts.append(self.__issue_count)
+            self.__issue_count += len(result.issues)
+        new_positions = range(first_position, self.__issue_count)
+        self.__sorted_rows.extend(new_positions)
+        self.__filter_mask += self.__get_filter_mask(first_file_index, len(self.__file_starts))
+        new_rows = self.__filter_rows(new_positions)
+        if len(new_rows) > 0:
+            self.beginInsertRows(QModelIndex(), len(self.__rows), len(self.__rows) + len(new_rows) - 1)
+            self.__rows.extend(new_rows)
+            self.endInsertRows()
+        if len(self.__file_starts) == len(self.__results):
+            self.__load_timer.stop()
+            if self.__sort_column >= 0:
+                self.sort(self.__sort_column, self.__sort_order)
+    
+    def __get_filter_mask(self, first_file_index: int, end_file_index: int) -> bytearray:
+        filter_mask = bytearray()
+        get_check_name = attrgetter("check_name")
+        for result in self.__results[first_file_index:end_file_index]:
+            if self.__filter_text in result.file_path.lower():
+                filter_mask += b"\x01" * len(result.issues)
+                continue
+            # there are only a few different check names, so each of them is compared once
+            check_names = list(map(get_check_name, result.issues))
+            for check_name in set(check_names).difference(self.__check_name_matches):
+                self.__check_name_matches[check_name] = self.__filter_text in check_name.lower()
+            filter_mask += bytes(map(self.__check_name_matches.__getitem__, check_names))
+        return filter_mask
+    
+    def __filter_rows(self, positions: array | range) -> array:
+        if self.__filter_text == "":
+            return array("q", positions)
+        return array("q", compress(positions, map(self.__filter_mask.__getitem__, positions)))
+    
+    def __get_sorted_rows(self, column: int, descending: bool) -> array:
+        # the sort is stable, so the issues of a file keep their order
+        positions = range(self.__issue_count)
+        if column < 0:
+            return array("q", positions)
+        if column == self.FILE_COLUMN:
+            # the files are sorted instead of their issues, whose positions are copied as slices
+            file_indices = sorted(range(len(self.__file_starts)), key=lambda file_index: 
+                                  self.__results[file_index].file_path, reverse=descending)
+            unsorted_rows = array("q", positions)
+            sorted_rows = array("q")
+            for file_index in file_indices:
+                file_start = self.__file_starts[file_index]
+                sorted_rows += unsorted_rows[file_start:file_start + len(self.__results[file_index].issues)]
+            return sorted_rows
+        get_value = attrgetter(self.ISSUE_ATTRIBUTES[column])
+        values = [get_value(issue) for result in self.__results for issue in result.issues]
+        return array("q", sorted(positions, key=values.__getitem__, reverse=descending))
\ No newline at end of file
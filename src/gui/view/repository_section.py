@@ -1,5 +1,7 @@
+import os
+
 from PyQt5.QtGui import QFont
-from PyQt5.QtWidgets import QFrame, QVBoxLayout, QLabel, QHBoxLayout, QPushButton, QComboBox, QCheckBox
+from PyQt5.QtWidgets import QFrame, QVBoxLayout, QLabel, QHBoxLayout, QPushButton, QComboBox, QCheckBox, QSpinBox
 
 from gui.themeablewidget import ThemeableWidget
 from models.repository_info import RepositoryInfo
@@ -13,6 +15,9 @@ class RepositorySection(QFrame, ThemeableWidget):
         self.source_branch = None
         self.dest_branch = None
         self.changed_lines_only_checkbox = None
+        self.jobs_spin_box = None
+        self.read_only_checkbox = None
+        self.watch_checkbox = None
         
         self.setObjectName("section_frame")
         repo_layout = QVBoxLayout()
@@ -147,8 +152,25 @@ class RepositorySection(QFrame, ThemeableWidget):
         settings_layout = QVBoxLayout()
         self.changed_lines_only_checkbox = QCheckBox("Analyze changed lines only")
         settings_layout.addWidget(self.changed_lines_only_checkbox)
+        self.read_only_checkbox = QCheckBox("Read files from git without checking out branches")
+        settings_layout.addWidget(self.read_only_checkbox)
+        self.watch_checkbox = QCheckBox("Watch branches and analyze changed files again")
+        settings_layout.addWidget(self.watch_checkbox)
+        settings_layout.addLayout(self.__create_jobs_selection())
         return settings_layout
     
+    def __create_jobs_selection(self) -> QHBoxLayout:
+        jobs_layout = QHBoxLayout()
+        jobs_label = QLabel("Parallel jobs")
+        jobs_label.setObjectName("branch_label")
+        self.jobs_spin_box = QSpinBox()
+        self.jobs_spin_box.setObjectName("modern_combo")
+        self.jobs_spin_box.setRange(1, os.cpu_count() or 1)
+        jobs_layout.addWidget(jobs_label)
+        jobs_layout.addWidget(self.jobs_spin_box)
+        jobs_layout.addStretch()
+        return jobs_layout
+    
     def get_source_branch_selection(self) -> QComboBox:
         return self.source_branch
     
@@ -172,6 +194,15 @@ class RepositorySection(QFrame, ThemeableWidget):
     
     def get_changed_lines_only_checkbox(self) -> QCheckBox:
         return self.changed_lines_only_checkbox
+    
+    def get_read_only_checkbox(self) -> QCheckBox:
+        return self.read_only_checkbox
+    
+    def get_watch_checkbox(self) -> QCheckBox:
+        return self.watch_checkbox
+    
+    def get_jobs_spin_box(self) -> QSpinBox:
+        return self.jobs_spin_box
 
     def update_repository_path(self, repository_path):
         self.dir_label.setText(repository_path)
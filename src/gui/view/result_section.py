@@ -1,19 +1,27 @@
-from PyQt5.QtCore import Qt
+from PyQt5.QtCore import Qt, QTimer
 from PyQt5.QtGui import QFont, QTextCursor
-from PyQt5.QtWidgets import QVBoxLayout, QHBoxLayout, QPushButton, QTextEdit, QTableWidget, QHeaderView, \
-    QTabWidget, QTableWidgetItem, QApplication
+from PyQt5.QtWidgets import QVBoxLayout, QHBoxLayout, QPushButton, QTextEdit, QTableView, QHeaderView, \
+    QTabWidget, QApplication, QLineEdit
 
 from gui.themeablewidget import ThemeableWidget
+from gui.view.issue_table_model import IssueTableModel
 from models.file_analysis_result import FileAnalysisResult
 from util.analysis_result_formatter import AnalysisResultFormatter
 
 
 class ResultSection(QTabWidget, ThemeableWidget):
+    # a text with millions of lines freezes the window, the issues table shows all of them
+    MAX_LISTED_ISSUE_COUNT = 10000
+    
     def __init__(self):
         super().__init__()
+        self.analysis_results: list[FileAnalysisResult] | None = None
         self.copy_button = None
         self.upper_output = None
+        self.issue_filter = None
+        self.issue_filter_timer = None
         self.problem_table = None
+        self.issue_table_model = None
         self.console = None
         
         self.setObjectName("results_tabs")
@@ -76,33 +84,68 @@ class ResultSection(QTabWidget, ThemeableWidget):
         issues_layout = QVBoxLayout()
         issues_layout.setContentsMargins(4, 4, 4, 4)
 
-        self.problem_table = QTableWidget()
+        self.issue_filter = QLineEdit()
+        self.issue_filter.setObjectName("issue_filter")
+        self.issue_filter.setPlaceholderText("Filter by file or check")
+        self.issue_filter.setClearButtonEnabled(True)
+        issues_layout.addWidget(self.issue_filter)
+
+        # Filtering a large number of issues takes a moment, so it waits until the typing pauses
+        self.issue_filter_timer = QTimer(self)
+        self.issue_filter_timer.setSingleShot(True)
+        self.issue_filter_timer.setInterval(250)
+        self.issue_filter_timer.timeout.connect(self.__apply_issue_filter)
+        self.issue_filter.textChanged.connect(lambda: self.issue_filter_timer.start())
+
+        # The table view only asks the model for the visible rows, so it stays fast for a large number of issues
+        self.issue_table_model = IssueTableModel()
+        self.problem_table = QTableView()
         self.problem_table.setObjectName("modern_table")
-        self.problem_table.setColumnCount(3)
-        self.problem_table.setHorizontalHeaderLabels(["File", "Line", "Problem"])
-        self.problem_table.setEditTriggers(QTableWidget.NoEditTriggers)
-        self.problem_table.setSelectionBehavior(QTableWidget.SelectRows)
+        self.problem_table.setModel(self.issue_table_model)
+        self.problem_table.setEditTriggers(QTableView.NoEditTriggers)
+        self.problem_table.setSelectionBehavior(QTableView.SelectRows)
         self.problem_table.setAlternatingRowColors(True)
-        self.problem_table.verticalHeader().setVisible(False)
+        self.problem_table.setWordWrap(False)
+        self.problem_table.horizontalHeader().setSortIndicator(-1, Qt.AscendingOrder)
+        self.problem_table.setSortingEnabled(True)
+
+        # Every row has the same height, so the rows do not need to be measured
+        vertical_header = self.problem_table.verticalHeader()
+        vertical_header.setVisible(False)
+        vertical_header.setSectionResizeMode(QHeaderView.Fixed)
+        vertical_header.setDefaultSectionSize(vertical_header.minimumSectionSize() + 4)
 
         # Enable scrollbars for the table
         self.problem_table.setHorizontalScrollBarPolicy(Qt.ScrollBarAsNeeded)
         self.problem_table.setVerticalScrollBarPolicy(Qt.ScrollBarAsNeeded)
-        self.problem_table.setHorizontalScrollMode(QTableWidget.ScrollPerPixel)
-        self.problem_table.setVerticalScrollMode(QTableWidget.ScrollPerPixel)
+        self.problem_table.setHorizontalScrollMode(QTableView.ScrollPerPixel)
+        self.problem_table.setVerticalScrollMode(QTableView.ScrollPerPixel)
 
-        # Make table headers resize properly
+        # Resizing the columns to their contents would measure every row, so they start with fixed widths
         header = self.problem_table.horizontalHeader()
-        header.setSectionResizeMode(0, QHeaderView.ResizeToContents)
-        header.setSectionResizeMode(1, QHeaderView.ResizeToContents)
-        header.setSectionResizeMode(2, QHeaderView.Stretch)
+        header.setSectionResizeMode(QHeaderView.Interactive)
+        header.resizeSection(0, 300)
+        header.resizeSection(1, 60)
+        header.resizeSection(2, 160)
+        header.setSectionResizeMode(3, QHeaderView.Stretch)
 
         issues_layout.addWidget(self.problem_table)
         issues_widget.setLayout(issues_layout)
         return issues_widget
     
+    def __apply_issue_filter(self):
+        self.issue_table_model.set_filter_text(self.issue_filter.text())
+    
     def __get_issues_tab_style(self) -> str:
         return """
+            #issue_filter {
+                background-color: $body-bg;
+                border: 1px solid $body-bg-dark;
+                border-radius: 4px;
+                padding: 4px;
+                color: $dark;
+            }
+            
             #modern_table {
                 background-color: $body-bg;
                 alternate-background-color: $body-bg-light;
@@ -154,7 +197,11 @@ class ResultSection(QTabWidget, ThemeableWidget):
 
     def __copy_upper_output(self):
         clipboard = QApplication.clipboard()
-        clipboard.setText(self.upper_output.toPlainText())
+        if self.analysis_results is None:
+            clipboard.setText(self.upper_output.toPlainText())
+        else:
+            # the summary might not list every issue, but the copy does
+            clipboard.setText(AnalysisResultFormatter.build_result_text(self.analysis_results))
 
     def get_stylesheet(self) -> str:
         return (self.__get_summary_tab_style() + "\n" + 
@@ -180,23 +227,18 @@ class ResultSection(QTabWidget, ThemeableWidget):
         self.clear_analysis_results()
         if analysis_results is None:
             return
+        self.analysis_results = analysis_results
         self.__update_result_text(analysis_results)
         self.__update_result_table(analysis_results)
 
     def clear_analysis_results(self):
-        self.problem_table.setRowCount(0)
+        self.analysis_results = None
+        self.issue_table_model.clear()
         self.upper_output.clear()
         
     def __update_result_text(self, results: list[FileAnalysisResult]):
-        result_text = AnalysisResultFormatter.build_result_text(results)
+        result_text = AnalysisResultFormatter.build_result_text(results, self.MAX_LISTED_ISSUE_COUNT)
         self.upper_output.setText(result_text)
     
     def __update_result_table(self, results: list[FileAnalysisResult]):
-        for result in results:
-            for issue in result.issues:
-                row_position = self.problem_table.rowCount()
-                self.problem_table.insertRow(row_position)
-                self.problem_table.setItem(row_position, 0, QTableWidgetItem(result.file_path))
-                self.problem_table.setItem(row_position, 1, QTableWidgetItem(str(issue.line_number)))
-                self.problem_table.setItem(row_position, 2, QTableWidgetItem(issue.issue_description))
-        
\ No newline at end of file
+        self.issue_table_model.set_results(results)
\ No newline at end of file
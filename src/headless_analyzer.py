@@ -1,13 +1,20 @@
 import os.path
+import time
+from collections import Counter
+from threading import Event
 
 from analysis import Analysis
+from analysis_watcher import AnalysisWatcher
 from config_parser import ConfigParser
 from git_assistant import GitAssistant
 from logger import Logger
 from models.analysis_arguments import AnalysisArguments
 from models.cli_arguments import CliArguments
 from models.file_analysis_result import FileAnalysisResult
+from null_tracer import NullTracer
+from tracer import Tracer
 from util.analysis_result_formatter import AnalysisResultFormatter
+from util.json_lines_result_formatter import JsonLinesResultFormatter
 
 
 class HeadlessAnalyzer:
@@ -28,20 +35,46 @@ class HeadlessAnalyzer:
         if cli_arguments.target_branch is None or len(cli_arguments.target_branch) == 0:
             self.logger.error("Target branch is required")
             return False
+        if cli_arguments.config_path is not None and not os.path.isfile(cli_arguments.config_path):
+            self.logger.error("The specified analysis config is not a file")
+            return False
+        if cli_arguments.jobs < 0:
+            self.logger.error("The number of jobs cannot be negative")
+            return False
+        if cli_arguments.watch and cli_arguments.output_format != "markdown":
+            self.logger.error("Watching the branches only supports the markdown format")
+            return False
+        if cli_arguments.watch and cli_arguments.trace_path is not None:
+            self.logger.error("Watching the branches does not support writing a trace")
+            return False
         return True
     
-    def perform_analysis(self, cli_arguments: CliArguments) -> int:
+    def perform_analysis(self, cli_arguments: CliArguments, git_assistant: GitAssistant | None = None) -> int:
         analysis_arguments = AnalysisArguments(
             cli_arguments.repository, 
             cli_arguments.source_branch, 
             cli_arguments.target_branch, 
-            cli_arguments.changed_lines_only
+            cli_arguments.changed_lines_only,
+            cli_arguments.jobs,
+            cli_arguments.read_only,
+            cli_arguments.fetch,
+            cli_arguments.remote_refs,
+            cli_arguments.config_path,
+            cli_arguments.cache_directory,
+            cli_arguments.use_cache,
+            cli_arguments.watch
         )
         self.logger.info(f"Starting analysis: comparing {analysis_arguments.source_branch} against "
                          f"{analysis_arguments.destination_branch}")
-        git_assistant = GitAssistant(cli_arguments.repository)
+        if git_assistant is None:
+            git_assistant = GitAssistant(cli_arguments.repository)
+        if analysis_arguments.watch:
+            return self.__watch_analysis(analysis_arguments, git_assistant)
+        tracer = Tracer() if cli_arguments.trace_path is not None else NullTracer()
         try:
-            analysis = Analysis(self.logger, self.config_parser, git_assistant)
+            analysis = Analysis(self.logger, self.config_parser, git_assistant, tracer)
+            if cli_arguments.output_format == "jsonl":
+                return self.__stream_analysis_results(analysis, analysis_arguments, cli_arguments.exit_with_code)
             analysis_results = analysis.execute(analysis_arguments)
             self.logger.info("Analysis completed.")
             return self.__process_analysis_results(analysis_results, cli_arguments.exit_with_code)
@@ -54,13 +87,81 @@ class HeadlessAnalyzer:
             else:
                 self.logger.error(e)
             return 3
+        finally:
+            # the trace of a failed analysis shows how far it got
+            if cli_arguments.trace_path is not None:
+                self.__write_trace(tracer, cli_arguments.trace_path)
+        
+    def __write_trace(self, tracer: Tracer, trace_path: str):
+        try:
+            tracer.write(trace_path)
+        except OSError as e:
+            self.logger.error(f"Could not write the trace to '{trace_path}': {e}")
+            return
+        self.logger.info(f"Wrote the trace to '{trace_path}'.")
+        slowest_files = tracer.get_slowest_spans("file", 5)
+        if len(slowest_files) > 0:
+            self.logger.info("Slowest files: " + ", ".join(
+                f"{file_path}: {duration:.1f} ms" for file_path, duration, _ in slowest_files))
+        # files whose results were cached are not checked again
+        slowest_checks = tracer.get_slowest_spans("check", 5)
+        if len(slowest_checks) > 0:
+            self.logger.info("Slowest checks: " + ", ".join(
+                f"{check_name}: {duration:.1f} ms in {file_count} file(s)" 
+                for check_name, duration, file_count in slowest_checks))
+    
+    def __watch_analysis(self, analysis_arguments: AnalysisArguments, git_assistant: GitAssistant) -> int:
+        analysis_watcher = AnalysisWatcher(self.logger, self.config_parser, git_assistant)
+        try:
+            analysis_watcher.watch(analysis_arguments, self.__print_watched_results, Event())
+        except KeyboardInterrupt:
+            self.logger.info("Stopped watching the branches.")
+        return 0
+    
+    def __print_watched_results(self, results: list[FileAnalysisResult] | None):
+        if results is not None:
+            print(AnalysisResultFormatter.build_result_text(results), flush=True)
         
+    def __stream_analysis_results(self, 
+                                  analysis: Analysis, 
+                                  analysis_arguments: AnalysisArguments, 
+                                  exit_with_code: bool) -> int:
+        # Only the counts are kept, so the memory does not grow with the number of analyzed files.
+        start_time = time.perf_counter()
+        file_count = 0
+        files_with_issues_count = 0
+        issue_count = 0
+        pattern_hits = Counter()
+        for result in analysis.execute_streaming(analysis_arguments):
+            print(JsonLinesResultFormatter.build_file_record(result), flush=True)
+            file_count += 1
+            pattern_hits.update(result.pattern_hits)
+            if result.has_issues():
+                files_with_issues_count += 1
+                issue_count += len(result.issues)
+        print(JsonLinesResultFormatter.build_summary_record(file_count, files_with_issues_count, issue_count, 
+                                                            dict(pattern_hits), time.perf_counter() - start_time), 
+              flush=True)
+        self.logger.info("Analysis completed.")
+        if issue_count > 0 and exit_with_code:
+            return 1
+        return 0
+    
     def __process_analysis_results(self, results: list[FileAnalysisResult], exit_with_code: bool) -> int:
+        self.__log_pattern_hits(results)
         print(AnalysisResultFormatter.build_result_text(results))
         if self.__has_issues(results) and exit_with_code:
             return 1
         else:
             return 0
         
+    def __log_pattern_hits(self, results: list[FileAnalysisResult]):
+        pattern_hits = Counter()
+        for result in results:
+            pattern_hits.update(result.pattern_hits)
+        if len(pattern_hits) > 0:
+            self.logger.info("Lines matched by the regex patterns: " + ", ".join(
+                f"{pattern_name}: {hit_count}" for pattern_name, hit_count in pattern_hits.most_common()))
+        
     def __has_issues(self, results: list[FileAnalysisResult]) -> bool:
         return len([result for result in results if result.has_issues()]) > 0
\ No newline at end of file
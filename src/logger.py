@@ -1,14 +1,19 @@
 import traceback
+from typing import TYPE_CHECKING, TextIO
 
-from gui.main_view import MainView
+if TYPE_CHECKING:
+    # importing the view would load Qt, which is not available for headless runs on minimal systems
+    from gui.main_view import MainView
 
 
 class Logger:
-    def __init__(self, quiet: bool):
+    def __init__(self, quiet: bool, stream: TextIO | None = None):
         self.view = None
         self.quiet = quiet
+        # the stream to log to, None logs to the current standard output
+        self.stream = stream
         
-    def set_gui(self, view : MainView):
+    def set_gui(self, view : "MainView"):
         self.view = view
         
     def __has_gui(self):
@@ -17,28 +22,28 @@ class Logger:
     def debug(self, message : str):
         if not self.quiet:
             return
-        print(f"[\033[35mDEBG\033[0m]: {message}")
+        print(f"[\033[35mDEBG\033[0m]: {message}", file=self.stream)
         if self.__has_gui():
             self.view.log(message, level="DEBUG")
 
     def info(self, message : str):
         if not self.quiet:
             return
-        print(f"[\033[32mINFO\033[0m]: {message}")
+        print(f"[\033[32mINFO\033[0m]: {message}", file=self.stream)
         if self.__has_gui():
             self.view.log(message, "INFO")
 
     def warn(self, message : str):
-        print(f"[\033[33mWARN\033[0m]: {message}")
+        print(f"[\033[33mWARN\033[0m]: {message}", file=self.stream)
         if self.__has_gui():
             self.view.log(message, "WARNING")
 
     def error(self, message : str | Exception):
         if isinstance(message, Exception):
-            print(f"\033[31m[FATA]: {traceback.format_exc()}\033[0m")
+            print(f"\033[31m[FATA]: {traceback.format_exc()}\033[0m", file=self.stream)
             if self.__has_gui():
                 self.view.log(message, "ERROR")
         else:
-            print(f"\033[31m[FATA]: {message}\033[0m")
+            print(f"\033[31m[FATA]: {message}\033[0m", file=self.stream)
             if self.__has_gui():
                 self.view.log(message, "ERROR")
\ No newline at end of file
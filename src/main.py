@@ -1,13 +1,8 @@
 import sys
-
-from PyQt5.QtWidgets import QApplication
+from multiprocessing import freeze_support
 
 from cli_argument_parser import CliArgumentParser
 from config_parser import ConfigParser
-from gui.main_controller import MainController
-from gui.main_model import MainModel
-from gui.main_view import MainView
-from headless_analyzer import HeadlessAnalyzer
 from logger import Logger
 
 
@@ -15,16 +10,22 @@ class StaticCodeAnalysisApp:
     def __init__(self):
         self.cli_args = CliArgumentParser()
         self.arguments = self.cli_args.get_parsed_arguments()
-        self.logger = Logger(self.arguments.quiet)
+        self.logger = Logger(self.arguments.quiet, sys.stderr if self.arguments.output_format == "jsonl" else None)
         self.config_parser = ConfigParser()
         
     def run(self) -> int:
+        # Every mode imports only what it needs. Headless runs and the daemon must not load Qt, which is missing on 
+        # minimal systems, and printing the usage does not even need GitPython.
+        if self.arguments.daemon:
+            from analysis_daemon import AnalysisDaemon
+            return AnalysisDaemon(self.logger, self.config_parser, self.arguments.socket_path).serve()
         if self.arguments.headless:
             return self.__run_headless()
         else:    
             return self.__run_gui()
         
     def __run_headless(self) -> int:
+        from headless_analyzer import HeadlessAnalyzer
         self.headless_analyzer = HeadlessAnalyzer(self.logger, self.config_parser)
         if not self.headless_analyzer.is_configuration_valid(self.arguments):
             return 2
@@ -32,6 +33,10 @@ class StaticCodeAnalysisApp:
             return self.headless_analyzer.perform_analysis(self.arguments)
     
     def __run_gui(self):
+        from PyQt5.QtWidgets import QApplication
+        from gui.main_controller import MainController
+        from gui.main_model import MainModel
+        from gui.main_view import MainView
         self.app = QApplication(sys.argv)
         # Create MVC components
         self.view = MainView()
@@ -46,5 +51,7 @@ class StaticCodeAnalysisApp:
         return self.app.exec_()
 
 if __name__ == "__main__":
+    # required for the worker processes of the parallel analysis in frozen executables
+    freeze_support()
     app = StaticCodeAnalysisApp()
     sys.exit(app.run())
@@ -3,8 +3,24 @@ class AnalysisArguments:
                  repository_directory: str, 
                  source_branch: str, 
                  destination_branch: str, 
-                 changed_lines_only: bool):
+                 changed_lines_only: bool,
+                 jobs: int = 1,
+                 read_only: bool = False,
+                 fetch: bool = True,
+                 remote_refs: bool = False,
+                 config_path: str | None = None,
+                 cache_directory: str | None = None,
+                 use_cache: bool = True,
+                 watch: bool = False):
         self.repository_directory: str = repository_directory
         self.source_branch: str = source_branch
         self.destination_branch: str = destination_branch
-        self.changed_lines_only: bool = changed_lines_only
\ No newline at end of file
+        self.changed_lines_only: bool = changed_lines_only
+        self.jobs: int = jobs
+        self.read_only: bool = read_only
+        self.fetch: bool = fetch
+        self.remote_refs: bool = remote_refs
+        self.config_path: str | None = config_path
+        self.cache_directory: str | None = cache_directory
+        self.use_cache: bool = use_cache
+        self.watch: bool = watch
\ No newline at end of file
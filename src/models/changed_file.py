@@ -4,10 +4,12 @@ from pathspec import PathSpec
 
 
 class ChangedFile:
-    def __init__(self, file_path: str, diff: str | None, check_entire_file: bool):
+    def __init__(self, file_path: str, diff: bytes | None, check_entire_file: bool, blob_sha: str | None = None):
         self.file_path = file_path
-        self.diff: str | None = diff
+        self.diff: bytes | None = diff
         self.check_entire_file = check_entire_file
+        # the content is read from this blob of the git object database instead of the file path, if specified
+        self.blob_sha: str | None = blob_sha
 
     def get_file_extension(self) -> str:
         return pathlib.Path(self.file_path).suffix
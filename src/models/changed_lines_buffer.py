@@ -0,0 +1,37 @@
+import re
+from bisect import bisect_right
+from itertools import accumulate
+from typing import Iterator
+
+from models.changed_line import ChangedLine
+
+
+class ChangedLinesBuffer:
+    # The changed lines of a file joined to a single text, so that a check searches all of them with one pass of 
+    # str.find or a regex instead of once per line. Every line keeps its line break, so a pattern which does not match 
+    # line breaks never matches across lines. Match offsets are mapped back to the lines by their start offsets.
+    def __init__(self, changed_lines: list[ChangedLine]):
+        self.changed_lines: list[ChangedLine] = changed_lines
+        contents = [changed_line.content for changed_line in changed_lines]
+        self.text: str = "".join(contents)
+        # the start offset of every line and the end of the text
+        self.line_starts: list[int] = list(accumulate(map(len, contents), initial=0))
+    
+    def get_line_index(self, offset: int) -> int:
+        return bisect_right(self.line_starts, offset) - 1
+    
+    def find_lines_containing(self, substring: str) -> Iterator[ChangedLine]:
+        # every line is returned once, the rest of a line is skipped after the first occurrence
+        offset = self.text.find(substring)
+        while offset != -1:
+            line_index = self.get_line_index(offset)
+            yield self.changed_lines[line_index]
+            offset = self.text.find(substring, self.line_starts[line_index + 1])
+    
+    def find_lines_matching(self, pattern: re.Pattern[str]) -> Iterator[ChangedLine]:
+        # The line of a match is the line it starts in. Like in find_lines_containing, every line is returned once.
+        match = pattern.search(self.text)
+        while match is not None:
+            line_index = self.get_line_index(match.start())
+            yield self.changed_lines[line_index]
+            match = pattern.search(self.text, self.line_starts[line_index + 1])
\ No newline at end of file
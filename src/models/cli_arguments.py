@@ -12,4 +12,16 @@ class CliArguments:
         self.changed_lines_only: bool = not parsed_arguments.all_lines
         self.quiet: bool = parsed_arguments.quiet
         self.exit_with_code: bool = parsed_arguments.exit_with_code
+        self.jobs: int = parsed_arguments.jobs
+        self.read_only: bool = parsed_arguments.read_only
+        self.fetch: bool = not parsed_arguments.no_fetch
+        self.remote_refs: bool = parsed_arguments.remote_refs
+        self.config_path: str | None = parsed_arguments.config
+        self.cache_directory: str | None = parsed_arguments.cache_dir
+        self.use_cache: bool = not parsed_arguments.no_cache
+        self.watch: bool = parsed_arguments.watch
+        self.output_format: str = parsed_arguments.format
+        self.daemon: bool = parsed_arguments.daemon
+        self.socket_path: str | None = parsed_arguments.socket
+        self.trace_path: str | None = parsed_arguments.trace_out
         
\ No newline at end of file
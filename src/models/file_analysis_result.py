@@ -5,6 +5,10 @@ class FileAnalysisResult:
     def __init__(self, file_path: str):
         self.file_path: str = file_path
         self.issues: list[LineAnalysisIssue] = []
+        # the time it took to analyze the file, measured where it was analyzed
+        self.analysis_time_in_seconds: float = 0.0
+        # the number of lines matched by every pattern of the regex checks, before the issues are compressed
+        self.pattern_hits: dict[str, int] = {}
         
     def has_issues(self):
         return len(self.issues) > 0
@@ -0,0 +1,14 @@
+from dataclasses import dataclass
+
+
+@dataclass
+class FilePatch:
+    a_path: str | None
+    b_path: str | None
+    new_file: bool
+    deleted_file: bool
+    renamed_file: bool
+    # full sha of the blob in the source branch, if git printed an index line
+    b_blob_sha: str | None
+    # the patch body starting at the first hunk header or the 'Binary files ... differ' line
+    diff: bytes
\ No newline at end of file
@@ -0,0 +1,120 @@
+import codecs
+import mmap
+import re
+from bisect import bisect_right
+from typing import Sequence, overload
+
+# Encodings in which a line break byte can be part of another character or whose decoding depends on the preceding text.
+_UNSLICEABLE_ENCODING_PREFIXES = ("utf-16", "utf-32", "utf-7", "iso2022", "hz")
+_LONE_CARRIAGE_RETURN = re.compile(rb"\r(?!\n)")
+
+
+class LazyLines(Sequence[str]):
+    # The lines of a memory mapped file or a blob, which are only decoded when they are accessed. Instead of the offset
+    # of every line, only one checkpoint per block of the content is indexed, by counting the line breaks of the block.
+    # The blocks are indexed up to the last accessed line, so a small change at the top of a huge file neither indexes
+    # nor decodes the rest of it. The lines are identical to the lines of the file opened in text mode.
+    BLOCK_SIZE = 4096
+    # memory mapped files cannot count bytes, so they are counted in slices of this size
+    COUNT_SLICE_SIZE = 1024 * 1024
+
+    def __init__(self, content: bytes | mmap.mmap, encoding: str):
+        self.__content = content
+        self.__encoding = codecs.lookup(encoding).name
+        start_offset = 0
+        if self.__encoding == "utf-8-sig":
+            # the byte order mark is removed by the decoder of the first line only
+            self.__encoding = "utf-8"
+            start_offset = len(codecs.BOM_UTF8) if content[:len(codecs.BOM_UTF8)] == codecs.BOM_UTF8 else 0
+        # the offset of a line start and the index of that line, one for every indexed block
+        self.__checkpoint_offsets: list[int] = [start_offset]
+        self.__checkpoint_lines: list[int] = [0]
+        self.__line_count: int | None = None
+
+    @staticmethod
+    def can_index(content: bytes | mmap.mmap, encoding: str) -> bool:
+        # Lines are split at line feed bytes, which requires an encoding that never uses them inside of a character.
+        # Files with old mac line breaks are rare enough to decode them as a whole.
+        try:
+            encoding_name = codecs.lookup(encoding).name
+        except LookupError:
+            return False
+        if encoding_name.startswith(_UNSLICEABLE_ENCODING_PREFIXES) or "\r\n".encode(encoding_name) != b"\r\n":
+            return False
+        return content.find(b"\r") == -1 or _LONE_CARRIAGE_RETURN.search(content) is None
+
+    @overload
+    def __getitem__(self, index: int) -> str: ...
+
+    @overload
+    def __getitem__(self, index: slice) -> list[str]: ...
+
+    def __getitem__(self, index: int | slice) -> str | list[str]:
+        if isinstance(index, slice):
+            if index.step is not None or index.start is None or index.stop is None or index.start < 0 \
+                    or index.stop < 0:
+                return [self[i] for i in range(*index.indices(len(self)))]
+            return self.__decode_lines(index.start, index.stop)
+        if index < 0:
+            index += len(self)
+        lines = self.__decode_lines(index, index + 1) if index >= 0 else []
+        if len(lines) == 0:
+            raise IndexError("line index out of range")
+        return lines[0]
+
+    def __len__(self) -> int:
+        while self.__line_count is None:
+            self.__index_next_block()
+        return self.__line_count
+
+    def __decode_lines(self, start: int, stop: int) -> list[str]:
+        # Decodes the lines from start to stop at once, the lines after the end of the content are left out.
+        if start >= stop:
+            return []
+        start_offset = self.__find_line_offset(start)
+        if start_offset is None:
+            return []
+        stop_offset = self.__skip_lines(start_offset, stop - start)
+        text = self.__content[start_offset:stop_offset].decode(self.__encoding, errors="replace")
+        lines = text.replace("\r\n", "\n").split("\n")
+        last_line = lines.pop()
+        lines = [line + "\n" for line in lines]
+        if len(last_line) > 0:
+            lines.append(last_line)
+        return lines
+
+    def __find_line_offset(self, line_index: int) -> int | None:
+        while self.__line_count is None and self.__checkpoint_lines[-1] <= line_index:
+            self.__index_next_block()
+        if self.__line_count is not None and line_index >= self.__line_count:
+            return None
+        checkpoint = bisect_right(self.__checkpoint_lines, line_index) - 1
+        return self.__skip_lines(self.__checkpoint_offsets[checkpoint], 
+                                 line_index - self.__checkpoint_lines[checkpoint])
+
+    def __skip_lines(self, offset: int, line_count: int) -> int:
+        for _ in range(line_count):
+            line_break = self.__content.find(b"\n", offset)
+            if line_break == -1:
+                return len(self.__content)
+            offset = line_break + 1
+        return offset
+
+    def __index_next_block(self):
+        # Every block ends after the first line break behind the block size, so that each checkpoint is a line start.
+        offset = self.__checkpoint_offsets[-1]
+        line_break = self.__content.find(b"\n", offset + self.BLOCK_SIZE)
+        if line_break == -1:
+            # the last block, whose final line might not end with a line break
+            content_length = len(self.__content)
+            line_count = self.__checkpoint_lines[-1] + self.__count_line_breaks(offset, content_length)
+            has_unterminated_line = content_length > offset and self.__content[content_length - 1:] != b"\n"
+            self.__line_count = line_count + (1 if has_unterminated_line else 0)
+            return
+        block_end = line_break + 1
+        self.__checkpoint_lines.append(self.__checkpoint_lines[-1] + self.__count_line_breaks(offset, block_end))
+        self.__checkpoint_offsets.append(block_end)
+    
+    def __count_line_breaks(self, start: int, end: int) -> int:
+        return sum(self.__content[slice_start:min(slice_start + self.COUNT_SLICE_SIZE, end)].count(b"\n")
+                   for slice_start in range(start, end, self.COUNT_SLICE_SIZE))
\ No newline at end of file
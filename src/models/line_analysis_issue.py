@@ -3,4 +3,6 @@ from dataclasses import dataclass
 @dataclass
 class LineAnalysisIssue:
     line_number: int
-    issue_description: str
\ No newline at end of file
+    issue_description: str
+    # the name of the check in the analysis config, or the pattern of a regex check, which found the issue
+    check_name: str = ""
\ No newline at end of file
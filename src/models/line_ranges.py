@@ -0,0 +1,56 @@
+from bisect import bisect_right
+from typing import Iterator
+
+
+class LineRanges:
+    # Stores line numbers as sorted, non-overlapping ranges. Every range includes its start and excludes its end.
+    
+    def __init__(self):
+        self.starts: list[int] = []
+        self.ends: list[int] = []
+        
+    def add_line(self, line_number: int):
+        self.add_range(line_number, line_number + 1)
+        
+    def add_range(self, start: int, end: int):
+        if start >= end:
+            return
+        if len(self.ends) == 0 or start > self.ends[-1]:
+            self.starts.append(start)
+            self.ends.append(end)
+        elif start >= self.starts[-1]:
+            # lines of a diff are added in ascending order, so usually only the last range has to be extended
+            self.ends[-1] = max(self.ends[-1], end)
+        else:
+            self.__merge_range(start, end)
+    
+    def __merge_range(self, start: int, end: int):
+        first_index = bisect_right(self.ends, start - 1)
+        last_index = bisect_right(self.starts, end) - 1
+        if first_index <= last_index:
+            start = min(start, self.starts[first_index])
+            end = max(end, self.ends[last_index])
+        self.starts[first_index:last_index + 1] = [start]
+        self.ends[first_index:last_index + 1] = [end]
+            
+    def get_ranges(self) -> Iterator[tuple[int, int]]:
+        return zip(self.starts, self.ends)
+    
+    def __contains__(self, line_number: int) -> bool:
+        index = bisect_right(self.starts, line_number) - 1
+        return index >= 0 and line_number < self.ends[index]
+    
+    def __iter__(self) -> Iterator[int]:
+        for start, end in self.get_ranges():
+            yield from range(start, end)
+            
+    def __len__(self) -> int:
+        return sum(end - start for start, end in self.get_ranges())
+    
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, LineRanges):
+            return NotImplemented
+        return self.starts == other.starts and self.ends == other.ends
+    
+    def __repr__(self) -> str:
+        return f"LineRanges({list(self.get_ranges())})"
\ No newline at end of file
@@ -1,3 +1,5 @@
+from typing import Sequence
+
 from models.changed_file import ChangedFile
 from models.changed_line import ChangedLine
 
@@ -6,9 +8,11 @@ class LoadedFile(ChangedFile):
     def __init__(self, 
                  changed_file: ChangedFile, 
                  file_encoding: str, 
-                 all_lines: list[str], 
+                 all_lines: Sequence[str], 
                  changed_lines: list[ChangedLine]):
-        super().__init__(changed_file.file_path, changed_file.diff, changed_file.check_entire_file)
+        super().__init__(changed_file.file_path, changed_file.diff, changed_file.check_entire_file, 
+                         changed_file.blob_sha)
         self.file_encoding: str = file_encoding
-        self.all_lines: list[str] = all_lines
+        # either a list of every line or the lazily decoded lines of a memory mapped file
+        self.all_lines: Sequence[str] = all_lines
         self.changed_lines: list[ChangedLine] = changed_lines
\ No newline at end of file
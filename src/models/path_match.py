@@ -0,0 +1,9 @@
+from dataclasses import dataclass
+
+
+@dataclass(frozen=True)
+class PathMatch:
+    is_forbidden: bool
+    is_ignored: bool
+    file_encoding: str | None
+    specific_check_patterns: tuple[str, ...]
\ No newline at end of file
@@ -0,0 +1,10 @@
+import re
+from dataclasses import dataclass
+
+
+@dataclass(frozen=True)
+class RegexPattern:
+    name: str
+    message: str
+    # compiled with re.MULTILINE, so '^' and '$' match at the start and the end of every line
+    regex: re.Pattern[str]
\ No newline at end of file
@@ -0,0 +1,18 @@
+from models.changed_line import ChangedLine
+
+
+class ScannedLine:
+    # One instance is reused for every line of a file, so that the fused line scan does not allocate per line.
+    __slots__ = ("number", "content", "length", "stripped_length")
+    
+    def __init__(self):
+        self.number: int = 0
+        self.content: str = ""
+        self.length: int = 0
+        self.stripped_length: int = 0
+        
+    def update(self, changed_line: ChangedLine):
+        self.number = changed_line.number
+        self.content = changed_line.content
+        self.length = len(changed_line.content)
+        self.stripped_length = len(changed_line.content.rstrip())
\ No newline at end of file
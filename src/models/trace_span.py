@@ -0,0 +1,28 @@
+import time
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from tracer import Tracer
+
+
+class TraceSpan:
+    # A span is recorded by its tracer when it ends. Attributes like the number of issues can be set while it is open.
+    def __init__(self, tracer: "Tracer", name: str, category: str):
+        self.tracer = tracer
+        self.name: str = name
+        self.category: str = category
+        self.attributes: dict[str, object] = {}
+        self.start_ns: int = 0
+    
+    def __enter__(self) -> "TraceSpan":
+        self.tracer.open_spans.append(self)
+        self.start_ns = time.perf_counter_ns()
+        return self
+    
+    def __exit__(self, exception_type, exception, exception_traceback):
+        end_ns = time.perf_counter_ns()
+        self.tracer.open_spans.pop()
+        self.tracer.record_span(self, end_ns)
+    
+    def set_attribute(self, name: str, value: object):
+        self.attributes[name] = value
\ No newline at end of file
@@ -0,0 +1,25 @@
+from tracer import Tracer
+
+
+class NullTracer(Tracer):
+    # Records nothing and is its own span, so the analysis is instrumented without checking whether tracing is enabled 
+    # and without creating a span object per file or check.
+    enabled = False
+    
+    def __init__(self):
+        super().__init__(0)
+    
+    def span(self, name: str, category: str) -> "NullTracer":
+        return self
+    
+    def __enter__(self) -> "NullTracer":
+        return self
+    
+    def __exit__(self, exception_type, exception, exception_traceback):
+        pass
+    
+    def set_attribute(self, name: str, value: object):
+        pass
+    
+    def add_events(self, events: list[dict[str, object]]):
+        pass
\ No newline at end of file
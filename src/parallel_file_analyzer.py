@@ -0,0 +1,83 @@
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor, Future
+from multiprocessing import get_context
+from typing import Iterable, Iterator
+
+from compiled_analysis_config import CompiledAnalysisConfig
+from file_analyzer import FileAnalyzer
+from models.changed_file import ChangedFile
+from models.file_analysis_result import FileAnalysisResult
+from null_tracer import NullTracer
+from result_cache import ResultCache
+from tracer import Tracer
+
+# Every worker process creates its file analyzer exactly once when it is started.
+_worker_file_analyzer: FileAnalyzer | None = None
+
+
+def _initialize_worker(compiled_config: CompiledAnalysisConfig, 
+                       repository_directory: str, 
+                       cache_directory: str | None, 
+                       trace_origin_ns: int | None):
+    global _worker_file_analyzer
+    result_cache = ResultCache(cache_directory) if cache_directory is not None else None
+    # the spans of a worker are recorded relative to the same origin as the spans of the main process
+    tracer = Tracer(trace_origin_ns) if trace_origin_ns is not None else NullTracer()
+    _worker_file_analyzer = FileAnalyzer(compiled_config, repository_directory, result_cache, tracer)
+
+
+def _analyze_chunk_in_worker(changed_files: list[ChangedFile]) -> tuple[list[FileAnalysisResult], list[dict]]:
+    # the recorded spans are sent back with the results of the chunk
+    results = [_worker_file_analyzer.try_analyze_changed_file(changed_file) for changed_file in changed_files]
+    return results, _worker_file_analyzer.tracer.pop_events()
+
+
+class ParallelFileAnalyzer:
+    def __init__(self, 
+                 compiled_config: CompiledAnalysisConfig, 
+                 repository_directory: str, 
+                 jobs: int, 
+                 cache_directory: str | None = None,
+                 chunk_size: int = 8, 
+                 tracer: Tracer | None = None):
+        self.compiled_config = compiled_config
+        self.repository_directory = repository_directory
+        self.jobs = jobs
+        # every worker process opens the result cache in this directory on its own
+        self.cache_directory = cache_directory
+        self.chunk_size = chunk_size
+        # Limits the number of chunks in flight, so that results can be returned in order without queueing every file.
+        self.max_pending_chunks = jobs * 4
+        self.tracer: Tracer = tracer if tracer is not None else NullTracer()
+        
+    def analyze_changed_files(self, changed_files: Iterable[ChangedFile]) -> Iterator[FileAnalysisResult]:
+        # 'spawn' behaves identical on every platform and is safe to use from the analysis thread of the GUI.
+        with ProcessPoolExecutor(max_workers=self.jobs, 
+                                 mp_context=get_context("spawn"), 
+                                 initializer=_initialize_worker,
+                                 initargs=(self.compiled_config, 
+                                           self.repository_directory, 
+                                           self.cache_directory, 
+                                           self.tracer.origin_ns if self.tracer.enabled else None)) as executor:
+            pending_chunks: deque[Future] = deque()
+            for chunk in self.__split_into_chunks(changed_files):
+                pending_chunks.append(executor.submit(_analyze_chunk_in_worker, chunk))
+                if len(pending_chunks) >= self.max_pending_chunks:
+                    yield from self.__get_results_of_chunk(pending_chunks.popleft())
+            while pending_chunks:
+                yield from self.__get_results_of_chunk(pending_chunks.popleft())
+    
+    def __get_results_of_chunk(self, pending_chunk: Future) -> list[FileAnalysisResult]:
+        results, events = pending_chunk.result()
+        self.tracer.add_events(events)
+        return results
+    
+    def __split_into_chunks(self, changed_files: Iterable[ChangedFile]) -> Iterator[list[ChangedFile]]:
+        chunk = []
+        for changed_file in changed_files:
+            chunk.append(changed_file)
+            if len(chunk) >= self.chunk_size:
+                yield chunk
+                chunk = []
+        if len(chunk) > 0:
+            yield chunk
@@ -0,0 +1,120 @@
+import os
+
+from pathspec import PathSpec
+from pathspec.util import normalize_file
+
+from analysis_config import AnalysisConfig
+from models.path_match import PathMatch
+
+
+class PathMatcher:
+    # Extension patterns (e.g. '*.sql') and plain file names are looked up in dictionaries. Like in git, they also match
+    # if one of the parent directories matches, so the matches of every directory are memoized. All other patterns are
+    # compiled once and matched against the whole path.
+    
+    def __init__(self, analysis_config: AnalysisConfig):
+        self.__groups: list[str] = []
+        self.__values: list[object] = []
+        self.__extension_index: dict[str, list[int]] = {}
+        self.__file_name_index: dict[str, list[int]] = {}
+        self.__compiled_patterns: list[tuple[int, PathSpec]] = []
+        self.__directory_matches: dict[str, frozenset[int]] = {"": frozenset()}
+        self.__ignored_directories: dict[str, bool] = {}
+        self.__add_patterns("forbidden", [(pattern, True) for pattern in analysis_config.forbidden_files])
+        self.__add_patterns("ignored", [(pattern, True) for pattern in analysis_config.ignored_files])
+        self.__add_patterns("encoding", list(analysis_config.file_encodings.items()))
+        self.__add_patterns("specific_checks", [(pattern, pattern) for pattern in analysis_config.specific_checks])
+        
+    def match(self, file_path: str) -> PathMatch:
+        matched_ids = sorted(self.__get_matching_pattern_ids(file_path))
+        is_forbidden = False
+        is_ignored = False
+        file_encoding = None
+        specific_check_patterns = []
+        for pattern_id in matched_ids:
+            group = self.__groups[pattern_id]
+            if group == "forbidden":
+                is_forbidden = True
+            elif group == "ignored":
+                is_ignored = True
+            elif group == "encoding":
+                # the first matching pattern in the config defines the encoding
+                if file_encoding is None:
+                    file_encoding = self.__values[pattern_id]
+            else:
+                specific_check_patterns.append(self.__values[pattern_id])
+        return PathMatch(is_forbidden, is_ignored, file_encoding, tuple(specific_check_patterns))
+    
+    def is_directory_ignored(self, directory: str) -> bool:
+        # A directory is ignored, if a pattern matches the directory itself. Then every file below it is ignored as 
+        # well, so the directory does not have to be visited at all.
+        is_ignored = self.__ignored_directories.get(directory)
+        if is_ignored is None:
+            matched_ids = set(self.__get_directory_matches(normalize_file(directory)))
+            directory_with_separator = os.path.join(directory, "")
+            for pattern_id, path_spec in self.__compiled_patterns:
+                if pattern_id not in matched_ids and path_spec.match_file(directory_with_separator):
+                    matched_ids.add(pattern_id)
+            is_ignored = any(self.__groups[pattern_id] == "ignored" for pattern_id in matched_ids)
+            self.__ignored_directories[directory] = is_ignored
+        return is_ignored
+    
+    def __add_patterns(self, group: str, patterns: list[tuple[str, object]]):
+        for pattern, value in patterns:
+            pattern_id = len(self.__groups)
+            self.__groups.append(group)
+            self.__values.append(value)
+            self.__add_pattern(pattern_id, pattern.strip())
+    
+    def __add_pattern(self, pattern_id: int, pattern: str):
+        simplified_pattern = self.__remove_leading_double_asterisk(pattern)
+        if not self.__is_indexable(simplified_pattern):
+            self.__compiled_patterns.append((pattern_id, PathSpec.from_lines('gitwildmatch', [pattern])))
+        elif simplified_pattern.startswith("*"):
+            self.__extension_index.setdefault(simplified_pattern[1:], []).append(pattern_id)
+        else:
+            self.__file_name_index.setdefault(simplified_pattern, []).append(pattern_id)
+        
+    def __remove_leading_double_asterisk(self, pattern: str) -> str:
+        # '**/name' is equivalent to 'name' as long as 'name' does not contain a separator
+        while pattern.startswith("**/"):
+            pattern = pattern[3:]
+        return pattern
+    
+    def __is_indexable(self, pattern: str) -> bool:
+        if len(pattern) == 0 or pattern[0] in "!#" or "/" in pattern or "\\" in pattern:
+            return False
+        if pattern.startswith("*."):
+            return not self.__contains_wildcard(pattern[1:])
+        return not self.__contains_wildcard(pattern)
+    
+    def __contains_wildcard(self, pattern: str) -> bool:
+        return "*" in pattern or "?" in pattern or "[" in pattern
+    
+    def __get_matching_pattern_ids(self, file_path: str) -> set[int]:
+        normalized_path = normalize_file(file_path)
+        directory, _, file_name = normalized_path.rpartition("/")
+        matched_ids = set(self.__get_directory_matches(directory))
+        matched_ids.update(self.__get_indexed_matches(file_name))
+        for pattern_id, path_spec in self.__compiled_patterns:
+            if pattern_id not in matched_ids and path_spec.match_file(file_path):
+                matched_ids.add(pattern_id)
+        return matched_ids
+    
+    def __get_directory_matches(self, directory: str) -> frozenset[int]:
+        directory_matches = self.__directory_matches.get(directory)
+        if directory_matches is None:
+            parent_directory, _, directory_name = directory.rpartition("/")
+            directory_matches = self.__get_directory_matches(parent_directory).union(
+                self.__get_indexed_matches(directory_name)
+            )
+            self.__directory_matches[directory] = directory_matches
+        return directory_matches
+    
+    def __get_indexed_matches(self, name: str) -> list[int]:
+        matched_ids = list(self.__file_name_index.get(name, []))
+        extension_start = name.find(".")
+        while extension_start != -1:
+            matched_ids += self.__extension_index.get(name[extension_start:], [])
+            extension_start = name.find(".", extension_start + 1)
+        return matched_ids
\ No newline at end of file
@@ -0,0 +1,109 @@
+import json
+import os
+import sqlite3
+import time
+from collections import OrderedDict
+
+from models.line_analysis_issue import LineAnalysisIssue
+
+
+class ResultCache:
+    # The issues and pattern hits of analyzed files are stored in a sqlite database, so that unchanged files are not 
+    # analyzed again by later runs. The keys identify the analyzed content, lines and checks. The most recently used 
+    # results of the current run are also kept in memory, so identical files are analyzed only once without the memory 
+    # growing with the size of the repository. If the database grows beyond the maximum size, the least recently used 
+    # entries are removed.
+    def __init__(self, 
+                 cache_directory: str, 
+                 max_size_in_bytes: int = 128 * 1024 * 1024, 
+                 max_entries_in_memory: int = 1024):
+        self.database_path = os.path.join(cache_directory, "results.sqlite3")
+        self.max_size_in_bytes = max_size_in_bytes
+        self.max_entries_in_memory = max_entries_in_memory
+        self.__connection: sqlite3.Connection | None = None
+        self.__is_database_available = True
+        # the results are kept serialized, which is compact and cannot be changed by the callers
+        self.__results_in_memory: OrderedDict[str, str] = OrderedDict()
+        
+    def get(self, cache_key: str) -> tuple[list[LineAnalysisIssue], dict[str, int]] | None:
+        serialized_result = self.__results_in_memory.get(cache_key)
+        if serialized_result is None:
+            serialized_result = self.__try_execute(self.__load_result, cache_key)
+            if serialized_result is None:
+                return None
+        result = json.loads(serialized_result)
+        if not isinstance(result, dict) or any(len(issue) != 3 for issue in result["issues"]):
+            # stored by a development version with another format
+            return None
+        self.__keep_in_memory(cache_key, serialized_result)
+        issues = [LineAnalysisIssue(line_number, issue_description, check_name) 
+                  for line_number, issue_description, check_name in result["issues"]]
+        return issues, result["pattern_hits"]
+    
+    def put(self, cache_key: str, issues: list[LineAnalysisIssue], pattern_hits: dict[str, int]):
+        serialized_result = json.dumps({
+            "issues": [(issue.line_number, issue.issue_description, issue.check_name) for issue in issues],
+            "pattern_hits": pattern_hits
+        })
+        self.__keep_in_memory(cache_key, serialized_result)
+        self.__try_execute(self.__store_result, cache_key, serialized_result)
+    
+    def __keep_in_memory(self, cache_key: str, serialized_result: str):
+        self.__results_in_memory[cache_key] = serialized_result
+        self.__results_in_memory.move_to_end(cache_key)
+        if len(self.__results_in_memory) > self.max_entries_in_memory:
+            self.__results_in_memory.popitem(last=False)
+        
+    def evict_least_recently_used(self):
+        self.__try_execute(self.__evict_least_recently_used)
+    
+    def __try_execute(self, function, *arguments) -> object:
+        if not self.__is_database_available:
+            return None
+        try:
+            return function(self.__get_connection(), *arguments)
+        except (OSError, sqlite3.Error):
+            # the cache is only an optimization, the analysis continues without it
+            self.__is_database_available = False
+            return None
+    
+    def __get_connection(self) -> sqlite3.Connection:
+        if self.__connection is None:
+            os.makedirs(os.path.dirname(self.database_path), exist_ok=True)
+            # every statement is committed right away, the worker processes share the database
+            connection = sqlite3.connect(self.database_path, timeout=30, isolation_level=None)
+            connection.execute("PRAGMA journal_mode=WAL")
+            connection.execute("PRAGMA synchronous=NORMAL")
+            connection.execute("CREATE TABLE IF NOT EXISTS results (cache_key TEXT PRIMARY KEY, issues TEXT NOT NULL, "
+                               "size INTEGER NOT NULL, last_used REAL NOT NULL)")
+            connection.execute("CREATE INDEX IF NOT EXISTS results_by_last_used ON results (last_used)")
+            self.__connection = connection
+        return self.__connection
+    
+    def __load_result(self, connection: sqlite3.Connection, cache_key: str) -> str | None:
+        row = connection.execute("SELECT issues FROM results WHERE cache_key = ?", (cache_key,)).fetchone()
+        if row is None:
+            return None
+        connection.execute("UPDATE results SET last_used = ? WHERE cache_key = ?", (time.time(), cache_key))
+        return row[0]
+    
+    def __store_result(self, connection: sqlite3.Connection, cache_key: str, serialized_result: str):
+        # the column keeps its name, so existing databases can still be used
+        connection.execute("INSERT OR REPLACE INTO results (cache_key, issues, size, last_used) VALUES (?, ?, ?, ?)",
+                           (cache_key, serialized_result, len(cache_key) + len(serialized_result), time.time()))
+    
+    def __evict_least_recently_used(self, connection: sqlite3.Connection):
+        total_size = connection.execute("SELECT COALESCE(SUM(size), 0) FROM results").fetchone()[0]
+        if total_size <= self.max_size_in_bytes:
+            return
+        size_to_remove = total_size - self.max_size_in_bytes
+        removed_size = 0
+        removed_keys = []
+        for cache_key, size in connection.execute("SELECT cache_key, size FROM results ORDER BY last_used"):
+            removed_keys.append((cache_key,))
+            removed_size += size
+            if removed_size >= size_to_remove:
+                break
+        with connection:
+            connection.execute("BEGIN")
+            connection.executemany("DELETE FROM results WHERE cache_key = ?", removed_keys)
\ No newline at end of file
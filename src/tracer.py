@@ -0,0 +1,71 @@
+import json
+import os
+import threading
+import time
+from collections import defaultdict
+
+from models.trace_span import TraceSpan
+
+
+class Tracer:
+    # Records the spans of an analysis as complete events of the Chrome trace event format, which can be opened in 
+    # chrome://tracing or https://ui.perfetto.dev. The timestamps are taken from the monotonic performance counter, 
+    # which all processes share, so the spans of the worker processes line up with the spans of the main process.
+    enabled = True
+    
+    def __init__(self, origin_ns: int | None = None):
+        # the point in time every timestamp is relative to
+        self.origin_ns: int = origin_ns if origin_ns is not None else time.perf_counter_ns()
+        self.events: list[dict[str, object]] = []
+        self.open_spans: list[TraceSpan] = []
+        self.__process_id = os.getpid()
+    
+    def span(self, name: str, category: str) -> TraceSpan:
+        return TraceSpan(self, name, category)
+    
+    def set_attribute(self, name: str, value: object):
+        # sets the attribute of the innermost open span
+        if len(self.open_spans) > 0:
+            self.open_spans[-1].set_attribute(name, value)
+    
+    def record_span(self, span: TraceSpan, end_ns: int):
+        self.events.append({
+            "name": span.name,
+            "cat": span.category,
+            "ph": "X",
+            "ts": (span.start_ns - self.origin_ns) / 1000,
+            "dur": (end_ns - span.start_ns) / 1000,
+            "pid": self.__process_id,
+            "tid": threading.get_native_id(),
+            "args": span.attributes,
+        })
+    
+    def add_events(self, events: list[dict[str, object]]):
+        # the events recorded by the tracer of a worker process
+        self.events += events
+    
+    def pop_events(self) -> list[dict[str, object]]:
+        events = self.events
+        self.events = []
+        return events
+    
+    def get_slowest_spans(self, category: str, count: int) -> list[tuple[str, float, int]]:
+        # Returns the name, the total duration in milliseconds and the number of the spans with the longest total 
+        # duration, e.g. of a check which is executed once per file.
+        durations: dict[str, float] = defaultdict(float)
+        span_counts: dict[str, int] = defaultdict(int)
+        for event in self.events:
+            if event["cat"] == category:
+                durations[event["name"]] += event["dur"] / 1000
+                span_counts[event["name"]] += 1
+        slowest_names = sorted(durations, key=durations.get, reverse=True)[:count]
+        return [(name, durations[name], span_counts[name]) for name in slowest_names]
+    
+    def write(self, file_path: str):
+        process_names = [{"name": "process_name", "ph": "M", "pid": process_id, 
+                          "args": {"name": "analysis" if process_id == self.__process_id else "worker"}}
+                         for process_id in dict.fromkeys(event["pid"] for event in self.events)]
+        # json.dumps uses the C encoder, which is much faster than the one of json.dump for many small events
+        trace = json.dumps({"traceEvents": process_names + self.events, "displayTimeUnit": "ms"})
+        with open(file_path, "w", encoding="utf-8") as file:
+            file.write(trace)
\ No newline at end of file
@@ -3,10 +3,10 @@ from models.file_analysis_result import FileAnalysisResult
 
 class AnalysisResultFormatter:
     @staticmethod
-    def build_result_text(results: list[FileAnalysisResult]) -> str:
+    def build_result_text(results: list[FileAnalysisResult], max_listed_issue_count: int | None = None) -> str:
         results = AnalysisResultFormatter.__filter_results_for_issues(results)
         if len(results) > 0:
-            return AnalysisResultFormatter.__get_result_text_for_issues(results)
+            return AnalysisResultFormatter.__get_result_text_for_issues(results, max_listed_issue_count)
         else:
             return "✅ No issues found in changed code"
 
@@ -15,9 +15,14 @@ class AnalysisResultFormatter:
         return [result for result in results if result.has_issues()]
 
     @staticmethod
-    def __get_result_text_for_issues(results: list[FileAnalysisResult]) -> str:
-        lines = [f"❌ Found {AnalysisResultFormatter.__count_issues(results)} issues in changed code"]
-        lines += AnalysisResultFormatter.__format_issues_for_info_output(results)
+    def __get_result_text_for_issues(results: list[FileAnalysisResult], max_listed_issue_count: int | None) -> str:
+        issue_count = AnalysisResultFormatter.__count_issues(results)
+        lines = [f"❌ Found {issue_count} issues in changed code"]
+        formatted_issues, listed_issue_count = AnalysisResultFormatter.__format_issues_for_info_output(
+            results, max_listed_issue_count)
+        lines += formatted_issues
+        if listed_issue_count < issue_count:
+            lines.append(f"... {issue_count - listed_issue_count} more issue(s) are not listed.")
         return "\n".join(lines)
     
     @staticmethod
@@ -25,11 +30,19 @@ class AnalysisResultFormatter:
         return sum([len(result.issues) for result in results])
 
     @staticmethod
-    def __format_issues_for_info_output(results: list[FileAnalysisResult]) -> list[str]:
+    def __format_issues_for_info_output(results: list[FileAnalysisResult], 
+                                        max_listed_issue_count: int | None) -> tuple[list[str], int]:
+        # Returns the lines and the number of listed issues, which stops at the maximum.
         formatted_issues = []
+        listed_issue_count = 0
         for result in results:
+            if max_listed_issue_count is not None and listed_issue_count >= max_listed_issue_count:
+                break
             formatted_issues.append(f"### File {result.file_path} has {len(result.issues)} issue(s):")
             prettified_issues = result.get_prettied_issues()
+            if max_listed_issue_count is not None:
+                prettified_issues = prettified_issues[:max_listed_issue_count - listed_issue_count]
             formatted_issues += [f"- [ ] {issue}" for issue in prettified_issues]
             formatted_issues.append("")
-        return formatted_issues
\ No newline at end of file
+            listed_issue_count += len(prettified_issues)
+        return formatted_issues, listed_issue_count
\ No newline at end of file
@@ -0,0 +1,11 @@
+import os
+
+
+class CacheDirectory:
+    @staticmethod
+    def get_default_path() -> str:
+        if os.name == "nt":
+            base_directory = os.environ.get("LOCALAPPDATA") or os.path.expanduser("~")
+        else:
+            base_directory = os.environ.get("XDG_CACHE_HOME") or os.path.join(os.path.expanduser("~"), ".cache")
+        return os.path.join(base_directory, "static-code-analysis")
\ No newline at end of file
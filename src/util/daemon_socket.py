@@ -0,0 +1,12 @@
+import os
+
+from util.cache_directory import CacheDirectory
+
+
+class DaemonSocket:
+    @staticmethod
+    def get_default_path() -> str:
+        # The runtime directory is private to the current user and cleared on logout, which suits a socket better than 
+        # the cache directory.
+        base_directory = os.environ.get("XDG_RUNTIME_DIR") or CacheDirectory.get_default_path()
+        return os.path.join(base_directory, "static-code-analysis.sock")
\ No newline at end of file
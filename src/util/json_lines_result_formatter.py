@@ -0,0 +1,31 @@
+import json
+
+from models.file_analysis_result import FileAnalysisResult
+
+
+class JsonLinesResultFormatter:
+    # Every record is a single line of json, so consumers can process the results while the analysis is still running.
+    @staticmethod
+    def build_file_record(result: FileAnalysisResult) -> str:
+        return json.dumps({
+            "type": "file",
+            "path": result.file_path,
+            "issues": [{"line": issue.line_number, "description": issue.issue_description} for issue in result.issues],
+            "pattern_hits": result.pattern_hits,
+            "time_in_seconds": round(result.analysis_time_in_seconds, 6)
+        }, ensure_ascii=False)
+    
+    @staticmethod
+    def build_summary_record(file_count: int, 
+                             files_with_issues_count: int, 
+                             issue_count: int, 
+                             pattern_hits: dict[str, int], 
+                             time_in_seconds: float) -> str:
+        return json.dumps({
+            "type": "summary",
+            "files": file_count,
+            "files_with_issues": files_with_issues_count,
+            "issues": issue_count,
+            "pattern_hits": pattern_hits,
+            "time_in_seconds": round(time_in_seconds, 6)
+        }, ensure_ascii=False)
\ No newline at end of file
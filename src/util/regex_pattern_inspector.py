@@ -0,0 +1,156 @@
+import re
+
+try:
+    from re import _constants as regex_constants, _parser as regex_parser
+except ImportError:
+    # Python 3.10
+    import sre_constants as regex_constants
+    import sre_parse as regex_parser
+
+
+class RegexPatternInspector:
+    # Python's regex engine backtracks and cannot be stopped while it searches, so patterns which can take exponential 
+    # time are rejected when the config is loaded. This is the case for a repeated group which contains another 
+    # repeat, e.g. '(a+)+' or '(\w*\s?)*', if one of them is unbounded. Backreferences cannot be combined with other 
+    # patterns and are rejected as well.
+    __repeats = (regex_constants.MAX_REPEAT, regex_constants.MIN_REPEAT)
+    # possessive repeats and atomic groups never backtrack (Python 3.11)
+    __possessive_repeats = tuple(getattr(regex_constants, name) for name in ("POSSESSIVE_REPEAT",) 
+                                 if hasattr(regex_constants, name))
+    __atomic_groups = tuple(getattr(regex_constants, name) for name in ("ATOMIC_GROUP",) 
+                            if hasattr(regex_constants, name))
+    __backreferences = (regex_constants.GROUPREF, regex_constants.GROUPREF_EXISTS)
+    __zero_width = (regex_constants.AT, regex_constants.ASSERT, regex_constants.ASSERT_NOT)
+    __category_escapes = {
+        regex_constants.CATEGORY_DIGIT: r"\d",
+        regex_constants.CATEGORY_NOT_DIGIT: r"\D",
+        regex_constants.CATEGORY_SPACE: r"\s",
+        regex_constants.CATEGORY_NOT_SPACE: r"\S",
+        regex_constants.CATEGORY_WORD: r"\w",
+        regex_constants.CATEGORY_NOT_WORD: r"\W",
+    }
+    
+    @staticmethod
+    def validate(pattern: str, flags: int = 0):
+        try:
+            compiled_pattern = re.compile(pattern, flags)
+        except re.error as error:
+            raise ValueError(f"The regex '{pattern}' is invalid: {error}")
+        if len(compiled_pattern.groupindex) > 0 or compiled_pattern.flags & ~(re.UNICODE | flags) != 0:
+            raise ValueError(f"The regex '{pattern}' must not contain named groups or global inline flags.")
+        if compiled_pattern.search("") is not None:
+            raise ValueError(f"The regex '{pattern}' matches empty text, so it would report every line.")
+        RegexPatternInspector.__validate_items(pattern, regex_parser.parse(pattern, flags), None)
+    
+    @staticmethod
+    def get_first_characters(pattern: str, flags: int = 0) -> tuple[list[str], bool] | None:
+        # Returns the items of a character class which contains every character a match can start with and whether 
+        # the class must ignore the case. A class with more characters than needed is fine, but None is returned if 
+        # the first characters cannot be determined.
+        first_characters = RegexPatternInspector.__get_first_characters(regex_parser.parse(pattern, flags), 
+                                                                        flags & re.IGNORECASE != 0)
+        if first_characters is None:
+            return None
+        class_items, ignore_case, can_be_empty = first_characters
+        return (class_items, ignore_case) if not can_be_empty else None
+    
+    @staticmethod
+    def __validate_items(pattern: str, items: list, outer_repeat_is_unbounded: bool | None):
+        # outer_repeat_is_unbounded is None outside of repeats with a maximum above one
+        for operator, argument in items:
+            if operator in RegexPatternInspector.__possessive_repeats + RegexPatternInspector.__atomic_groups:
+                continue
+            if operator in RegexPatternInspector.__backreferences:
+                raise ValueError(f"The regex '{pattern}' must not contain backreferences.")
+            if operator in RegexPatternInspector.__repeats and argument[1] > 1:
+                is_unbounded = argument[1] == regex_constants.MAXREPEAT
+                if outer_repeat_is_unbounded is not None and (outer_repeat_is_unbounded or is_unbounded):
+                    raise ValueError(f"The regex '{pattern}' contains a repeat inside of another repeat, which can "
+                                     f"take exponential time. Please rewrite it without the nested repeat.")
+                RegexPatternInspector.__validate_items(pattern, argument[2], is_unbounded)
+                continue
+            for sub_pattern in RegexPatternInspector.__get_sub_patterns(argument):
+                RegexPatternInspector.__validate_items(pattern, sub_pattern, outer_repeat_is_unbounded)
+    
+    @staticmethod
+    def __get_sub_patterns(argument: object) -> list:
+        if isinstance(argument, regex_parser.SubPattern):
+            return [argument]
+        if isinstance(argument, (tuple, list)):
+            return [sub_pattern for item in argument for sub_pattern in RegexPatternInspector.__get_sub_patterns(item)]
+        return []
+    
+    @staticmethod
+    def __get_first_characters(items: list, ignore_case: bool) -> tuple[list[str], bool, bool] | None:
+        # Returns the class items, whether they ignore the case and whether the items can match without consuming a 
+        # character. The first characters of optional items are collected until an item which consumes a character.
+        class_items = []
+        items_ignore_case = False
+        for operator, argument in items:
+            first_characters = RegexPatternInspector.__get_first_characters_of_item(operator, argument, ignore_case)
+            if first_characters is None:
+                return None
+            class_items += first_characters[0]
+            items_ignore_case = items_ignore_case or first_characters[1]
+            if not first_characters[2]:
+                return class_items, items_ignore_case, False
+        return class_items, items_ignore_case, True
+    
+    @staticmethod
+    def __get_first_characters_of_item(operator: object, 
+                                       argument: object, 
+                                       ignore_case: bool) -> tuple[list[str], bool, bool] | None:
+        if operator in RegexPatternInspector.__zero_width:
+            return [], False, True
+        if operator == regex_constants.LITERAL:
+            return [re.escape(chr(argument))], ignore_case, False
+        if operator == regex_constants.IN:
+            class_items = RegexPatternInspector.__get_class_items(argument)
+            return (class_items, ignore_case, False) if class_items is not None else None
+        if operator == regex_constants.SUBPATTERN:
+            _, added_flags, removed_flags, sub_pattern = argument
+            sub_pattern_ignores_case = (ignore_case or added_flags & re.IGNORECASE != 0) \
+                and removed_flags & re.IGNORECASE == 0
+            return RegexPatternInspector.__get_first_characters(sub_pattern, sub_pattern_ignores_case)
+        if operator == regex_constants.BRANCH:
+            return RegexPatternInspector.__get_first_characters_of_branches(argument[1], ignore_case)
+        if operator in RegexPatternInspector.__repeats + RegexPatternInspector.__possessive_repeats:
+            minimum, _, repeated_items = argument
+            first_characters = RegexPatternInspector.__get_first_characters(repeated_items, ignore_case)
+            if first_characters is None:
+                return None
+            class_items, items_ignore_case, can_be_empty = first_characters
+            return class_items, items_ignore_case, can_be_empty or minimum == 0
+        if operator in RegexPatternInspector.__atomic_groups:
+            return RegexPatternInspector.__get_first_characters(argument, ignore_case)
+        # e.g. any character or a negated literal
+        return None
+    
+    @staticmethod
+    def __get_first_characters_of_branches(branches: list, ignore_case: bool) -> tuple[list[str], bool, bool] | None:
+        class_items = []
+        branches_ignore_case = False
+        can_be_empty = False
+        for branch in branches:
+            first_characters = RegexPatternInspector.__get_first_characters(branch, ignore_case)
+            if first_characters is None:
+                return None
+            class_items += first_characters[0]
+            branches_ignore_case = branches_ignore_case or first_characters[1]
+            can_be_empty = can_be_empty or first_characters[2]
+        return class_items, branches_ignore_case, can_be_empty
+    
+    @staticmethod
+    def __get_class_items(class_definition: list) -> list[str] | None:
+        class_items = []
+        for operator, argument in class_definition:
+            if operator == regex_constants.LITERAL:
+                class_items.append(re.escape(chr(argument)))
+            elif operator == regex_constants.RANGE:
+                class_items.append(f"{re.escape(chr(argument[0]))}-{re.escape(chr(argument[1]))}")
+            elif operator == regex_constants.CATEGORY and argument in RegexPatternInspector.__category_escapes:
+                class_items.append(RegexPatternInspector.__category_escapes[argument])
+            else:
+                # e.g. negated classes
+                return None
+        return class_items
\ No newline at end of file
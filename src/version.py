@@ -0,0 +1,34 @@
+import hashlib
+import os
+import sys
+
+# Change this with every release. Caches created by another version of the tool are not used.
+VERSION = "18.10.2026"
+# the version of the caches, which is determined on first use
+_cache_version: str | None = None
+
+
+def get_cache_version() -> str:
+    # The caches store the compiled configs and the issues found by the checks, so they have to be invalidated by 
+    # every change of the code, even if VERSION was not increased. The sources are hashed once per process. A frozen 
+    # executable contains no sources, it is identified by its size and modification time instead.
+    global _cache_version
+    if _cache_version is None:
+        code_hash = hashlib.sha256(VERSION.encode("utf-8"))
+        if getattr(sys, "frozen", False):
+            executable_stat = os.stat(sys.executable)
+            code_hash.update(f"{executable_stat.st_size}|{executable_stat.st_mtime_ns}".encode("utf-8"))
+        else:
+            source_directory = os.path.dirname(os.path.abspath(__file__))
+            for source_path in sorted(_find_source_files(source_directory)):
+                code_hash.update(b"\0" + os.path.relpath(source_path, source_directory).encode("utf-8") + b"\0")
+                with open(source_path, "rb") as file:
+                    code_hash.update(file.read())
+        _cache_version = code_hash.hexdigest()
+    return _cache_version
+
+
+def _find_source_files(source_directory: str) -> list[str]:
+    return [os.path.join(directory, file_name) 
+            for directory, _, file_names in os.walk(source_directory) 
+            for file_name in file_names if file_name.endswith(".py")]
\ No newline at end of file
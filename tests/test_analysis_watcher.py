@@ -0,0 +1,76 @@
+import subprocess
+from threading import Event, Thread
+
+from analysis_watcher import AnalysisWatcher
+from config_parser import ConfigParser
+from git_assistant import GitAssistant
+from logger import Logger
+from models.analysis_arguments import AnalysisArguments
+
+CONFIG_TEMPLATE = "{{forbidden_files: [], ignored_files: [], standard_checks: {{{checks}}}, specific_checks: {{}}}}"
+
+
+def create_repository(directory: str):
+    git = ["git", "-C", directory, "-c", "user.name=test", "-c", "user.email=test@localhost"]
+    subprocess.run(git + ["init", "-q", "-b", "main"], check=True)
+    subprocess.run(git + ["commit", "-q", "--allow-empty", "-m", "base"], check=True)
+    subprocess.run(git + ["checkout", "-q", "-b", "feature"], check=True)
+    with open(f"{directory}/file.py", "w", encoding="utf-8") as file:
+        file.write("\tvalue = 1          \n")
+    subprocess.run(git + ["add", "-A"], check=True)
+    subprocess.run(git + ["commit", "-q", "-m", "file"], check=True)
+
+
+def get_issue_descriptions(watcher: AnalysisWatcher) -> list[str]:
+    return [issue.issue_description for result in watcher.results for issue in result.issues]
+
+
+def create_analysis_arguments(tmp_path) -> AnalysisArguments:
+    repository_directory = tmp_path / "repository"
+    repository_directory.mkdir()
+    create_repository(str(repository_directory))
+    config_path = tmp_path / "config.json5"
+    config_path.write_text(CONFIG_TEMPLATE.format(checks="tabs: null"))
+    return AnalysisArguments(str(repository_directory), "feature", "main", False, read_only=True, fetch=False, 
+                             config_path=str(config_path), use_cache=False)
+
+
+def test_changed_config_file_discards_the_results(tmp_path):
+    analysis_arguments = create_analysis_arguments(tmp_path)
+    watcher = AnalysisWatcher(Logger(False), ConfigParser(), GitAssistant(analysis_arguments.repository_directory))
+    watcher.analyze_changes(analysis_arguments)
+    tab_issues = get_issue_descriptions(watcher)
+    assert len(tab_issues) == 1
+    
+    # the branches did not move, only the config file changed
+    trailing_whitespace_check = "trailing_whitespace: {max_trailing_whitespaces: 2}"
+    (tmp_path / "config.json5").write_text(CONFIG_TEMPLATE.format(checks=trailing_whitespace_check))
+    watcher.analyze_changes(analysis_arguments)
+    assert len(get_issue_descriptions(watcher)) == 1
+    assert get_issue_descriptions(watcher) != tab_issues
+
+
+def test_changed_config_file_is_analyzed_again_while_watching(tmp_path):
+    analysis_arguments = create_analysis_arguments(tmp_path)
+    watcher = AnalysisWatcher(Logger(False), ConfigParser(), GitAssistant(analysis_arguments.repository_directory), 
+                              poll_interval_in_seconds=0.01)
+    updates: list[list[str]] = []
+    updated = Event()
+    stop_event = Event()
+    
+    def on_results_updated(results):
+        updates.append([issue.issue_description for result in results for issue in result.issues])
+        updated.set()
+    
+    watch_thread = Thread(target=watcher.watch, args=(analysis_arguments, on_results_updated, stop_event))
+    watch_thread.start()
+    try:
+        assert updated.wait(10)
+        updated.clear()
+        (tmp_path / "config.json5").write_text(CONFIG_TEMPLATE.format(checks=""))
+        assert updated.wait(10)
+    finally:
+        stop_event.set()
+        watch_thread.join()
+    assert len(updates[0]) == 1
+    assert updates[1] == []
@@ -0,0 +1,25 @@
+import codecs
+
+from binary_file_detector import BinaryFileDetector
+
+
+def test_content_with_nul_byte_is_binary():
+    assert BinaryFileDetector.is_binary_content(b"PK\x03\x04\0\0data", "utf-8")
+    assert not BinaryFileDetector.is_binary_content(b"print('text')\n", "utf-8")
+
+
+def test_nul_byte_after_the_sniffed_bytes_is_ignored():
+    assert not BinaryFileDetector.is_binary_content(b"x" * BinaryFileDetector.SNIFF_SIZE + b"\0", "utf-8")
+
+
+def test_binary_diff_marks_text_content_as_binary():
+    # e.g. a file with the 'binary' attribute in .gitattributes
+    assert BinaryFileDetector.is_binary_diff(b"Binary files /dev/null and b/x.blob differ\n")
+    assert BinaryFileDetector.is_binary_content(b"plain text\n", "utf-8", has_binary_diff=True)
+
+
+def test_byte_order_marks_and_wide_encodings_are_text():
+    utf16_content = codecs.BOM_UTF16_LE + "text\n".encode("utf-16-le")
+    assert not BinaryFileDetector.is_binary_content(utf16_content, "utf-8", has_binary_diff=True)
+    assert not BinaryFileDetector.is_binary_content("text\n".encode("utf-16-le"), "utf-16-le", has_binary_diff=True)
+    assert not BinaryFileDetector.is_binary_content("text\n".encode("utf-32"), "utf-32")
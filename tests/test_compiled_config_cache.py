@@ -0,0 +1,40 @@
+import os
+
+from compiled_analysis_config import CompiledAnalysisConfig
+from compiled_config_cache import CompiledConfigCache
+from config_parser import ConfigParser
+
+CONFIG_CONTENT = b"""{
+  forbidden_files: ["*.exe"],
+  ignored_files: ["node_modules/"],
+  standard_checks: {tabs: null, line_length: {max_line_length: 100}},
+  specific_checks: {"*.sql": {regex: {patterns: [{name: "select", pattern: "select \\\\*", message: "Star."}]}}},
+}"""
+
+
+def compile_config() -> CompiledAnalysisConfig:
+    return CompiledAnalysisConfig(ConfigParser().load_analysis_config_from_text(CONFIG_CONTENT.decode("utf-8")))
+
+
+def get_stored_files(cache_directory: str) -> list[str]:
+    directory = os.path.join(cache_directory, "compiled_configs")
+    return [os.path.join(directory, file_name) for file_name in os.listdir(directory)]
+
+
+def test_stored_config_is_compiled_again(tmp_path):
+    CompiledConfigCache(str(tmp_path)).store(CONFIG_CONTENT, compile_config())
+    # a new process starts without the configs which were loaded before
+    CompiledConfigCache.clear()
+    compiled_config = CompiledConfigCache(str(tmp_path)).load(CONFIG_CONTENT)
+    assert vars(compiled_config.analysis_config) == vars(compile_config().analysis_config)
+    assert [check.name for check in compiled_config.standard_checks] == ["tabs", "line_length"]
+    assert [check.name for check in compiled_config.specific_checks["*.sql"]] == ["regex"]
+
+
+def test_invalid_stored_config_is_not_loaded(tmp_path):
+    CompiledConfigCache(str(tmp_path)).store(CONFIG_CONTENT, compile_config())
+    for file_path in get_stored_files(str(tmp_path)):
+        with open(file_path, "w", encoding="utf-8") as file:
+            file.write('{"standard_checks": {"unknown_check": null}}')
+    CompiledConfigCache.clear()
+    assert CompiledConfigCache(str(tmp_path)).load(CONFIG_CONTENT) is None
@@ -0,0 +1,70 @@
+import random
+import re
+
+import pytest
+
+from diff_parser import DiffParser
+
+HUNK_PATTERN = r'@@ -(\d+)(?:,(\d+))? \+(\d+)(?:,(\d+))? @@'
+LINE_CONTENTS = ["", "x", "value = 1", "  indented", "@@ not a header", "+++ b/file", "--- a/file", "+", "-", " ", 
+                 "\ttab", "trailing\r", "ümläut", "@"]
+
+
+def parse_line_by_line(diff_text: str) -> set[int]:
+    # The parser which was replaced by DiffParser, it is the reference for the added lines.
+    added_lines = set()
+    current_line_number = None
+    for line in diff_text.split("\n"):
+        hunk_match = re.match(HUNK_PATTERN, line)
+        if hunk_match:
+            current_line_number = int(hunk_match.group(3))
+        elif current_line_number is not None:
+            if line.startswith("+") and not line.startswith("+++"):
+                added_lines.add(current_line_number)
+                current_line_number += 1
+            elif line.startswith(" "):
+                current_line_number += 1
+    return added_lines
+
+
+def create_random_diff(random_generator: random.Random) -> str:
+    lines = []
+    if random_generator.random() < 0.5:
+        lines += ["diff --git a/file b/file", "index 1234567..89abcde 100644", "--- a/file", "+++ b/file"]
+    for _ in range(random_generator.randint(0, 4)):
+        old_start, new_start = random_generator.randint(0, 500), random_generator.randint(0, 500)
+        old_count = f",{random_generator.randint(0, 30)}" if random_generator.random() < 0.7 else ""
+        new_count = f",{random_generator.randint(0, 30)}" if random_generator.random() < 0.7 else ""
+        section = " def function():" if random_generator.random() < 0.3 else ""
+        lines.append(f"@@ -{old_start}{old_count} +{new_start}{new_count} @@{section}")
+        for _ in range(random_generator.randint(0, 30)):
+            prefix = random_generator.choice(["+", "+", "-", " ", " ", "\\ No newline at end of file", "", "+++", 
+                                              "---"])
+            lines.append(prefix + random_generator.choice(LINE_CONTENTS))
+    diff_text = "\n".join(lines)
+    if random_generator.random() < 0.5:
+        diff_text += "\n"
+    return diff_text
+
+
+def get_line_numbers(diff: str | bytes | memoryview) -> set[int]:
+    return {line_number for start, end in DiffParser.parse_added_line_ranges(diff).get_ranges() 
+            for line_number in range(start, end)}
+
+
+@pytest.mark.parametrize("seed", range(20))
+def test_random_diffs_match_the_line_by_line_parser(seed: int):
+    random_generator = random.Random(seed)
+    for _ in range(500):
+        diff_text = create_random_diff(random_generator)
+        expected_lines = parse_line_by_line(diff_text)
+        diff_bytes = diff_text.encode("utf-8")
+        assert get_line_numbers(diff_text) == expected_lines, diff_text
+        assert get_line_numbers(diff_bytes) == expected_lines, diff_text
+        assert get_line_numbers(memoryview(diff_bytes)) == expected_lines, diff_text
+
+
+def test_added_lines_of_a_hunk():
+    # like the file headers, lines starting with '+++' are skipped and do not count as lines of the new file
+    diff_text = "@@ -1,3 +1,4 @@\n context\n-removed\n+added\n+++skipped\n context\n+last"
+    assert get_line_numbers(diff_text) == {2, 4}
@@ -0,0 +1,76 @@
+import io
+import os
+import subprocess
+
+import pytest
+from git import Repo
+
+from diff_stream_reader import DiffStreamReader
+
+# the arguments of GitAssistant, which streams the diff of a pull request
+DIFF_TREE_ARGUMENTS = ["diff-tree", "-r", "-p", "-M", "--full-index", "--no-color", "--no-ext-diff", "--textconv", 
+                       "--src-prefix=a/", "--dst-prefix=b/"]
+
+
+def write_file(directory: str, relative_path: str, content: bytes):
+    with open(os.path.join(directory, relative_path), "wb") as file:
+        file.write(content)
+
+
+def commit_all(directory: str, message: str):
+    git = ["git", "-C", directory, "-c", "user.name=test", "-c", "user.email=test@localhost"]
+    subprocess.run(git + ["add", "-A"], check=True)
+    subprocess.run(git + ["commit", "-q", "-m", message], check=True)
+
+
+@pytest.fixture(scope="module")
+def repository_directory(tmp_path_factory) -> str:
+    # every file has another shape of the diff header
+    directory = str(tmp_path_factory.mktemp("repository"))
+    subprocess.run(["git", "init", "-q", "-b", "main", directory], check=True)
+    numbered_lines = "".join(f"{number}\n" for number in range(1, 31)).encode("ascii")
+    for relative_path, content in [("renamed.txt", numbered_lines), ("renamed_edited.txt", numbered_lines), 
+                                   ("mode.sh", b"echo\n"), ("with space.txt", b"x\n"), ("deleted.txt", b"y\n"), 
+                                   ("data.bin", b"a\0b"), ('quo"te.txt', b"q\n"), ("modified.txt", b"m\n")]:
+        write_file(directory, relative_path, content)
+    commit_all(directory, "base")
+    os.rename(os.path.join(directory, "renamed.txt"), os.path.join(directory, "moved.txt"))
+    os.remove(os.path.join(directory, "renamed_edited.txt"))
+    write_file(directory, "moved edited.txt", numbered_lines + b"31\n")
+    os.chmod(os.path.join(directory, "mode.sh"), 0o755)
+    os.remove(os.path.join(directory, "deleted.txt"))
+    for relative_path, content in [("with space.txt", b"x\nx2\n"), ("data.bin", b"a\0c"), ('quo"te.txt', b"q\nq2\n"), 
+                                   ("modified.txt", b"m\nm2\n"), ("ümlaut\ttab.txt", b"n\n"), 
+                                   ("empty_new.txt", b""), ("new.bin", b"new\0bin")]:
+        write_file(directory, relative_path, content)
+    commit_all(directory, "change")
+    return directory
+
+
+def test_file_patches_are_equal_to_the_diffs_of_gitpython(repository_directory):
+    diff_tree_output = subprocess.run(["git", "-C", repository_directory] + DIFF_TREE_ARGUMENTS + ["HEAD~1", "HEAD"], 
+                                      check=True, capture_output=True).stdout
+    file_patches = list(DiffStreamReader.read_file_patches(io.BytesIO(diff_tree_output)))
+    
+    repo = Repo(repository_directory)
+    diffs = repo.commit("HEAD~1").diff(repo.commit("HEAD"), create_patch=True, textconv=True)
+    assert [(file_patch.b_path, file_patch.new_file, file_patch.deleted_file, file_patch.renamed_file, 
+             file_patch.b_blob_sha, file_patch.diff) for file_patch in file_patches] == \
+        [(diff.b_path, diff.new_file, diff.deleted_file, diff.renamed_file, 
+          diff.b_blob.hexsha if diff.b_blob is not None else None, diff.diff) for diff in diffs]
+    # the analysis does not use the old path of new files, which GitPython sets for some of them
+    assert [file_patch.a_path for file_patch in file_patches if not file_patch.new_file] == \
+        [diff.a_path for diff in diffs if not diff.new_file]
+    assert {file_patch.b_path for file_patch in file_patches} == {
+        "data.bin", None, "empty_new.txt", "mode.sh", "modified.txt", "moved edited.txt", "moved.txt", "new.bin", 
+        'quo"te.txt', "with space.txt", "ümlaut\ttab.txt"}
+
+
+def test_file_patch_is_yielded_once_the_next_header_is_read():
+    lines = iter([b"diff --git a/x.txt b/x.txt\n", b"index 1111111..2222222 100644\n", b"--- a/x.txt\n", 
+                  b"+++ b/x.txt\n", b"@@ -1 +1 @@\n", b"-a\n", b"+b\n", b"diff --git a/y.txt b/y.txt\n", 
+                  b"new file mode 100644\n"])
+    file_patches = DiffStreamReader.read_file_patches(lines)
+    assert next(file_patches).diff == b"@@ -1 +1 @@\n-a\n+b\n"
+    # the rest of the diff is not read yet
+    assert next(lines) == b"new file mode 100644\n"
@@ -0,0 +1,49 @@
+import random
+
+import pytest
+
+from models.line_ranges import LineRanges
+
+
+def add_random_ranges(random_generator: random.Random, line_ranges: LineRanges, line_numbers: set[int]):
+    # short ranges close to each other, so that many of them are adjacent or overlap, in ascending and random order
+    starts = [random_generator.randint(1, 60) for _ in range(random_generator.randint(0, 15))]
+    if random_generator.random() < 0.5:
+        starts.sort()
+    for start in starts:
+        if random_generator.random() < 0.3:
+            line_ranges.add_line(start)
+            line_numbers.add(start)
+        else:
+            end = start + random_generator.randint(-1, 6)
+            line_ranges.add_range(start, end)
+            line_numbers.update(range(start, end))
+
+
+@pytest.mark.parametrize("seed", range(20))
+def test_random_ranges_contain_the_same_lines_as_a_set(seed: int):
+    random_generator = random.Random(seed)
+    for _ in range(500):
+        line_ranges = LineRanges()
+        line_numbers: set[int] = set()
+        add_random_ranges(random_generator, line_ranges, line_numbers)
+        assert list(line_ranges) == sorted(line_numbers)
+        assert len(line_ranges) == len(line_numbers)
+        assert all((line_number in line_ranges) == (line_number in line_numbers) for line_number in range(0, 70))
+        ranges = list(line_ranges.get_ranges())
+        # the ranges are merged, so neither adjacent nor overlapping ranges are left
+        assert all(start < end for start, end in ranges)
+        assert all(previous_end < start for (_, previous_end), (start, _) in zip(ranges, ranges[1:]))
+
+
+def test_adjacent_and_overlapping_ranges_are_merged():
+    line_ranges = LineRanges()
+    line_ranges.add_range(10, 12)
+    line_ranges.add_range(1, 3)
+    line_ranges.add_range(3, 5)
+    line_ranges.add_range(11, 20)
+    line_ranges.add_line(7)
+    assert list(line_ranges.get_ranges()) == [(1, 5), (7, 8), (10, 20)]
+    assert 4 in line_ranges and 5 not in line_ranges and 19 in line_ranges and 20 not in line_ranges
+    line_ranges.add_range(4, 11)
+    assert list(line_ranges.get_ranges()) == [(1, 20)]
@@ -0,0 +1,87 @@
+import random
+from functools import cache
+
+import pytest
+from pathspec import PathSpec
+
+from analysis_config import AnalysisConfig
+from models.path_match import PathMatch
+from path_matcher import PathMatcher
+
+NAMES = ["src", "lib", "build", "node_modules", "a", "b.c", "x.py", "y.sql", "z.tar.gz", "README.md", ".gitignore", 
+         "Makefile", "ümläut.txt", "with space.py"]
+# pathspec warns about the name 'gitwildmatch' for every compiled pattern, the analysis uses it as well
+pytestmark = pytest.mark.filterwarnings("ignore::DeprecationWarning")
+PATTERN_TEMPLATES = ["{name}", "*.py", "*.sql", "*.gz", "*.tar.gz", "*.md", "**/*.py", "**/**/{name}", "{name}/", 
+                     "{name}/**", "**/{name}/*.py", "/{name}", "!{name}", "!*.py", "{name}/{other}", "*{name}", "?.py", 
+                     "[xy].py", "src/**/{name}", "#{name}", "  *.sql  ", "{name}*", "**/{name}", "*", "**"]
+
+
+@cache
+def compile_pattern(pattern: str) -> PathSpec:
+    return PathSpec.from_lines('gitwildmatch', [pattern.strip()])
+
+
+def match_rule_by_rule(analysis_config: AnalysisConfig, file_path: str) -> PathMatch:
+    # The matching which was replaced by PathMatcher, every pattern is compiled and matched on its own.
+    def matches(pattern: str) -> bool:
+        return compile_pattern(pattern).match_file(file_path)
+    
+    file_encoding = next((encoding for pattern, encoding in analysis_config.file_encodings.items() 
+                          if matches(pattern)), None)
+    return PathMatch(any(matches(pattern) for pattern in analysis_config.forbidden_files), 
+                     any(matches(pattern) for pattern in analysis_config.ignored_files), 
+                     file_encoding, 
+                     tuple(pattern for pattern in analysis_config.specific_checks if matches(pattern)))
+
+
+def create_random_patterns(random_generator: random.Random, count: int) -> list[str]:
+    return [random_generator.choice(PATTERN_TEMPLATES).format(name=random_generator.choice(NAMES), 
+                                                              other=random_generator.choice(NAMES)) 
+            for _ in range(count)]
+
+
+def create_random_config(random_generator: random.Random) -> AnalysisConfig:
+    file_encodings = {pattern: f"encoding-{index}" 
+                      for index, pattern in enumerate(create_random_patterns(random_generator, 4))}
+    specific_checks = {pattern: {} for pattern in create_random_patterns(random_generator, 4)}
+    return AnalysisConfig(create_random_patterns(random_generator, 3), create_random_patterns(random_generator, 4), 
+                          file_encodings, {}, specific_checks)
+
+
+def create_random_path(random_generator: random.Random) -> str:
+    relative_path = "/".join(random_generator.choices(NAMES, k=random_generator.randint(1, 5)))
+    # the analysis matches the absolute paths of the files
+    return random_generator.choice(["", "/repository/", "C:/repository/"]) + relative_path
+
+
+@pytest.mark.parametrize("seed", range(20))
+def test_random_paths_match_like_every_pattern_on_its_own(seed: int):
+    random_generator = random.Random(seed)
+    for _ in range(50):
+        analysis_config = create_random_config(random_generator)
+        path_matcher = PathMatcher(analysis_config)
+        for _ in range(40):
+            file_path = create_random_path(random_generator)
+            assert path_matcher.match(file_path) == match_rule_by_rule(analysis_config, file_path), \
+                (vars(analysis_config), file_path)
+
+
+@pytest.mark.parametrize("seed", range(20))
+def test_files_in_ignored_directories_are_ignored(seed: int):
+    random_generator = random.Random(seed)
+    for _ in range(50):
+        analysis_config = create_random_config(random_generator)
+        path_matcher = PathMatcher(analysis_config)
+        for _ in range(40):
+            file_path = create_random_path(random_generator)
+            directory = file_path.rpartition("/")[0]
+            if directory and path_matcher.is_directory_ignored(directory):
+                assert match_rule_by_rule(analysis_config, file_path).is_ignored, (vars(analysis_config), file_path)
+
+
+def test_first_matching_encoding_is_used():
+    analysis_config = AnalysisConfig([], [], {"*.sql": "latin-1", "**/legacy/*": "cp1252", "/x.sql": "utf-16"}, {}, 
+                                     {})
+    assert PathMatcher(analysis_config).match("src/legacy/x.sql").file_encoding == "latin-1"
+    assert PathMatcher(analysis_config).match("src/legacy/x.txt").file_encoding == "cp1252"
@@ -0,0 +1,33 @@
+from checks.regex_check import RegexCheck
+from models.changed_line import ChangedLine
+from models.changed_lines_buffer import ChangedLinesBuffer
+
+
+def create_regex_check(*patterns: str) -> RegexCheck:
+    regex_check = RegexCheck()
+    regex_check.parse_config({"patterns": [{"name": f"pattern{index}", "pattern": pattern, "message": pattern} 
+                                           for index, pattern in enumerate(patterns)]})
+    return regex_check
+
+
+def find_line_numbers_per_pattern(regex_check: RegexCheck, buffer: ChangedLinesBuffer) -> list[list[int]]:
+    return [[issue.line_number for issue in issues] for issues in regex_check.find_issues_per_pattern(buffer)]
+
+
+def test_match_does_not_continue_in_the_next_changed_line():
+    # the lines 3 and 90 are next to each other in the buffer, but not in the file
+    buffer = ChangedLinesBuffer([ChangedLine(3, "x = debug\n"), ChangedLine(90, "print(1)\n")])
+    assert create_regex_check(r"debug\s+print").check_buffer(buffer) == []
+    assert find_line_numbers_per_pattern(create_regex_check(r"debug$", r"debug\s+print"), buffer) == [[3], []]
+
+
+def test_match_which_runs_into_the_next_line_is_matched_again_within_its_line():
+    # the greedy match continues to the '2' of the second line, the match within the first line ends at the '1'
+    buffer = ChangedLinesBuffer([ChangedLine(1, "a = 1\n"), ChangedLine(2, "b = 2\n")])
+    assert find_line_numbers_per_pattern(create_regex_check(r"a[^#]*[0-9b]"), buffer) == [[1]]
+    assert find_line_numbers_per_pattern(create_regex_check(r"x", r"a[^#]*[0-9b]"), buffer) == [[], [1]]
+
+
+def test_matches_within_a_line_are_reported_once_per_line():
+    buffer = ChangedLinesBuffer([ChangedLine(1, "debug print debug print\n"), ChangedLine(5, "debug  print\n")])
+    assert find_line_numbers_per_pattern(create_regex_check(r"debug\s+print", r"print"), buffer) == [[1, 5], [1, 5]]
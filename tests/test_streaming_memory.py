@@ -0,0 +1,58 @@
+import os
+import subprocess
+import tracemalloc
+
+import pytest
+
+from analysis import Analysis
+from config_parser import ConfigParser
+from git_assistant import GitAssistant
+from logger import Logger
+from models.analysis_arguments import AnalysisArguments
+
+CONFIG_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "analysis_config.json5")
+MAX_PEAK_IN_BYTES = 1024 * 1024
+
+
+def create_repository(directory: str, file_count: int):
+    for file_index in range(file_count):
+        file_path = os.path.join(directory, f"module_{file_index // 50}", f"file_{file_index}.py")
+        os.makedirs(os.path.dirname(file_path), exist_ok=True)
+        with open(file_path, "w", encoding="utf-8") as file:
+            file.writelines(f"\tvalue_{line_index} = compute({file_index})   \n" for line_index in range(20))
+    git = ["git", "-C", directory, "-c", "user.name=test", "-c", "user.email=test@localhost"]
+    subprocess.run(git + ["init", "-q", "-b", "master"], check=True)
+    subprocess.run(git + ["add", "-A"], check=True)
+    subprocess.run(git + ["commit", "-q", "-m", "files"], check=True)
+
+
+def get_streaming_peak(repository_directory: str, read_only: bool) -> int:
+    # the result cache keeps a bounded number of results in memory, which a few hundred files would not exceed
+    analysis_arguments = AnalysisArguments(repository_directory, "master", "master", False, read_only=read_only, 
+                                           fetch=False, config_path=CONFIG_PATH, use_cache=False)
+    analysis = Analysis(Logger(False), ConfigParser(), GitAssistant(repository_directory))
+    tracemalloc.start()
+    try:
+        # every result is dropped right away, like the jsonl output does
+        assert sum(1 for _ in analysis.execute_streaming(analysis_arguments)) > 0
+        return tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+
+
+@pytest.mark.parametrize("read_only", [False, True])
+def test_streaming_peak_does_not_grow_with_the_number_of_files(tmp_path, read_only):
+    small_repository = tmp_path / "small"
+    large_repository = tmp_path / "large"
+    small_repository.mkdir()
+    large_repository.mkdir()
+    create_repository(str(small_repository), 100)
+    create_repository(str(large_repository), 400)
+    # the first analysis pays for imports and caches, which would distort the peak
+    get_streaming_peak(str(small_repository), read_only)
+    
+    small_peak = get_streaming_peak(str(small_repository), read_only)
+    large_peak = get_streaming_peak(str(large_repository), read_only)
+    assert large_peak < MAX_PEAK_IN_BYTES
+    # four times the files, but a peak which grows with them would be four times as high
+    assert large_peak < 2 * small_peak
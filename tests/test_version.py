@@ -0,0 +1,13 @@
+import version
+
+
+def test_cache_version_changes_with_the_sources(tmp_path, monkeypatch):
+    source_path = tmp_path / "check.py"
+    source_path.write_text("ISSUE = 'tab'\n")
+    monkeypatch.setattr(version, "__file__", str(tmp_path / "version.py"))
+    monkeypatch.setattr(version, "_cache_version", None)
+    first_version = version.get_cache_version()
+    assert version.get_cache_version() == first_version
+    source_path.write_text("ISSUE = 'tabs'\n")
+    monkeypatch.setattr(version, "_cache_version", None)
+    assert version.get_cache_version() != first_version